@@ -1,10 +1,11 @@
 # flake8: noqa
 from ado_wrapper.client import AdoClient
-from ado_wrapper.utils import Secret
+from ado_wrapper.lazy_resources import LazyResource, materialise
+from ado_wrapper.utils import Secret, ResourceFieldsInfo, get_resource_fields_info
 from ado_wrapper.resources import *
 
 __all__ = [
-    "AdoClient", "Secret",
+    "AdoClient", "Secret", "ResourceFieldsInfo", "get_resource_fields_info", "LazyResource", "materialise",
     "AgentPool", "AnnotatedTag", "Artifact", "AuditLog", "Branch", "BuildTimeline", "Build", "BuildDefinition", "Commit",
     "Environment", "PipelineAuthorisation", "Group", "HierarchyCreatedBuildDefinition", "MergeBranchPolicy", "MergePolicies",
     "MergePolicyDefaultReviewer", "MergeTypeRestrictionPolicy", "Organisation", "Permission", "PersonalAccessToken", "Project",
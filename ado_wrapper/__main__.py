@@ -34,6 +34,9 @@ def main() -> None:  # pylint: disable=too-many-branches, too-many-statements
     parser.add_argument(
         "--purge-state", "--wipe-state-", help="Deletes everything in the state file", action="store_true", default=False, dest="purge_state"  # fmt: skip
     )
+    parser.add_argument(
+        "--run-id", help="Only delete resources created by this run id (used with the delete options)", type=str, default=None, dest="run_id"  # fmt: skip
+    )
     parser.add_argument("--state-file", help="The name of the state file to use", type=str, default="main.state", dest="state_file")
     args = parser.parse_args()
 
@@ -55,13 +58,13 @@ def main() -> None:  # pylint: disable=too-many-branches, too-many-statements
     if args.delete_everything:
         # Deletes ADO resources and entries in the state file
         print("[ADO_WRAPPER] Deleting every resource in state and the real ADO resources")
-        ado_client.state_manager.delete_all_resources()
+        ado_client.state_manager.delete_all_resources(run_id=args.run_id)
         print("[ADO_WRAPPER] Finishing deleting resources in state")
 
     if args.delete_resource_type is not None:
         # Deletes ADO resources and entries in the state file of a specific type
         resource_type: ResourceType = args.delete_resource_type
-        ado_client.state_manager.delete_all_resources(resource_type_filter=resource_type)
+        ado_client.state_manager.delete_all_resources(resource_type_filter=resource_type, run_id=args.run_id)
         print(f"[ADO_WRAPPER] Successfully deleted every resource of type {resource_type} in state")
 
     if args.refresh_internal_state:
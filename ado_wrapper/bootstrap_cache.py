@@ -0,0 +1,54 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any
+
+from ado_wrapper.state_backends import file_lock
+
+
+class BootstrapCache:
+    """An on-disk cache of what the AdoClient looks up about its project and PAT (the project id, pipeline settings and the PAT's user),
+    shared between processes, so short lived scripts don't need to fetch them every time they start.
+    Entries are keyed by org, project and a hash of the PAT (the PAT itself is never stored), and expire after `ttl_seconds`."""
+
+    def __init__(self, file_name: str, ttl_seconds: float = 24 * 60 * 60) -> None:
+        self.file_name = file_name
+        self.lock_file_name = f"{file_name}.lock"
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def get_key(ado_org_name: str, ado_project_name: str, ado_pat: str) -> str:
+        return f"{ado_org_name}/{ado_project_name}/{hashlib.sha256(ado_pat.encode()).hexdigest()}"
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.file_name, encoding="utf-8") as cache_file:
+                return json.load(cache_file)  # type: ignore[no-any-return]
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _is_expired(self, entry: dict[str, Any]) -> bool:
+        return time.time() - entry["fetched_at"] >= self.ttl_seconds
+
+    def get(self, key: str, value_name: str) -> Any | None:
+        """Returns the cached value, or None if there isn't one or it has expired."""
+        entry = self._load().get(key, {}).get(value_name)
+        if entry is None or self._is_expired(entry):
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value_name: str, value: Any) -> None:
+        """Merges the value into the latest version of the file (dropping expired values), then writes it atomically."""
+        with file_lock(self.lock_file_name):
+            data = self._load()
+            data.setdefault(key, {})[value_name] = {"value": value, "fetched_at": time.time()}
+            data = {
+                entry_key: {name: entry for name, entry in entries.items() if not self._is_expired(entry)}
+                for entry_key, entries in data.items()
+            }
+            temporary_file_name = f"{self.file_name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary_file_name, "w", encoding="utf-8") as cache_file:
+                json.dump({entry_key: entries for entry_key, entries in data.items() if entries}, cache_file, indent=4)
+            os.replace(temporary_file_name, self.file_name)
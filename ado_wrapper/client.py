@@ -1,11 +1,20 @@
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from typing import TYPE_CHECKING, Any, Callable, Generator
 
 from requests.auth import HTTPBasicAuth
 
+from ado_wrapper.bootstrap_cache import BootstrapCache
+from ado_wrapper.collection_cache import CollectionCache
 from ado_wrapper.state_manager import StateManager
-from ado_wrapper.logging_session import LoggingSession
-from ado_wrapper.errors import AuthenticationError, InvalidPermissionsError
+from ado_wrapper.logging_session import LoggingSession, PoolSettings, ResponseCache, RetryPolicy
+from ado_wrapper.errors import AuthenticationError, ConfigurationError, InvalidPermissionsError, ResourceNotFound
+
+if TYPE_CHECKING:
+    from ado_wrapper.resources.users import AdoUser
+
+
+PROJECT_BOOTSTRAP_VALUE_NAMES = ("ado_project_id", "ado_project_pipeline_settings")
 
 
 class AdoClient:
@@ -13,14 +22,29 @@ class AdoClient:
         self, ado_email: str, ado_pat: str, ado_org_name: str, ado_project_name: str,
         state_file_name: str | None = "main.state", suppress_warnings: bool = False,
         latest_log_count: int | None = None, log_directory: str = "ado_wrapper_logs",
-        run_polling_interval_seconds: int = 30, bypass_initialisation: bool = False,  # fmt: skip
+        run_polling_interval_seconds: int = 30, bypass_initialisation: bool = False,
+        pool_settings: PoolSettings | None = None, retry_policy: RetryPolicy | None = None, cache_responses: bool = False,
+        collection_cache_ttl_seconds: float = 0.0, bootstrap_cache_file_name: str | None = None,
+        bootstrap_cache_ttl_seconds: float = 24 * 60 * 60, state_flush_every_n_mutations: int | None = None,
+        state_flush_interval_seconds: float | None = 1.0,  # fmt: skip
     ) -> None:
         """Takes an email, PAT, org, project, and state file name. The state file name is optional, and if not provided,
         state will be stored in "main.state" (can be disabled using `None`)\n
         latest_log_count will set the amount of previous logs to use, set to None to not store logs, or -1 to store infinite.\n
         log_directory is where the logs will end up, and defaults to the current directory.\n
         Run polling interval is how often a run will be checked when using run_and_wait_until_complete and it's sibling functions.\n
-        Bypass initialisation means the client won't fetch certain info on startup and therefor some functions won't work."""
+        The project's id, the project's pipeline settings and the PAT's user are fetched the first time they're used,
+        bypass initialisation means they're never fetched (apart from the project's, after `assume_project()`), so some functions won't work.\n
+        Pool settings tune the connection pool used for each ADO host, useful when making lots of requests from many threads.\n
+        Retry policy decides how 429s, 5xxs and connection errors are retried, and optionally throttles requests per second.\n
+        Cache responses sends conditional GETs (using ETags/Last-Modified), reusing the previous body when nothing has changed,
+        the hit and miss counts are stored in `ado_client.response_cache`.\n
+        Collection cache ttl is how long `get_by_name()` style lookups reuse the last `get_all()` of that resource,
+        0 (the default) disables it, as lookups can then return resources which changed outside of this client.
+        Creating, updating or deleting a resource through this client clears its cached collection.\n
+        Bootstrap cache file name is where the project id, pipeline settings and PAT's user are cached between processes
+        (keyed by org, project and a hash of the PAT), for `bootstrap_cache_ttl_seconds`, None (the default) disables it.\n
+        State flush every n mutations/interval seconds control how often changes to state are written, see StateManager."""
 
         self.ado_email = ado_email
         self.ado_pat = ado_pat
@@ -29,42 +53,103 @@ class AdoClient:
         # self.perms = None
 
         self.suppress_warnings = suppress_warnings
+        self.bypass_initialisation = bypass_initialisation
+        self._has_assumed_project = False  # assume_project() always made the project's values available, even when bypassing
         self.run_polling_interval_seconds = run_polling_interval_seconds
         self.has_elevate_privileges = False
+        self._lazy_resources_local = threading.local()  # lazy_resources() only applies to the thread which entered it
 
-        self.session = LoggingSession(latest_log_count, log_directory)
+        self.response_cache = ResponseCache() if cache_responses else None
+        self.collection_cache = CollectionCache(collection_cache_ttl_seconds)
+        self.session = LoggingSession(latest_log_count, log_directory, pool_settings, retry_policy, self.response_cache)
         self.session.auth = HTTPBasicAuth(ado_email, ado_pat)
+        self.metrics = self.session.metrics  # Use .snapshot() or .to_prometheus() to see which endpoints are slowest
 
-        self.state_manager = StateManager(self, state_file_name)
-
-        if not bypass_initialisation:
-            from ado_wrapper.resources.users import AdoUser  # Stop circular imports
-
-            self.assume_project(ado_project_name)
-
-            if ado_email != "" and ado_email is not None:
-                try:
-                    self.pat_author: AdoUser = AdoUser.get_by_email(self, ado_email)
-                except (ValueError, InvalidPermissionsError):
-                    if not suppress_warnings:
-                        print(
-                            f"[ADO_WRAPPER] WARNING: User {ado_email} not found in ADO, nothing critical, but stops releases from being made and PullRequest.set_my_pull_requests_included_teams()"
-                        )
+        self.bootstrap_cache = BootstrapCache(bootstrap_cache_file_name, bootstrap_cache_ttl_seconds) if bootstrap_cache_file_name else None
+        self._bootstrap_values: dict[str, Any] = {}  # Values which have been fetched (or loaded from the bootstrap cache)
+        self._bootstrap_lock = threading.RLock()  # Re-entrant, as fetching the pipeline settings needs the project id
 
-            # self.perms = Permission.get_project_perms(self)
+        self.state_manager = StateManager(self, state_file_name, state_flush_every_n_mutations, state_flush_interval_seconds)
 
     def assume_project(self, project_name: str) -> None:
         """Assumes a different project, meaning that subsequent function calls will use that project.
-        As Personal Access Tokens are per organisation, not per project, this will work automatically."""
-        from ado_wrapper.resources.projects import Project
-
-        self.ado_project_name = project_name
+        As Personal Access Tokens are per organisation, not per project, this will work automatically.
+        The project's id and pipeline settings are then fetched when they're next used, even when bypassing initialisation."""
+        with self._bootstrap_lock:
+            self.ado_project_name = project_name
+            self._has_assumed_project = True
+            for value_name in PROJECT_BOOTSTRAP_VALUE_NAMES:  # The PAT's user is per organisation, so it's kept
+                self._bootstrap_values.pop(value_name, None)  # The new project's values are fetched when they're next used
+
+    def _get_bootstrap_value(self, value_name: str, fetch: Callable[[], Any], resource_class: Any = None) -> Any:
+        """Returns the value, fetching it (or loading it from the bootstrap cache) the first time it's used.
+        Resources are stored in the bootstrap cache using their `to_json()`."""
+        with self._bootstrap_lock:
+            if value_name in self._bootstrap_values:
+                return self._bootstrap_values[value_name]
+            cache_key = BootstrapCache.get_key(self.ado_org_name, self.ado_project_name, self.ado_pat)
+            cached_value = self.bootstrap_cache.get(cache_key, value_name) if self.bootstrap_cache is not None else None
+            if cached_value is not None:
+                value = resource_class.from_json(cached_value) if resource_class is not None else cached_value
+            else:
+                value = fetch()
+                if self.bootstrap_cache is not None:
+                    try:
+                        self.bootstrap_cache.set(cache_key, value_name, value.to_json() if resource_class is not None else value)
+                    except OSError as e:
+                        if not self.suppress_warnings:
+                            print(f"[ADO_WRAPPER] WARNING: Could not write to the bootstrap cache ({self.bootstrap_cache.file_name}): {e}")
+            self._bootstrap_values[value_name] = value
+            return value
+
+    @property
+    def ado_project_id(self) -> str:
+        """The current project's id, fetched the first time it's used, or "" when bypassing initialisation (until `assume_project()`)."""
+        if self.bypass_initialisation and not self._has_assumed_project:
+            return ""
+        return self._get_bootstrap_value("ado_project_id", self._fetch_ado_project_id)  # type: ignore[no-any-return]
+
+    def _fetch_ado_project_id(self) -> str:
+        from ado_wrapper.resources.projects import Project  # Stop circular imports
 
         try:
-            self.ado_project_id = Project.get_by_name(self, self.ado_project_name).project_id  # type: ignore[union-attr]
+            project = Project.get_by_name(self, self.ado_project_name)
         except InvalidPermissionsError as e:  # Verify Token is working (helps with setup for first time users):
             raise AuthenticationError("Failed to authenticate with ADO: Most likely incorrect token or expired token!") from e
-        self.ado_project_pipeline_settings = Project.get_pipeline_settings(self, self.ado_project_name)
+        if project is None:
+            raise ResourceNotFound(f"Project {self.ado_project_name} not found in {self.ado_org_name}!")
+        return project.project_id
+
+    @property
+    def ado_project_pipeline_settings(self) -> dict[str, dict[str, bool]]:
+        """The current project's pipeline settings, fetched the first time they're used."""
+        from ado_wrapper.resources.projects import Project  # Stop circular imports
+
+        if self.bypass_initialisation and not self._has_assumed_project:
+            raise ConfigurationError("The client has not been initialised. Please disable `bypass_initialisation` in AdoClient.")
+        return self._get_bootstrap_value(  # type: ignore[no-any-return]
+            "ado_project_pipeline_settings", lambda: Project.get_pipeline_settings(self, self.ado_project_name)
+        )
+
+    @property
+    def pat_author(self) -> "AdoUser":
+        """The user who owns the PAT (found using `ado_email`), fetched the first time it's used."""
+        from ado_wrapper.resources.users import AdoUser  # Stop circular imports
+
+        if self.bypass_initialisation:
+            raise ConfigurationError("The client has not been initialised. Please disable `bypass_initialisation` in AdoClient.")
+        return self._get_bootstrap_value("pat_author", self._fetch_pat_author, AdoUser)  # type: ignore[no-any-return]
+
+    def _fetch_pat_author(self) -> "AdoUser":
+        from ado_wrapper.resources.users import AdoUser  # Stop circular imports
+
+        try:
+            return AdoUser.get_by_email(self, self.ado_email)
+        except (ValueError, InvalidPermissionsError) as e:
+            raise ConfigurationError(
+                f"User {self.ado_email} not found in ADO, which is needed to make releases and "
+                "for PullRequest.set_my_pull_requests_included_teams()"
+            ) from e
 
     @contextmanager
     def temporary_polling_interval(self, temporary_polling_interval: int) -> Generator[None, None, None]:
@@ -73,6 +158,34 @@ class AdoClient:
         yield  # Yield (required)
         self.run_polling_interval_seconds = old_polling_interval_in_seconds  # Restore old functionality
 
+    @contextmanager
+    def request_scope(self) -> Generator[None, None, None]:
+        """Any identical GET requests made inside this block are only sent once, useful for functions which
+        fetch the same data multiple times, e.g. a build's timeline, or every user."""
+        with self.session.request_scope():
+            yield  # Yield (required)
+
+    @property
+    def use_lazy_resources(self) -> bool:
+        """Whether listed resources are returned as LazyResources in this thread, see `lazy_resources()`."""
+        return getattr(self._lazy_resources_local, "use_lazy_resources", False)
+
+    @use_lazy_resources.setter
+    def use_lazy_resources(self, use_lazy_resources: bool) -> None:
+        self._lazy_resources_local.use_lazy_resources = use_lazy_resources
+
+    @contextmanager
+    def lazy_resources(self) -> Generator[None, None, None]:
+        """Resources listed inside this block (e.g. `Build.get_all()`) are LazyResources, which only decode the fields you use,
+        useful when fetching thousands of resources to read one or two attributes. See `ado_wrapper.lazy_resources`.
+        This only applies to the current thread (and the thread pools ado_wrapper starts from it), not other threads using this client."""
+        old_use_lazy_resources = self.use_lazy_resources
+        self.use_lazy_resources = True
+        try:
+            yield  # Yield (required)
+        finally:
+            self.use_lazy_resources = old_use_lazy_resources
+
     @contextmanager
     def elevated_privileges(self) -> Generator[None, None, None]:
         self.has_elevate_privileges = True
@@ -0,0 +1,68 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+
+
+@dataclass
+class CachedCollection:
+    resources: list[Any]
+    fetched_at: float
+    indexes: dict[str, dict[Hashable, Any]] = field(default_factory=dict)
+
+
+class CollectionCache:
+    """A per-client cache of each resource type's whole collection (from `get_all()`), used by `get_by_name()` style lookups.
+    Lookups by an attribute (e.g. name, email or origin_id) use an index which is built once per fetch, rather than searching every time.
+    Collections are re-fetched after `ttl_seconds`, and are dropped whenever a resource of that type is created,
+    updated or deleted through the client. A ttl of 0 disables caching."""
+
+    def __init__(self, ttl_seconds: float = 60.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.collections: dict[tuple[type, str, str], CachedCollection] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get_collection(self, key: tuple[type, str, str], fetch: Callable[[], list[Any]]) -> CachedCollection:
+        """Returns the cached collection for (resource class, org, project), calling `fetch` if there isn't one or it has expired."""
+        with self.lock:
+            collection = self.collections.get(key)
+            if collection is not None and time.monotonic() - collection.fetched_at < self.ttl_seconds:
+                self.hits += 1
+                return collection
+            self.misses += 1
+        collection = CachedCollection(list(fetch()), time.monotonic())  # Not fetched inside the lock, so other types aren't blocked
+        with self.lock:
+            self.collections[key] = collection
+        return collection
+
+    def peek(self, key: tuple[type, str, str]) -> CachedCollection | None:
+        """Returns the cached collection if there's one which hasn't expired, without ever fetching it."""
+        with self.lock:
+            collection = self.collections.get(key)
+            if collection is None or time.monotonic() - collection.fetched_at >= self.ttl_seconds:
+                return None
+            self.hits += 1
+            return collection
+
+    def get_index(self, collection: CachedCollection, attribute_name: str) -> dict[Hashable, Any]:
+        """Returns {attribute value: resource} for the collection, where the first resource with each value wins (like a linear search)."""
+        with self.lock:
+            index = collection.indexes.get(attribute_name)
+            if index is None:
+                index = collection.indexes[attribute_name] = {}
+                for resource in collection.resources:
+                    index.setdefault(getattr(resource, attribute_name), resource)
+            return index
+
+    def invalidate(self, resource_class: type | None = None) -> None:
+        """Drops the cached collections for a resource class (and its parent/child classes), or every collection if it's None."""
+        with self.lock:
+            for key in list(self.collections):
+                if resource_class is None or issubclass(key[0], resource_class) or issubclass(resource_class, key[0]):
+                    del self.collections[key]
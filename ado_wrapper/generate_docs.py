@@ -5,6 +5,7 @@ if __name__ == "__main__":
     __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
 
 from ado_wrapper.resources import *  # pylint: disable=W0401,W0614  # noqa: F401,F403
+from ado_wrapper.utils import get_resource_fields_info
 
 # TODO: Do replacements, e.g. branchs -> branches
 
@@ -58,7 +59,9 @@ def format_return_type(return_type_input: str) -> str:
 
 
 def dataclass_attributes(cls) -> list[str]:  # type: ignore[no-untyped-def]
-    return [x for x in dir(cls) if x in cls.__dataclass_fields__.keys()]
+    if not hasattr(cls, "__dataclass_fields__"):
+        return []
+    return list(get_resource_fields_info(cls).field_names)
 
 
 sorted_pairs = dict(sorted({string: value for string, value in globals().items() if string[0].isupper()}.items()))
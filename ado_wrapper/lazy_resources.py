@@ -0,0 +1,80 @@
+import copy
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from ado_wrapper.state_managed_abc import StateManagedResource
+
+T = TypeVar("T", bound="StateManagedResource")
+
+# How to decode one field from a resource's request payload, without decoding the rest, keyed by field name
+LazyFieldDecoders = dict[str, Callable[[dict[str, Any]], Any]]
+
+
+class LazyResource(Generic[T]):
+    """Returned instead of resources when listing inside of `with ado_client.lazy_resources():`
+    Keeps hold of the raw request payload, and only decodes a field when it's first accessed (then caches it).
+    Fields in the class's `lazy_field_decoders` are decoded on their own, anything else (other fields, methods, `to_json()`,
+    writing to state, setting attributes...) decodes the whole resource with `from_request_payload`, once.\n
+    `isinstance(lazy_build, Build)` still works, use `materialise()` to get the real resource."""
+
+    __slots__ = ("_resource_class", "_payload", "_decoded", "_resource")
+
+    def __init__(self, resource_class: type[T], payload: dict[str, Any]) -> None:
+        object.__setattr__(self, "_resource_class", resource_class)
+        object.__setattr__(self, "_payload", payload)
+        object.__setattr__(self, "_decoded", {})
+        object.__setattr__(self, "_resource", None)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[T]:  # type: ignore[override]  # So isinstance() and resource.__class__ see the real class
+        return self._resource_class
+
+    def _materialise(self) -> T:
+        if self._resource is None:
+            resource = self._resource_class.from_request_payload(self._payload)
+            for field_name, value in self._decoded.items():  # Keep any fields which have already been handed out
+                object.__setattr__(resource, field_name, value)
+            object.__setattr__(self, "_resource", resource)
+            object.__setattr__(self, "_payload", None)  # No longer needed
+        return self._resource  # type: ignore[return-value]
+
+    def __getattr__(self, name: str) -> Any:
+        if self._resource is not None:
+            return getattr(self._resource, name)
+        if name in self._decoded:
+            return self._decoded[name]
+        decoder = self._resource_class.lazy_field_decoders.get(name)
+        if decoder is None:
+            return getattr(self._materialise(), name)
+        value = self._decoded[name] = decoder(self._payload)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._materialise(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(self._materialise())
+
+    def __eq__(self, other: object) -> bool:
+        return self._materialise() == materialise(other)  # type: ignore[arg-type]
+
+    __hash__ = None  # type: ignore[assignment]  # Resources are mutable dataclasses (with eq=True), so they aren't hashable either
+
+    def __dir__(self) -> list[str]:
+        return dir(self._resource_class)
+
+    def __copy__(self) -> T:
+        return copy.copy(self._materialise())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> T:
+        return copy.deepcopy(self._materialise(), memo)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return materialise, (self._materialise(),)
+
+
+def materialise(resource: T | LazyResource[T]) -> T:
+    """Returns the fully decoded resource, for either a LazyResource or a normal resource (which is returned as is)."""
+    if type(resource) is LazyResource:  # pylint: disable=unidiomatic-typecheck  # isinstance() would see the resource's class
+        return resource._materialise()  # pylint: disable=protected-access
+    return resource  # type: ignore[return-value]
@@ -1,60 +1,462 @@
+import atexit
+import gzip
+import json
 import os
+import queue
+import random
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Generator
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ado_wrapper.metrics import RequestMetrics
 
 DEFAULT_KWARGS = {
     "allow_redirects": True,
     "data": None,
 }
 
+ID_SEGMENT_RE_PATTERN = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{40}|(aad|vssgp|svc|msa)\.[\w-]+)$"
+)  # Numbers, UUIDs, commit ids and descriptors
+
+ADO_HOSTS = [
+    "dev.azure.com", "vssps.dev.azure.com", "vsrm.dev.azure.com", "auditservice.dev.azure.com",
+    "almsearch.dev.azure.com", "azdevopscommerce.dev.azure.com",
+]  # fmt: skip
+
+
+def get_route_template(url: str) -> str:
+    """Converts a url into its route, without the org/project or any ids, e.g. `/_apis/build/builds/{id}/timeline`"""
+    path = urlsplit(url).path
+    if "/_apis/" in path:
+        path = "/_apis/" + path.split("/_apis/", maxsplit=1)[1]
+    return "/".join("{id}" if ID_SEGMENT_RE_PATTERN.match(segment) else segment for segment in path.split("/"))
+
+
+@dataclass
+class PoolSettings:
+    """Connection pool settings, every ADO host family gets its own adapter with these values.\n
+    pool_maxsize is how many connections are kept open per host, raise this when calling from many threads.\n
+    pool_block means threads wait for a free connection instead of opening (and then throwing away) a new one."""
+
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+    pool_block: bool = False
+    keep_alive: bool = True
+
+
+@dataclass
+class RetryPolicy:
+    """How failed or throttled requests get retried.\n
+    Idempotent methods are retried on connection errors and `retry_status_codes`, 429s are retried for every method,
+    since ADO didn't process them. Waits use jittered exponential backoff, unless ADO sends a `Retry-After`.\n
+    Setting requests_per_second enables a token bucket, which slows down further whenever ADO reports we're close to
+    (or over) our TSTU budget, and recovers back to requests_per_second once it stops."""
+
+    max_retries: int = 3
+    backoff_factor_seconds: float = 0.5
+    max_backoff_seconds: float = 60.0
+    retry_status_codes: tuple[int, ...] = (429, 500, 502, 503, 504)
+    idempotent_methods: tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    requests_per_second: float | None = None
+    burst_size: int = 10
+    remaining_budget_threshold: float = 0.1  # Start slowing down when less than 10% of X-RateLimit-Limit remains
+
+    def should_retry(self, method: str, status_code: int | None, attempt: int) -> bool:
+        """A status code of None means the connection failed."""
+        if attempt >= self.max_retries:
+            return False
+        if status_code == 429:
+            return True
+        if status_code is not None and status_code not in self.retry_status_codes:
+            return False
+        return method.upper() in self.idempotent_methods
+
+    def get_backoff_seconds(self, attempt: int, retry_after: float | None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff_seconds)
+        return random.uniform(0, min(self.max_backoff_seconds, self.backoff_factor_seconds * 2**attempt))  # nosec B311
+
+
+@dataclass
+class TokenBucket:
+    """A thread safe token bucket, the rate gets halved when ADO delays us, and creeps back up when it doesn't."""
+
+    max_rate: float
+    capacity: int
+    rate: float = field(init=False)
+    tokens: float = field(init=False)
+    last_refill: float = field(init=False, default_factory=time.monotonic)
+    lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        self.rate = self.max_rate
+        self.tokens = self.capacity
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1  # Reserve our token, even if it goes negative, the next caller waits longer
+            wait_seconds = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_seconds:
+            time.sleep(wait_seconds)
+
+    def slow_down(self) -> None:
+        with self.lock:
+            self.rate = max(self.max_rate / 32, self.rate / 2)
+
+    def speed_up(self) -> None:
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+@dataclass
+class CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    content: bytes
+    headers: dict[str, str]
+    encoding: str | None
+
+
+class ResponseCache:
+    """An opt-in cache for GET requests, which stores the ETag/Last-Modified of each url and sends conditional requests.
+    When ADO replies with a 304, the cached body gets served instead, as if it was a normal 200."""
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(url: str, params: Any = None) -> str:
+        """The fully prepared url, so the same url with different `params=` gets its own entry."""
+        prepared_request = requests.PreparedRequest()
+        prepared_request.prepare_url(url, params)
+        return prepared_request.url  # type: ignore[return-value]
+
+    def get_entry(self, key: str) -> CachedResponse | None:
+        with self.lock:
+            return self.entries.get(key)
+
+    @staticmethod
+    def get_conditional_headers(entry: CachedResponse | None) -> dict[str, str]:
+        if entry is None:
+            return {}
+        headers = {"If-None-Match": entry.etag} if entry.etag else {}
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key: str, entry: CachedResponse) -> None:
+        """Must be called while holding the lock."""
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)  # Remove the least recently used
+
+    def handle_response(self, key: str, entry: CachedResponse | None, response: requests.Response) -> requests.Response:
+        """Returns a rebuilt response for 304s, and stores any cacheable 200s.
+
+        `entry` is the one the conditional headers were built from, so a 304 can still be served if another thread evicted it."""
+        with self.lock:
+            if response.status_code == 304 and entry is not None:
+                self.hits += 1
+                self.store(key, entry)
+                cached_response = requests.Response()
+                cached_response.status_code = 200
+                cached_response._content = entry.content  # pylint: disable=protected-access
+                cached_response.headers = CaseInsensitiveDict(entry.headers)
+                cached_response.encoding = entry.encoding
+                cached_response.url, cached_response.request = response.url, response.request
+                return cached_response
+            self.misses += 1
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            if response.status_code == 200 and (etag or last_modified):
+                self.store(key, CachedResponse(etag, last_modified, response.content, dict(response.headers), response.encoding))
+            return response
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+@dataclass
+class InFlightRequest:
+    future: "Future[requests.Response]" = field(default_factory=Future)
+
+
+LOG_FILE_NAME_RE_PATTERN = re.compile(r"^(?P<log_name>.+?)(\.\d{4})?\.(jsonl|jsonl\.gz|log)$")  # <log_name>[.<rotation>].jsonl[.gz]
+
+
+class RequestLogWriter(threading.Thread):
+    """Writes request logs (as JSONL) from a background thread, so requests never wait on disk.
+    Records are written in batches, and once the log reaches max_bytes, it gets gzipped and a new one is started.
+    The thread (and log file) are only started once the first record is written, and it stops when closed (or on exit)."""
+
+    def __init__(self, log_directory: str, log_name: str, latest_log_counter: int, max_bytes: int = 10_000_000,
+                 flush_interval_seconds: float = 1.0) -> None:  # fmt: skip
+        super().__init__(name="ado_wrapper-log-writer", daemon=True)
+        self.log_directory = log_directory
+        self.log_name = log_name
+        self.latest_log_counter = latest_log_counter
+        self.max_bytes = max_bytes
+        self.flush_interval_seconds = flush_interval_seconds
+        self.records: "queue.Queue[dict[str, Any] | None]" = queue.Queue()
+        self.rotation_count = 0
+        self.file_path = f"{self.log_directory}/{self.log_name}.jsonl"
+        self.start_lock = threading.Lock()
+
+    def write(self, record: dict[str, Any]) -> None:
+        if not self.is_alive():
+            with self.start_lock:
+                if self.ident is None:  # Never started
+                    os.makedirs(self.log_directory, exist_ok=True)
+                    self.start()
+                    atexit.register(self.close)
+        self.records.put_nowait(record)
+
+    def close(self) -> None:
+        """Flushes every remaining record, and stops the thread."""
+        atexit.unregister(self.close)
+        if self.is_alive():
+            self.records.put(None)
+            self.join()
+
+    def run(self) -> None:
+        self.cleanup_old_logs()
+        file = open(self.file_path, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+        try:
+            while True:
+                try:
+                    batch = [self.records.get(timeout=self.flush_interval_seconds)]
+                except queue.Empty:
+                    continue
+                while batch[-1] is not None and not self.records.empty() and len(batch) < 1000:
+                    batch.append(self.records.get_nowait())
+                file.writelines(json.dumps(record, default=str) + "\n" for record in batch if record is not None)
+                file.flush()
+                if batch[-1] is None:
+                    return
+                if file.tell() >= self.max_bytes:
+                    file.close()
+                    self.rotate()
+                    file = open(self.file_path, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+        finally:
+            file.close()
+
+    def rotate(self) -> None:
+        """Gzips the current log, the newest rotation has the highest number."""
+        self.rotation_count += 1
+        with open(self.file_path, "rb") as source, gzip.open(f"{self.log_directory}/{self.log_name}.{self.rotation_count:04d}.jsonl.gz", "wb") as target:  # fmt: skip
+            shutil.copyfileobj(source, target)
+        self.cleanup_old_logs()
+
+    def cleanup_old_logs(self) -> None:
+        """Deletes the logs of all but the newest `latest_log_counter` runs (including this one), -1 means keep every log.
+        A run's log and its gzipped rotations count as one, and this run's logs are never removed."""
+        if self.latest_log_counter == -1:  # -1 means infinite
+            return
+        logs_by_run: dict[str, list[str]] = {}
+        for file in os.listdir(self.log_directory):
+            match = LOG_FILE_NAME_RE_PATTERN.match(file)
+            logs_by_run.setdefault(match.group("log_name") if match else file, []).append(file)
+        logs_by_run.pop(self.log_name, None)  # Never remove the ones from this run
+        for log_name in sorted(logs_by_run, reverse=True)[max(self.latest_log_counter - 1, 0):]:  # Delete any run that's not the newest x
+            for file in logs_by_run[log_name]:
+                os.remove(f"{self.log_directory}/{file}")
+
 
 class LoggingSession(requests.Session):
-    def __init__(self, latest_log_counter: int | None, log_directory: str) -> None:
+    def __init__(
+        self, latest_log_counter: int | None, log_directory: str, pool_settings: PoolSettings | None = None,
+        retry_policy: RetryPolicy | None = None, response_cache: ResponseCache | None = None,  # fmt: skip
+    ) -> None:
         super().__init__()
         self.latest_log_counter = latest_log_counter
         self.log_directory = log_directory
         self.log_name = datetime.now().isoformat()
+        self.pool_settings = pool_settings or PoolSettings()
+        self.mount_adapters()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.token_bucket = (
+            TokenBucket(self.retry_policy.requests_per_second, self.retry_policy.burst_size)
+            if self.retry_policy.requests_per_second else None
+        )  # fmt: skip
+        self.paused_until = 0.0  # Monotonic time, set when ADO sends a Retry-After
+        self.response_cache = response_cache
+        self.metrics = RequestMetrics()
+        # Identical GETs which are sent at the same time share one request, the body is read by then (and never changes),
+        # and .json() parses it again for each caller, so no caller can change the result another one gets.
+        self.single_flight = True
+        self.in_flight: dict[str, InFlightRequest] = {}
+        self.in_flight_lock = threading.Lock()
+        self.local = threading.local()  # Holds the memo for the current thread's request_scope()
 
-        if latest_log_counter is not None and not os.path.isdir(self.log_directory):
-            os.makedirs(self.log_directory)
-
-        self.cleanup_old_logs()
+        self.log_writer: RequestLogWriter | None = None
+        if latest_log_counter is not None:  # The writer's thread only starts once the first request is logged
+            self.log_writer = RequestLogWriter(self.log_directory, self.log_name, latest_log_counter)
 
-        if latest_log_counter is not None:
-            with open(f"{self.log_directory}/{self.log_name}.log", "w", encoding="utf-8") as file:
-                file.write("")
+    def mount_adapters(self) -> None:
+        """Mounts a tuned HTTPAdapter for each ADO host, so each host keeps its own pool of warm connections."""
+        for host in ADO_HOSTS:
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_settings.pool_connections, pool_maxsize=self.pool_settings.pool_maxsize,
+                pool_block=self.pool_settings.pool_block,  # fmt: skip
+            )
+            self.mount(f"https://{host}/", adapter)
+        if not self.pool_settings.keep_alive:
+            self.headers["Connection"] = "close"
 
-    def log_request(self, method: str, url: str, kwargs: dict[str, Any], duration_in_milliseconds: int) -> None:
-        """Logs a request, but removes pre-defined kwargs to reduce spam."""
-        if self.latest_log_counter is None:
+    def log_request(self, method: str, url: str, kwargs: dict[str, Any], duration_in_milliseconds: float,
+                    status_code: int | None, response_bytes: int, retries: int) -> None:  # fmt: skip
+        """Records the request's metrics, and queues up a log record, but removes pre-defined kwargs to reduce spam."""
+        route = get_route_template(url)
+        self.metrics.record(method, route, status_code, duration_in_milliseconds, response_bytes, retries)
+        if self.log_writer is None:
             return
-        with open(f"{self.log_directory}/{self.log_name}.log", "a", encoding="utf-8") as file:
-            kwargs_copy = dict(kwargs.items())  # Copy
-            for default_kwarg, default_kwarg_value in DEFAULT_KWARGS.items():
-                # Can't set the default case to None since sometimes that's what we're looking for
-                if kwargs.get(default_kwarg, -1) == default_kwarg_value:
-                    del kwargs_copy[default_kwarg]
-            file.write(f"{method.ljust(len('DELETE'))} @ {url}{' | '+str(kwargs_copy) if kwargs_copy else ''} | {duration_in_milliseconds}\n")  # fmt: skip
-
-    def request(self, method: str, url: str, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> requests.Response:  # type: ignore[override]
-        # Proceed with the actual request
-        start_time = datetime.now()
-        response = super().request(method, url, *args, **kwargs)  # type: ignore[arg-type]
-        end_time = datetime.now()
-        duration_in_milliseconds = (end_time - start_time).microseconds // 1000
-        # Log the request using the log_request function
-        self.log_request(method, url, kwargs, duration_in_milliseconds)
+        kwargs_copy = dict(kwargs.items())  # Copy
+        for default_kwarg, default_kwarg_value in DEFAULT_KWARGS.items():
+            # Can't set the default case to None since sometimes that's what we're looking for
+            if kwargs.get(default_kwarg, -1) == default_kwarg_value:
+                del kwargs_copy[default_kwarg]
+        self.log_writer.write({
+            "timestamp": datetime.now().isoformat(), "method": method.upper(), "host": urlsplit(url).hostname,
+            "route": route, "url": url, "status": status_code, "bytes": response_bytes,
+            "duration_ms": round(duration_in_milliseconds, 3), "retries": retries, "kwargs": kwargs_copy or None,
+        })  # fmt: skip
+
+    def record_retried_attempt(self, method: str, url: str, status_code: int | None, duration_in_milliseconds: float) -> None:
+        """Records an attempt which is about to be retried, so throttling and errors still show up in the metrics,
+        the final attempt is recorded (and logged) by log_request()."""
+        self.metrics.record(method, get_route_template(url), status_code, duration_in_milliseconds, 0, 0)
+
+    def wait_for_rate_limit(self) -> None:
+        """Blocks until we're allowed to send another request, either from a Retry-After pause, or the token bucket."""
+        pause_seconds = self.paused_until - time.monotonic()
+        if pause_seconds > 0:
+            time.sleep(pause_seconds)
+        if self.token_bucket is not None:
+            self.token_bucket.acquire()
+
+    def handle_rate_limit_headers(self, response: requests.Response) -> float | None:
+        """Reads ADO's rate limit headers, pausing or slowing down future requests, returns the Retry-After (if any)."""
+        retry_after = response.headers.get("Retry-After")
+        retry_after_seconds = float(retry_after) if retry_after is not None and retry_after.replace(".", "", 1).isdigit() else None
+        if retry_after_seconds is not None:
+            self.paused_until = max(self.paused_until, time.monotonic() + retry_after_seconds)
+        if self.token_bucket is None:
+            return retry_after_seconds
+        remaining, limit = response.headers.get("X-RateLimit-Remaining"), response.headers.get("X-RateLimit-Limit")
+        close_to_limit = (
+            remaining is not None and limit is not None and float(limit) > 0
+            and float(remaining) / float(limit) < self.retry_policy.remaining_budget_threshold
+        )  # fmt: skip
+        if retry_after_seconds is not None or float(response.headers.get("X-RateLimit-Delay", 0)) > 0 or close_to_limit:
+            self.token_bucket.slow_down()
+        else:
+            self.token_bucket.speed_up()
+        return retry_after_seconds
+
+    def send_with_retries(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        attempt = 0
+        while True:
+            self.wait_for_rate_limit()
+            start_time = time.perf_counter()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except requests.exceptions.ConnectionError:
+                if not self.retry_policy.should_retry(method, None, attempt):
+                    self.log_request(method, url, kwargs, (time.perf_counter() - start_time) * 1000, None, 0, attempt)
+                    raise
+                self.record_retried_attempt(method, url, None, (time.perf_counter() - start_time) * 1000)
+                attempt += 1
+                time.sleep(self.retry_policy.get_backoff_seconds(attempt, None))
+                continue
+            duration_in_milliseconds = (time.perf_counter() - start_time) * 1000
+            retry_after_seconds = self.handle_rate_limit_headers(response)
+            if self.retry_policy.should_retry(method, response.status_code, attempt):
+                response.close()
+                self.record_retried_attempt(method, url, response.status_code, duration_in_milliseconds)
+                attempt += 1
+                time.sleep(self.retry_policy.get_backoff_seconds(attempt, retry_after_seconds))
+                continue
+            response_bytes = int(response.headers.get("Content-Length", 0)) if kwargs.get("stream") else len(response.content)
+            self.log_request(method, url, kwargs, duration_in_milliseconds, response.status_code, response_bytes, attempt)
+            return response
+
+    def send_get(self, url: str, **kwargs: Any) -> requests.Response:
+        if self.response_cache is None:
+            return self.send_with_retries("GET", url, **kwargs)
+        key = self.response_cache.get_key(url, kwargs.get("params"))
+        entry = self.response_cache.get_entry(key)  # Held onto for the whole request, in case it gets evicted meanwhile
+        conditional_headers = self.response_cache.get_conditional_headers(entry)
+        if conditional_headers:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}) | conditional_headers
+        return self.response_cache.handle_response(key, entry, self.send_with_retries("GET", url, **kwargs))
+
+    def send_single_flight_get(self, request_key: str, url: str, **kwargs: Any) -> requests.Response:
+        """If an identical GET is already in flight, wait for it and share its response, rather than sending our own."""
+        with self.in_flight_lock:
+            in_flight = self.in_flight.get(request_key)
+            is_leader = in_flight is None
+            if in_flight is None:
+                in_flight = self.in_flight[request_key] = InFlightRequest()
+        if not is_leader:
+            return in_flight.future.result()
+        try:
+            response = self.send_get(url, **kwargs)
+        except BaseException as exc:
+            with self.in_flight_lock:
+                del self.in_flight[request_key]
+            in_flight.future.set_exception(exc)
+            raise
+        with self.in_flight_lock:
+            del self.in_flight[request_key]
+        in_flight.future.set_result(response)
         return response
 
-    def cleanup_old_logs(self) -> None:
-        """Deletes old logs, if latest_log_counter is -1, keep all logs, if it's None, delete all logs."""
-        if self.latest_log_counter == -1:  # -1 means infinite
-            return
-        logs = os.listdir(self.log_directory) if self.latest_log_counter is not None else []
-        if self.latest_log_counter is not None and len(logs) < self.latest_log_counter - 1:
-            return
-        starting_index = self.latest_log_counter - 1 if self.latest_log_counter is not None else 0  # Remove 0 onward
-        for file in sorted(logs, reverse=True)[starting_index:]:  # Delete any file that's not the newest x
-            os.remove(f"{self.log_directory}/{file}")
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        if method.upper() != "GET" or args or kwargs.get("stream"):
+            return self.send_with_retries(method, url, *args, **kwargs)
+        request_key = f"{url}|{sorted(kwargs.items())!r}"
+        memo: dict[str, requests.Response] | None = getattr(self.local, "memo", None)
+        if memo is not None and request_key in memo:
+            return memo[request_key]
+        response = self.send_single_flight_get(request_key, url, **kwargs) if self.single_flight else self.send_get(url, **kwargs)
+        if memo is not None and response.status_code == 200:
+            memo[request_key] = response
+        return response
+
+    @contextmanager
+    def request_scope(self) -> Generator[None, None, None]:
+        """Inside this scope, repeated identical GETs (from this thread) are only sent once, and reuse the first response."""
+        is_outermost = getattr(self.local, "memo", None) is None
+        if is_outermost:
+            self.local.memo = {}
+        try:
+            yield
+        finally:
+            if is_outermost:
+                self.local.memo = None
+
+    def close(self) -> None:
+        super().close()
+        if self.log_writer is not None:
+            self.log_writer.close()
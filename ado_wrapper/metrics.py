@@ -0,0 +1,99 @@
+import math
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+MAX_SAMPLES_PER_ROUTE = 10_000  # Percentiles are calculated from the most recent samples
+
+
+def get_percentile(sorted_values: list[float], percentile: float) -> float:
+    """Nearest-rank percentile, the list must already be sorted."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(percentile / 100 * len(sorted_values)) - 1))
+    return round(sorted_values[index], 3)
+
+
+@dataclass
+class RouteMetrics:
+    count: int = 0
+    total_duration_ms: float = 0.0
+    total_bytes: int = 0
+    retries: int = 0
+    status_classes: Counter[str] = field(default_factory=Counter)
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS_MS))
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=MAX_SAMPLES_PER_ROUTE))
+
+    def to_json(self) -> dict[str, Any]:
+        sorted_samples = sorted(self.samples)
+        return {
+            "count": self.count, "total_duration_ms": round(self.total_duration_ms, 3), "total_bytes": self.total_bytes,
+            "retries": self.retries, "status_classes": dict(self.status_classes),
+            "p50_ms": get_percentile(sorted_samples, 50), "p95_ms": get_percentile(sorted_samples, 95),
+            "p99_ms": get_percentile(sorted_samples, 99), "max_ms": round(sorted_samples[-1], 3) if sorted_samples else 0.0,
+        }  # fmt: skip
+
+
+class RequestMetrics:
+    """Thread safe latency/size/status aggregates for every request, grouped by method and route template
+    (e.g. `GET /_apis/build/builds/{id}/timeline`), available as `ado_client.metrics`.\n
+    Every attempt is recorded, including ones which were retried, so a GET which got two 503s and then a 200
+    counts as 3 (with 2 5xxs, a 2xx and 2 retries), rather than hiding the errors and throttling behind the final 200."""
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+        self.lock = threading.Lock()
+
+    def record(self, method: str, route: str, status_code: int | None, duration_ms: float, response_bytes: int, retries: int) -> None:
+        """A status code of None means the request failed to connect."""
+        with self.lock:
+            route_metrics = self.routes.setdefault((method.upper(), route), RouteMetrics())
+            route_metrics.count += 1
+            route_metrics.total_duration_ms += duration_ms
+            route_metrics.total_bytes += response_bytes
+            route_metrics.retries += retries
+            route_metrics.status_classes[f"{status_code // 100}xx" if status_code is not None else "error"] += 1
+            route_metrics.samples.append(duration_ms)
+            for index, bucket in enumerate(LATENCY_BUCKETS_MS):
+                if duration_ms <= bucket:
+                    route_metrics.bucket_counts[index] += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Returns {"METHOD route": {count, total_duration_ms, total_bytes, retries, status_classes, p50_ms, p95_ms, p99_ms, max_ms}},
+        sorted by the total time spent on each route, slowest first."""
+        with self.lock:
+            data = {f"{method} {route}": route_metrics.to_json() for (method, route), route_metrics in self.routes.items()}
+        return dict(sorted(data.items(), key=lambda item: item[1]["total_duration_ms"], reverse=True))
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP ado_wrapper_request_duration_milliseconds Latency of requests to ADO.",
+            "# TYPE ado_wrapper_request_duration_milliseconds histogram",
+        ]
+        with self.lock:
+            routes = sorted(self.routes.items())
+            for (method, route), route_metrics in routes:
+                labels = f'method="{method}",route="{route}"'
+                for bucket, bucket_count in zip(LATENCY_BUCKETS_MS, route_metrics.bucket_counts):
+                    lines.append(f'ado_wrapper_request_duration_milliseconds_bucket{{{labels},le="{bucket}"}} {bucket_count}')
+                lines.append(f'ado_wrapper_request_duration_milliseconds_bucket{{{labels},le="+Inf"}} {route_metrics.count}')
+                lines.append(f"ado_wrapper_request_duration_milliseconds_sum{{{labels}}} {route_metrics.total_duration_ms:.3f}")
+                lines.append(f"ado_wrapper_request_duration_milliseconds_count{{{labels}}} {route_metrics.count}")
+            lines += ["# HELP ado_wrapper_response_bytes_total Bytes received from ADO.", "# TYPE ado_wrapper_response_bytes_total counter"]
+            lines += [f'ado_wrapper_response_bytes_total{{method="{method}",route="{route}"}} {route_metrics.total_bytes}'
+                      for (method, route), route_metrics in routes]  # fmt: skip
+            lines += ["# HELP ado_wrapper_retries_total Requests which were retried.", "# TYPE ado_wrapper_retries_total counter"]
+            lines += [f'ado_wrapper_retries_total{{method="{method}",route="{route}"}} {route_metrics.retries}'
+                      for (method, route), route_metrics in routes]  # fmt: skip
+            lines += ["# HELP ado_wrapper_responses_total Responses by status class.", "# TYPE ado_wrapper_responses_total counter"]
+            lines += [f'ado_wrapper_responses_total{{method="{method}",route="{route}",status="{status_class}"}} {status_count}'
+                      for (method, route), route_metrics in routes
+                      for status_class, status_count in sorted(route_metrics.status_classes.items())]  # fmt: skip
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self.lock:
+            self.routes.clear()
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 from ado_wrapper.state_managed_abc import StateManagedResource
 from ado_wrapper.utils import from_ado_date_string
@@ -87,4 +88,7 @@ class AgentPool(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", agent_pool_name: str) -> "AgentPool | None":
-        return cls._get_by_abstract_filter(ado_client, lambda agent_pool: agent_pool.name == agent_pool_name)
+        return cls._get_by_server_side_filter(
+            ado_client, f"/_apis/distributedtask/pools?poolName={quote(agent_pool_name, safe='')}&api-version=7.1-preview.1",
+            "name", agent_pool_name,
+        )  # fmt: skip
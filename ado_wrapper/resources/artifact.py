@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from ado_wrapper.state_managed_abc import StateManagedResource
-from ado_wrapper.utils import binary_data_to_file_dictionary
+from ado_wrapper.utils import binary_data_to_file_dictionary, download_to_temporary_file, ZipFileMapping
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
@@ -49,6 +49,14 @@ class BuildArtifact(StateManagedResource):
         files = binary_data_to_file_dictionary(request.content, None, ado_client.suppress_warnings)
         return files
 
+    @classmethod
+    def download_artifact_streamed(
+        cls, ado_client: "AdoClient", download_url: str, glob_patterns: list[str] | None = None, max_memory_bytes: int | None = None
+    ) -> ZipFileMapping:
+        """Like download_artifact(), but streams the zip to a temporary file, rather than holding it all in memory.
+        Returns a lazy mapping of path -> content, use `with` (or .close()) to delete the zip once done."""
+        return ZipFileMapping(download_to_temporary_file(ado_client, download_url), None, glob_patterns, max_memory_bytes)
+
     def link(self, ado_client: "AdoClient") -> str:
         return f"https://dev.azure.com/{ado_client.ado_org_name}/{ado_client.ado_project_name}/_build/results?buildId={self.build_id}&view=artifacts&pathAsName=false&type=publishedArtifacts"  # fmt: skip
 
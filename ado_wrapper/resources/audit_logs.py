@@ -1,9 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Literal
 
 from ado_wrapper.errors import ConfigurationError, InvalidPermissionsError
-from ado_wrapper.utils import from_ado_date_string
+from ado_wrapper.utils import from_ado_date_string, intern_string, intern_strings, iter_from_pages, slotted_dataclass
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
@@ -18,7 +18,7 @@ CategoryDisplayNameType = Literal["Access", "Create", "Execute", "Modify", "Remo
 ScopeTypeType = Literal["deployment", "enterprise", "organization", "project", "unknown"]
 
 
-@dataclass
+@slotted_dataclass
 class AuditLog:
     """https://learn.microsoft.com/en-us/rest/api/azure/devops/audit/audit-log/query?view=azure-devops-rest-7.1&tabs=HTTP"""
 
@@ -47,58 +47,76 @@ class AuditLog:
 
     @classmethod
     def from_request_payload(cls, data: dict[str, Any]) -> "AuditLog":
-        return cls(
-            data["id"], data["correlationId"], data["activityId"], data["actorUserId"],
-            data["actorClientId"], data["actorUPN"], data["authenticationMechanism"],
-            from_ado_date_string(data["timestamp"]), data["scopeType"], data["scopeDisplayName"],
-            data["scopeId"], data["projectId"], data["projectName"], data["ipAddress"], data["userAgent"],
-            data["actionId"], data["details"], data["area"], data["category"], data["categoryDisplayName"],
-            data["actorDisplayName"], data["data"],  # fmt: skip
+        return cls(  # Most of these repeat across logs, so are interned
+            data["id"], data["correlationId"], data["activityId"], intern_string(data["actorUserId"]),
+            intern_string(data["actorClientId"]), intern_string(data["actorUPN"]), intern_string(data["authenticationMechanism"]),
+            from_ado_date_string(data["timestamp"]), intern_string(data["scopeType"]), intern_string(data["scopeDisplayName"]),
+            intern_string(data["scopeId"]), intern_string(data["projectId"]), intern_string(data["projectName"]),
+            intern_string(data["ipAddress"]), intern_string(data["userAgent"]), intern_string(data["actionId"]), data["details"],
+            intern_string(data["area"]), intern_string(data["category"]), intern_string(data["categoryDisplayName"]),
+            intern_string(data["actorDisplayName"]), intern_strings(data["data"]),  # fmt: skip
         )
 
     @classmethod
     def get_all(cls, ado_client: "AdoClient", start_time: datetime | None = None, end_time: datetime | None = None) -> list["AuditLog"]:
         # """https://learn.microsoft.com/en-us/rest/api/azure/devops/audit/audit-log/query?view=azure-devops-rest-7.1&tabs=HTTP#auditlogqueryresult"""
         """If no start_time is passed in, use 24 hours ago, if no end_time is passed in, use `now`"""
+        return list(cls.iter_all(ado_client, start_time, end_time))
+
+    @classmethod
+    def iter_pages(
+        cls, ado_client: "AdoClient", start_time: datetime | None = None, end_time: datetime | None = None, batch_size: int = 100_000
+    ) -> Iterator[list["AuditLog"]]:
+        """Yields each batch of logs as it arrives, see get_all()"""
         if start_time is None:
             start_time = datetime.now() - timedelta(days=1)
         if end_time is None:
             end_time = datetime.now()
         if start_time >= end_time:
             raise ConfigurationError("Start time must be before end time!")
-        combined_entries = []
+        return cls._iter_pages(ado_client, start_time, end_time, batch_size)
+
+    @classmethod
+    def _iter_pages(cls, ado_client: "AdoClient", start_time: datetime, end_time: datetime, batch_size: int) -> Iterator[list["AuditLog"]]:
         has_more = True
         continuation_token = None
-        # TODO: This is paginated too, can we make a function? Is it worth?
         while has_more:
             data = ado_client.session.get(
-                f"https://auditservice.dev.azure.com/{ado_client.ado_org_name}/_apis/audit/auditlog?batchSize=100000&startTime={start_time.isoformat()}&endTime={end_time.isoformat()}{f'&continuationToken={continuation_token}' if continuation_token else ''}&api-version=7.1-preview.1",
+                f"https://auditservice.dev.azure.com/{ado_client.ado_org_name}/_apis/audit/auditlog?batchSize={batch_size}&startTime={start_time.isoformat()}&endTime={end_time.isoformat()}{f'&continuationToken={continuation_token}' if continuation_token else ''}&api-version=7.1-preview.1",
             )
             if data.status_code == 403:
                 raise InvalidPermissionsError("You have insufficient perms to use this function, it requires 'View audit log'")
             json_data = data.json()
             has_more = json_data["hasMore"]
             continuation_token = json_data["continuationToken"]
-            combined_entries.extend(json_data["decoratedAuditLogEntries"])
-        return [cls.from_request_payload(x) for x in combined_entries]
+            yield [cls.from_request_payload(x) for x in json_data["decoratedAuditLogEntries"]]
+
+    @classmethod
+    def iter_all(
+        cls, ado_client: "AdoClient", start_time: datetime | None = None, end_time: datetime | None = None,
+        limit: int | None = None, predicate: "Callable[[AuditLog], bool] | None" = None,
+    ) -> Iterator["AuditLog"]:  # fmt: skip
+        """Yields logs as each batch arrives, stopping once `limit` logs (which match the predicate) are found."""
+        batch_size = min(limit, 100_000) if limit is not None and predicate is None else 100_000  # Don't fetch more than we need
+        return iter_from_pages(cls.iter_pages(ado_client, start_time, end_time, batch_size), limit, predicate)
 
     @classmethod
     def get_all_by_area(
         cls, ado_client: "AdoClient", area_type: AreaType, start_time: datetime | None = None, end_time: datetime | None = None
     ) -> list["AuditLog"]:
-        return [x for x in cls.get_all(ado_client, start_time, end_time) if x.area == area_type]
+        return list(cls.iter_all(ado_client, start_time, end_time, predicate=lambda x: x.area == area_type))
 
     @classmethod
     def get_all_by_category(
         cls, ado_client: "AdoClient", category: CategoryType, start_time: datetime | None = None, end_time: datetime | None = None
     ) -> list["AuditLog"]:
-        return [x for x in cls.get_all(ado_client, start_time, end_time) if x.category == category]
+        return list(cls.iter_all(ado_client, start_time, end_time, predicate=lambda x: x.category == category))
 
     @classmethod
     def get_all_by_scope_type(
         cls, ado_client: "AdoClient", scope_type: ScopeTypeType, start_time: datetime | None = None, end_time: datetime | None = None
     ) -> list["AuditLog"]:
-        return [x for x in cls.get_all(ado_client, start_time, end_time) if x.scope_type == scope_type]
+        return list(cls.iter_all(ado_client, start_time, end_time, predicate=lambda x: x.scope_type == scope_type))
 
     def link(self, ado_client: "AdoClient") -> str:
         FORMAT_FOR_DATETIME = "%Y-%m-%dT%H:%M:%S.%fZ"
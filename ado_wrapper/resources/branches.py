@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal, Any
+from urllib.parse import quote
 
 from ado_wrapper.errors import ConfigurationError
 from ado_wrapper.state_managed_abc import StateManagedResource
@@ -92,9 +93,13 @@ class Branch(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", repo_name_or_id: str, branch_name: str) -> "Branch | None":
-        for branch in cls.get_all_by_repo(ado_client, repo_name_or_id):
-            if branch.name == branch_name:
-                return branch
+        branch = cls._get_by_server_side_filter(  # The filter matches prefixes, e.g. heads/main also gives heads/main-2
+            ado_client,
+            f"/{ado_client.ado_project_name}/_apis/git/repositories/{repo_name_or_id}/refs?filter=heads/{quote(branch_name)}&api-version=7.1",
+            "name", branch_name, use_cached_collection=False,  # Every repo has its own branches
+        )  # fmt: skip
+        if branch is not None:
+            return branch
         raise ValueError(f"Branch {branch_name} not found")
 
     @classmethod
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
-
+from urllib.parse import quote
 
 from ado_wrapper.errors import ConfigurationError, UnknownError
 from ado_wrapper.resources.repo import BuildRepository
@@ -77,6 +77,15 @@ class BuildDefinition(StateManagedResource):
             f"/{ado_client.ado_project_name}/_apis/build/definitions/{build_definition_id}?api-version=7.1",
         )
 
+    @classmethod
+    def _get_by_ids_batch(cls, ado_client: "AdoClient", build_definition_ids: list[str]) -> "list[BuildDefinition]":
+        """Used by get_by_ids(), includeAllProperties stops these being references."""
+        return super()._get_by_url(
+            ado_client,
+            f"/{ado_client.ado_project_name}/_apis/build/definitions?definitionIds={','.join(build_definition_ids)}&includeAllProperties=true&api-version=7.1",
+            fetch_multiple=True,
+        )  # pyright: ignore[reportReturnType]
+
     @classmethod
     def create(
         cls, ado_client: "AdoClient", name: str, repo_id: str, path_to_pipeline: str,
@@ -139,7 +148,9 @@ class BuildDefinition(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", name: str) -> "BuildDefinition | None":
-        return cls._get_by_abstract_filter(ado_client, lambda x: x.name == name)
+        return cls._get_by_server_side_filter(
+            ado_client, f"/{ado_client.ado_project_name}/_apis/build/definitions?name={quote(name, safe='')}&api-version=7.1", "name", name
+        )
 
     def get_all_builds_by_definition(self, ado_client: "AdoClient") -> "list[Build]":
         return Build.get_all_by_definition(ado_client, self.build_definition_id)
@@ -267,6 +278,7 @@ class HierarchyCreatedBuildDefinition(StateManagedResource):
         ).json()
         data = request["dataProviders"]["ms.vss-build-web.create-and-run-pipeline-data-provider"]["pipeline"]  # id, name, queueName
         hierarchy_build_Def = cls.from_request_payload(data)
+        ado_client.collection_cache.invalidate(BuildDefinition)
         ado_client.state_manager.add_resource_to_state(hierarchy_build_Def)
         return hierarchy_build_Def
 
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 from ado_wrapper.state_managed_abc import StateManagedResource
-from ado_wrapper.utils import from_ado_date_string
+from ado_wrapper.utils import from_ado_date_string, intern_string, intern_strings, slotted_dataclass
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
@@ -136,7 +136,7 @@ class IssueType(TypedDict):
     data: IssueDataType  # E.g. 'data': {'type': 'error', 'logFileLineNumber': '133'}
 
 
-@dataclass
+@slotted_dataclass
 class BuildTimelineGenericItem:
     item_type: BuildTimelineItemTypeType
     item_id: str
@@ -175,11 +175,12 @@ class BuildTimelineGenericItem:
     @classmethod
     def from_request_payload(cls, data: dict[str, Any]) -> "BuildTimelineGenericItem":
         return cls(
-            data["type"], data["id"], data["previousAttempts"], data["parentId"], data["name"], from_ado_date_string(data["startTime"]),
-            from_ado_date_string(data["finishTime"]), data["currentOperation"], data["percentComplete"], data["state"],
-            data["result"], data["resultCode"], data["changeId"], from_ado_date_string(data["lastModified"]), data["workerName"],
-            data.get("order"), None, data.get("error_count", 0), data.get("warning_count", 0), data["url"], data["log"], data["task"],
-            data["attempt"], data["identifier"], data.get("issues", []), None, None, None, None,
+            intern_string(data["type"]), data["id"], data["previousAttempts"], intern_string(data["parentId"]), intern_string(data["name"]),
+            from_ado_date_string(data["startTime"]), from_ado_date_string(data["finishTime"]), data["currentOperation"],
+            data["percentComplete"], intern_string(data["state"]), intern_string(data["result"]), data["resultCode"], data["changeId"],
+            from_ado_date_string(data["lastModified"]), intern_string(data["workerName"]), data.get("order"), None,
+            data.get("error_count", 0), data.get("warning_count", 0), data["url"], intern_strings(data["log"]),
+            intern_strings(data["task"]), data["attempt"], intern_string(data["identifier"]), data.get("issues", []), None, None, None, None,
         )  # fmt: skip
 
     @staticmethod
@@ -1,17 +1,21 @@
 import time
-from dataclasses import dataclass, field
+from dataclasses import field
 from datetime import datetime
 import json
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, Literal
 
 
 from ado_wrapper.resources.environment import Environment, PipelineAuthorisation
 from ado_wrapper.resources.repo import BuildRepository
 from ado_wrapper.resources.users import Member
 from ado_wrapper.resources.build_timeline import BuildTimeline
+from ado_wrapper.lazy_resources import LazyFieldDecoders
 from ado_wrapper.state_managed_abc import StateManagedResource
 from ado_wrapper.errors import ConfigurationError, UnknownError
-from ado_wrapper.utils import from_ado_date_string, remove_ansi_codes, build_hierarchy_payload, DATETIME_RE_PATTERN
+from ado_wrapper.utils import (
+    from_ado_date_string, remove_ansi_codes, build_hierarchy_payload, intern_string, intern_strings, iter_from_pages, slotted_dataclass,
+    DATETIME_RE_PATTERN,
+)  # fmt: skip
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
@@ -24,7 +28,7 @@ QueuePriority = Literal["low", "belowNormal", "normal", "aboveNormal", "high"]
 # ========================================================================================================
 
 
-@dataclass
+@slotted_dataclass
 class Build(StateManagedResource):
     """https://learn.microsoft.com/en-us/rest/api/azure/devops/build/builds?view=azure-devops-rest-7.1"""
 
@@ -43,6 +47,22 @@ class Build(StateManagedResource):
     reason: str = field(default="An automated build created with the ado_wrapper Python library", repr=False)
     priority: QueuePriority = field(default="normal", repr=False)
 
+    lazy_field_decoders: ClassVar[LazyFieldDecoders] = {
+        "build_id": lambda data: str(data["id"]),
+        "build_number": lambda data: str(data["buildNumber"]),
+        "status": lambda data: intern_string(data["status"]),
+        "requested_by": lambda data: Member.from_request_payload(data["requestedBy"]),
+        "build_repo": lambda data: BuildRepository.from_request_payload(data["repository"]),
+        "parameters": lambda data: intern_strings(data.get("templateParameters", {})),
+        "branch_name": lambda data: intern_string(data["sourceBranch"].removeprefix("refs/heads/")),
+        "pool_id": lambda data: data.get("queue", {}).get("pool", {}).get("id"),
+        "start_time": lambda data: from_ado_date_string(data.get("startTime")),
+        "finish_time": lambda data: from_ado_date_string(data.get("finishTime")),
+        "queue_time": lambda data: from_ado_date_string(data.get("queueTime")),
+        "reason": lambda data: intern_string(data["reason"]),
+        "priority": lambda data: intern_string(data["priority"]),
+    }
+
     @classmethod
     def from_request_payload(cls, data: dict[str, Any]) -> "Build":
         from ado_wrapper.resources.build_definitions import BuildDefinition
@@ -50,11 +70,11 @@ class Build(StateManagedResource):
         requested_by = Member.from_request_payload(data["requestedBy"])
         build_repo = BuildRepository.from_request_payload(data["repository"])
         build_definition = BuildDefinition.from_request_payload(data["definition"]) if "definition" in data else None
-        return cls(str(data["id"]), str(data["buildNumber"]), data["status"], requested_by, build_repo, data.get("templateParameters", {}),
-                   data["sourceBranch"].removeprefix("refs/heads/"),
+        return cls(str(data["id"]), str(data["buildNumber"]), intern_string(data["status"]), requested_by, build_repo,
+                   intern_strings(data.get("templateParameters", {})), intern_string(data["sourceBranch"].removeprefix("refs/heads/")),
                    build_definition, data.get("queue", {}).get("pool", {}).get("id"), from_ado_date_string(data.get("startTime")),
-                   from_ado_date_string(data.get("finishTime")), from_ado_date_string(data.get("queueTime")), data["reason"],
-                   data["priority"])  # fmt: skip
+                   from_ado_date_string(data.get("finishTime")), from_ado_date_string(data.get("queueTime")), intern_string(data["reason"]),
+                   intern_string(data["priority"]))  # fmt: skip
 
     @classmethod
     def get_by_id(cls, ado_client: "AdoClient", build_id: str) -> "Build":
@@ -63,6 +83,15 @@ class Build(StateManagedResource):
             f"/{ado_client.ado_project_name}/_apis/build/builds/{build_id}?api-version=7.1",
         )
 
+    @classmethod
+    def _get_by_ids_batch(cls, ado_client: "AdoClient", build_ids: list[str]) -> "list[Build]":
+        """Used by get_by_ids()"""
+        return super()._get_by_url(
+            ado_client,
+            f"/{ado_client.ado_project_name}/_apis/build/builds?buildIds={','.join(build_ids)}&api-version=7.1",
+            fetch_multiple=True,
+        )  # pyright: ignore[reportReturnType]
+
     @classmethod
     def create(cls, ado_client: "AdoClient", definition_id: str, source_branch: str = "refs/heads/main") -> "Build":
         return super()._create(
@@ -90,25 +119,46 @@ class Build(StateManagedResource):
     @classmethod
     def get_all(
         cls, ado_client: "AdoClient", limit: int | None = None, status: BuildStatus | Literal["all"] = "all",
-        start_date: datetime | None = None, end_date: datetime | None = None,  # fmt: skip
+        start_date: datetime | None = None, end_date: datetime | None = None, fields: list[str] | None = None,  # fmt: skip
     ) -> "list[Build]":
+        """If `fields` is passed in (e.g. `["build_id", "status", "start_time"]`), only those fields are decoded, the rest are None."""
+        return list(cls.iter_all(ado_client, limit, status, start_date, end_date, fields=fields))
+
+    @classmethod
+    def iter_pages(
+        cls, ado_client: "AdoClient", status: BuildStatus | Literal["all"] = "all",
+        start_date: datetime | None = None, end_date: datetime | None = None, page_size: int = 5_000,
+        fields: list[str] | None = None,
+    ) -> "Iterator[list[Build]]":  # fmt: skip
+        cls._validate_fields(fields)
         if (start_date is not None or end_date is not None) and status != "all":
             raise ConfigurationError("Cannot pass in both a status and start/end date.")
         params = {
             "minTime": start_date.isoformat() if start_date else None,
             "maxTime": end_date.isoformat() if end_date else None,
             "queryOrder": "finishTimeDescending",
-            "$top": limit or 5_000,
+            "$top": page_size,
             "statusFilter": status,
         }
         if start_date is not None or end_date is not None:
             del params["statusFilter"]
         extra_params_string = "".join([f"&{key}={value}" for key, value in params.items()])
-        return super()._get_all_with_continuation_token(
+        return super()._iter_pages_with_continuation_token(
             ado_client,
             f"/{ado_client.ado_project_name}/_apis/build/builds?api-version=7.1" + extra_params_string,
+            fields,
         )  # pyright: ignore[reportReturnType]
 
+    @classmethod
+    def iter_all(  # type: ignore[override]
+        cls, ado_client: "AdoClient", limit: int | None = None, status: BuildStatus | Literal["all"] = "all",
+        start_date: datetime | None = None, end_date: datetime | None = None, predicate: "Callable[[Build], bool] | None" = None,
+        fields: list[str] | None = None,
+    ) -> "Iterator[Build]":  # fmt: skip
+        """Yields builds as each page arrives, newest first, stopping once `limit` builds (which match the predicate) are found."""
+        page_size = min(limit, 5_000) if limit is not None and predicate is None else 5_000  # Don't fetch more than we need
+        return iter_from_pages(cls.iter_pages(ado_client, status, start_date, end_date, page_size, fields), limit, predicate)
+
     def link(self, ado_client: "AdoClient") -> str:
         return f"https://dev.azure.com/{ado_client.ado_org_name}/{ado_client.ado_project_name}_build/results?buildId={self.build_id}"
 
@@ -187,14 +237,16 @@ class Build(StateManagedResource):
     @classmethod
     def _get_all_logs_ids(cls, ado_client: "AdoClient", build_id: str) -> dict[str, str]:
         """Returns a mapping of stage_name/job_name/task_name: log_id"""
-        # Get all the individual task -> log_id mapping
-        tasks = [
-            x for x in BuildTimeline.get_all_by_type(ado_client, build_id, "Task").records
-            if x.log  # All the ones with logs (removes skipped tasks)
-        ]  # fmt: skip
+        with ado_client.request_scope():  # Both of these fetch the build's timeline
+            # Get all the individual task -> log_id mapping
+            tasks = [
+                x for x in BuildTimeline.get_all_by_type(ado_client, build_id, "Task").records
+                if x.log  # All the ones with logs (removes skipped tasks)
+            ]  # fmt: skip
+            stages_jobs_tasks = cls.get_stages_jobs_tasks(ado_client, build_id)
         return {
             f"{stage_name}/{job_name}/{task_name}": [task for task in tasks if task.item_id == task_id][0].log["id"]  # type: ignore
-            for stage_name, stage_data in cls.get_stages_jobs_tasks(ado_client, build_id).items()
+            for stage_name, stage_data in stages_jobs_tasks.items()
             for job_name, job_data in stage_data["jobs"].items()
             for task_name, task_id in job_data["tasks"].items()
             if [task for task in tasks if task.item_id == task_id]
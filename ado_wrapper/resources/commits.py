@@ -1,12 +1,13 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, Literal
 
 from ado_wrapper.resources.users import Member
 from ado_wrapper.resources.code_change import ChangedFile
+from ado_wrapper.lazy_resources import LazyFieldDecoders
 from ado_wrapper.state_managed_abc import StateManagedResource
 from ado_wrapper.errors import ConfigurationError, InvalidPermissionsError  # , UnknownError
-from ado_wrapper.utils import from_ado_date_string
+from ado_wrapper.utils import from_ado_date_string, intern_string, iter_from_pages, slotted_dataclass
 
 # from ado_wrapper.resources.branches import Branch
 
@@ -63,7 +64,7 @@ def get_commit_body_template(
     }
 
 
-@dataclass
+@slotted_dataclass
 class Commit(StateManagedResource):
     """
     https://learn.microsoft.com/en-us/rest/api/azure/devops/git/commits?view=azure-devops-rest-7.1
@@ -76,10 +77,20 @@ class Commit(StateManagedResource):
     message: str
     repo_id: str = field(repr=False)
 
+    lazy_field_decoders: ClassVar[LazyFieldDecoders] = {
+        "commit_id": lambda data: data["commitId"],
+        "author": lambda data: Member(
+            intern_string(data["author"]["name"]), intern_string(data["author"].get("email", "BOT USER")), "UNKNOWN"
+        ),
+        "date": lambda data: from_ado_date_string(data["author"]["date"]),
+        "message": lambda data: data["comment"],
+        "repo_id": lambda data: intern_string(data["url"].split("_apis/git/repositories/")[1].split("/commits/")[0]),
+    }
+
     @classmethod
     def from_request_payload(cls, data: dict[str, Any]) -> "Commit":
-        repo_id = data["url"].split("_apis/git/repositories/")[1].split("/commits/")[0]
-        member = Member(data["author"]["name"], data["author"].get("email", "BOT USER"), "UNKNOWN")
+        repo_id = intern_string(data["url"].split("_apis/git/repositories/")[1].split("/commits/")[0])
+        member = Member(intern_string(data["author"]["name"]), intern_string(data["author"].get("email", "BOT USER")), "UNKNOWN")
         return cls(data["commitId"], member, from_ado_date_string(data["author"]["date"]), data["comment"], repo_id)
 
     @classmethod
@@ -137,11 +148,25 @@ class Commit(StateManagedResource):
 
     @classmethod
     def get_all_by_repo(
-        cls, ado_client: "AdoClient", repo_id: str, limit: str | None = None,
-        start: datetime | None = None, end: datetime | None = None, branch_name: str | None = None,
+        cls, ado_client: "AdoClient", repo_id: str, limit: int | None = None,
+        start: datetime | None = None, end: datetime | None = None, branch_name: str | None = None, fields: list[str] | None = None,
     ) -> "list[Commit]":
-        """Returns a list of all commits in the given repository."""
+        """Returns a list of all commits in the given repository (or at most `limit` of them, the newest first).
+        If `fields` is passed in (e.g. `["commit_id", "date"]`), only those fields are decoded, the rest are None."""
+        return list(cls.iter_all_by_repo(ado_client, repo_id, limit, start, end, branch_name, fields=fields))
+
+    @classmethod
+    def iter_all_by_repo(
+        cls, ado_client: "AdoClient", repo_id: str, limit: int | None = None, start: datetime | None = None,
+        end: datetime | None = None, branch_name: str | None = None, predicate: "Callable[[Commit], bool] | None" = None,
+        page_size: int = 10_000, prefetch_pages: int = 4, fields: list[str] | None = None,
+    ) -> "Iterator[Commit]":  # fmt: skip
+        """Yields the repo's commits as each page arrives, stopping once `limit` commits (which match the predicate) are found.
+        Up to `prefetch_pages` pages are requested at once."""
         # https://learn.microsoft.com/en-us/rest/api/azure/devops/git/commits/get-commits?view=azure-devops-rest-7.1&tabs=HTTP
+        cls._validate_fields(fields)
+        if limit is not None and predicate is None:
+            page_size = min(limit, page_size)  # Don't fetch more than we need
         extra_query = (f"&searchCriteria.itemVersion.version={branch_name}&searchCriteria.itemVersion.versionType=branch"
                        if branch_name is not None else "")  # fmt: skip
         params = {
@@ -149,7 +174,7 @@ class Commit(StateManagedResource):
             "searchCriteria.includeLinks": False,  # Small optimisation
             "searchCriteria.includeUserImageUrl": False,  # Small optimisation
             "searchCriteria.includeWorkItems": False,  # Small optimisation
-            "searchCriteria.$top": limit or 10_000,
+            "searchCriteria.$top": page_size,
             # "searchCriteria.author": author_name,  # TODO: actually try this
         }
         if start is not None:
@@ -157,11 +182,13 @@ class Commit(StateManagedResource):
         if end is not None:
             params["searchCriteria.toDate"] = end.strftime("%-m/%-d/%Y %H:%M:%S")
         extra_params_string = "".join([f"&{key}={value}" for key, value in params.items()])
-        return super()._get_all_paginated(
+        pages = super()._iter_pages_paginated(
             ado_client,
             f"/{ado_client.ado_project_name}/_apis/git/repositories/{repo_id}/commits?api-version=7.1{extra_query}" + extra_params_string,
-            skip_parameter_name="searchCriteria.$skip",
-        )  # pyright: ignore[reportReturnType]
+            page_size=page_size, skip_parameter_name="searchCriteria.$skip", prefetch_pages=prefetch_pages,
+            limit=limit if predicate is None else None, fields=fields,
+        )
+        return iter_from_pages(pages, limit, predicate)  # pyright: ignore[reportReturnType]
 
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
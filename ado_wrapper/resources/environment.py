@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import quote
 
 from ado_wrapper.resources.users import Member
 from ado_wrapper.state_managed_abc import StateManagedResource
@@ -88,7 +89,11 @@ class Environment(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", name: str) -> "Environment | None":
-        return cls._get_by_abstract_filter(ado_client, lambda x: x.name == name)
+        return cls._get_by_server_side_filter(
+            ado_client,
+            f"/{ado_client.ado_project_name}/_apis/distributedtask/environments?name={quote(name, safe='')}&api-version=7.1-preview.1",
+            "name", name,
+        )  # fmt: skip
 
     # =============== Pipeline Permissions ===================== #
 
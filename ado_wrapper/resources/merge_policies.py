@@ -87,17 +87,18 @@ class MergePolicyDefaultReviewer(StateManagedResource):
         # We used to convert all .member_ids to origin_ids, and then set the reviewer.member_id to the origin_id
         # However this isn't very what we want to do for groups, so we try to ignore it.
         fixed_ids = {}
-        for reviewer in all_reviewers:
-            is_user = True
-            try:
-                is_user = AdoUser.is_user_or_group(ado_client, reviewer.member_id) != "group"
-            except ValueError:  # If it's a local_id, we just fail, which means it's probably a user
-                pass
-            if is_user:
-                origin_id = AdoUser._convert_local_ids_to_origin_ids(ado_client, [reviewer.member_id])[reviewer.member_id]  # pylint: disable=protected-access
-                fixed_ids[reviewer.member_id] = origin_id
-            else:
-                fixed_ids[reviewer.member_id] = reviewer.member_id
+        with ado_client.request_scope():  # Each of these fetches every user (and group), so only do that once
+            for reviewer in all_reviewers:
+                is_user = True
+                try:
+                    is_user = AdoUser.is_user_or_group(ado_client, reviewer.member_id) != "group"
+                except ValueError:  # If it's a local_id, we just fail, which means it's probably a user
+                    pass
+                if is_user:
+                    origin_id = AdoUser._convert_local_ids_to_origin_ids(ado_client, [reviewer.member_id])[reviewer.member_id]  # pylint: disable=protected-access
+                    fixed_ids[reviewer.member_id] = origin_id
+                else:
+                    fixed_ids[reviewer.member_id] = reviewer.member_id
         for reviewer in [x for x in all_reviewers if x.member_id is not None]:
             reviewer.member_id = fixed_ids[reviewer.member_id]
         # =====================================================================================
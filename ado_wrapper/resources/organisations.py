@@ -31,11 +31,11 @@ class Organisation(StateManagedResource):
 
     @classmethod
     def get_by_id(cls, ado_client: "AdoClient", organisation_id: str) -> "Organisation | None":
-        return cls._get_by_abstract_filter(ado_client, lambda x: x.organisation_id == organisation_id)
+        return cls._get_by_attribute(ado_client, "organisation_id", organisation_id)
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", organisation_name: str) -> "Organisation | None":
-        return cls._get_by_abstract_filter(ado_client, lambda organisation: organisation.name == organisation_name)
+        return cls._get_by_attribute(ado_client, "name", organisation_name)
 
     def link(self, ado_client: "AdoClient") -> str:
         return f"https://dev.azure.com/{ado_client.ado_org_name}/"
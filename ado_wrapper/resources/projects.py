@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import quote
 
 from ado_wrapper.errors import DeletionFailed, NoElevatedPrivilegesError
 from ado_wrapper.state_managed_abc import StateManagedResource
@@ -97,7 +98,9 @@ class Project(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", project_name: str) -> "Project | None":
-        return cls._get_by_abstract_filter(ado_client, lambda project: project.name == project_name)
+        return cls._get_by_server_side_filter(
+            ado_client, f"/_apis/projects/{quote(project_name, safe='')}?api-version=7.1", "name", project_name, fetch_multiple=False
+        )
 
     # ======================== Project settings ========================== #
     get_pipeline_settings = ProjectPipelineSettings.get_pipeline_settings
@@ -1,13 +1,14 @@
 import json
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from ado_wrapper.resources.code_change import ChangedFile
 from ado_wrapper.resources.users import Member, Reviewer
 from ado_wrapper.resources.commits import Commit
+from ado_wrapper.lazy_resources import LazyFieldDecoders
 from ado_wrapper.state_managed_abc import StateManagedResource, convert_from_json
-from ado_wrapper.utils import from_ado_date_string, build_hierarchy_payload, is_bst
+from ado_wrapper.utils import from_ado_date_string, build_hierarchy_payload, intern_string, is_bst, slotted_dataclass
 from ado_wrapper.errors import ConfigurationError, UnknownError
 
 if TYPE_CHECKING:
@@ -43,7 +44,7 @@ pr_status_mapping: dict[int, PullRequestStatus] = {
 }
 
 
-@dataclass
+@slotted_dataclass
 class PullRequest(StateManagedResource):
     """https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-requests?view=azure-devops-rest-7.1
     Merge status is how "merged" is is, either merged, conflicted, etc, pr_status is how approved it is by reviewers"""
@@ -65,19 +66,32 @@ class PullRequest(StateManagedResource):
     merge_status: MergeStatus = field(default="notSet", metadata={"editable": True, "internal_name": "mergeStatus"})
     reviewers: list[Reviewer] = field(default_factory=list, repr=False)  # Static(ish)
 
+    lazy_field_decoders: ClassVar[LazyFieldDecoders] = {
+        "pull_request_id": lambda data: str(data["pullRequestId"]),
+        "title": lambda data: data["title"],
+        "description": lambda data: data.get("description", ""),
+        "source_branch": lambda data: intern_string(data["sourceRefName"]),
+        "target_branch": lambda data: intern_string(data["targetRefName"]),
+        "author": lambda data: Member.from_request_payload(data["createdBy"]),
+        "creation_date": lambda data: from_ado_date_string(data["creationDate"]),
+        "close_date": lambda data: from_ado_date_string(data.get("closedDate")),
+        "is_draft": lambda data: data["isDraft"],
+    }
+
     @classmethod
     def from_request_payload(cls, data: dict[str, Any]) -> "PullRequest":
         from ado_wrapper.resources.repo import Repo  # Circular import
 
         author = Member.from_request_payload(data["createdBy"])
         reviewers = [Reviewer.from_request_payload(reviewer) for reviewer in data["reviewers"]]
-        repository = Repo(data["repository"]["id"], data["repository"]["name"])
+        repository = Repo(intern_string(data["repository"]["id"]), intern_string(data["repository"]["name"]))
         pr_status = pr_status_mapping[data["status"]] if isinstance(data.get("status"), int) else data.get("status", "notSet")
         merge_status = (
             merge_status_mapping[data["mergeStatus"]] if isinstance(data.get("mergeStatus"), int) else data.get("mergeStatus", "notSet")
         )
         return cls(
-            str(data["pullRequestId"]), data["title"], data.get("description", ""), data["sourceRefName"], data["targetRefName"],
+            str(data["pullRequestId"]), data["title"], data.get("description", ""),
+            intern_string(data["sourceRefName"]), intern_string(data["targetRefName"]),
             data.get("lastMergeTargetCommit", {})["commitId"],
             data.get("lastMergeCommit", {}).get("commitId"),
             data.get("lastMergeSourceCommit", {}).get("commitId"),
@@ -2,6 +2,7 @@ import json
 import zipfile
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import quote
 
 import requests
 import yaml
@@ -12,7 +13,7 @@ from ado_wrapper.resources.merge_policies import MergePolicies, MergePolicyDefau
 from ado_wrapper.resources.pull_requests import PullRequest
 from ado_wrapper.state_managed_abc import StateManagedResource
 from ado_wrapper.errors import ResourceNotFound, UnknownError
-from ado_wrapper.utils import binary_data_to_file_dictionary  # requires_perms
+from ado_wrapper.utils import binary_data_to_file_dictionary, download_to_temporary_file, ZipFileMapping  # requires_perms
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
@@ -80,8 +81,9 @@ class Repo(StateManagedResource):
 
     @classmethod
     def delete_by_id(cls, ado_client: "AdoClient", repo_id: str) -> None:
-        for pull_request in Repo.get_all_pull_requests(ado_client, repo_id, status="all"):
-            ado_client.state_manager.remove_resource_from_state("PullRequest", pull_request.pull_request_id)
+        with ado_client.state_manager.transaction():
+            for pull_request in Repo.get_all_pull_requests(ado_client, repo_id, status="all"):
+                ado_client.state_manager.remove_resource_from_state("PullRequest", pull_request.pull_request_id)
         # for branch in Branch.get_all_by_repo(ado_client, repo_id):
         #     ado_client.state_manager.remove_resource_from_state("Branch", branch.name)
         # TODO: Remove all tags from state as well, and whatever else repos have.
@@ -109,7 +111,11 @@ class Repo(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", repo_name: str) -> "Repo | None":
-        return cls._get_by_abstract_filter(ado_client, lambda repo: repo.name == repo_name)
+        return cls._get_by_server_side_filter(
+            ado_client,
+            f"/{ado_client.ado_project_name}/_apis/git/repositories/{quote(repo_name, safe='')}?api-version=7.1",
+            "name", repo_name, fetch_multiple=False,
+        )  # fmt: skip
 
     def get_file(self, ado_client: "AdoClient", file_path: str, branch_name: str = "main") -> str:
         """Gets a single file by path, auto_decode converts json files from text to dictionaries"""
@@ -156,6 +162,24 @@ class Repo(StateManagedResource):
                 print(f"[ADO_WRAPPER] {self.name} ({self.repo_id}) couldn't be unzipped:", e)
         return files
 
+    def get_contents_streamed(
+        self, ado_client: "AdoClient", file_types: list[str] | None = None, branch_name: str = "main",
+        glob_patterns: list[str] | None = None, max_memory_bytes: int | None = None,  # fmt: skip
+    ) -> ZipFileMapping:
+        """Like get_contents(), but streams the zip to a temporary file, rather than holding it all in memory.
+        Returns a lazy mapping of path -> content, files are only decoded when accessed, see ZipFileMapping.
+        glob_patterns filters the paths, e.g. ["src/*.py"], use `with` (or .close()) to delete the zip once done."""
+        try:
+            zip_path = download_to_temporary_file(
+                ado_client,
+                f"https://dev.azure.com/{ado_client.ado_org_name}/{ado_client.ado_project_name}/_apis/git/repositories/{self.repo_id}/items?recursionLevel={'Full'}&download={True}&$format={'Zip'}&versionDescriptor.version={branch_name}&api-version=7.1",
+            )
+        except UnknownError as e:
+            if " 404, " in str(e):
+                raise ResourceNotFound(f"Repo {self.repo_id} does not have any branches or content!") from e
+            raise
+        return ZipFileMapping(zip_path, file_types, glob_patterns, max_memory_bytes)
+
     def create_pull_request(
         self, ado_client: "AdoClient", branch_name: str, pull_request_title: str, pull_request_description: str,
         to_branch_name: str = "main", is_draft: bool = False
@@ -192,6 +216,7 @@ class Repo(StateManagedResource):
         )
         if request.status_code != 200:
             raise UnknownError("Error, failed to set the default branch for this repo!")
+        ado_client.collection_cache.invalidate(Repo)
 
 
 # ====================================================================
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 from ado_wrapper.errors import ConfigurationError
 from ado_wrapper.resources.users import Member
@@ -111,6 +112,7 @@ class SecureFile(StateManagedResource):
         )  # Doesn't return any json...
         if request.status_code != 200:
             raise ConfigurationError("Could not create secure file, not sure why:", request.text)
+        ado_client.collection_cache.invalidate(cls)  # So get_by_name() finds the new file
         secure_file: SecureFile = SecureFile.get_by_name(ado_client, name)  # type: ignore[assignment]
         ado_client.state_manager.add_resource_to_state(secure_file)
         return secure_file
@@ -140,7 +142,11 @@ class SecureFile(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", name: str) -> "SecureFile | None":
-        return cls._get_by_abstract_filter(ado_client, lambda secure_file: secure_file.name == name)
+        return cls._get_by_server_side_filter(
+            ado_client,
+            f"/{ado_client.ado_project_name}/_apis/distributedtask/securefiles?namePattern={quote(name, safe='')}&api-version=7.1-preview.1",
+            "name", name,
+        )  # fmt: skip
 
     @classmethod
     def get_secure_file_contents(cls, ado_client: "AdoClient", secure_file_name: str) -> str:
@@ -67,7 +67,7 @@ class Team(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", team_name: str) -> "Team | None":
-        return cls._get_by_abstract_filter(ado_client, lambda team: team.name == team_name)
+        return cls._get_by_attribute(ado_client, "name", team_name)
 
     @classmethod
     def get_my_teams(cls, ado_client: "AdoClient") -> list["Team"]:
@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Iterator, Literal
 
 from ado_wrapper.state_managed_abc import StateManagedResource
+from ado_wrapper.utils import intern_string, slotted_dataclass
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
@@ -62,7 +63,11 @@ class AdoUser(StateManagedResource):
 
     @classmethod
     def get_all(cls, ado_client: "AdoClient") -> list["AdoUser"]:
-        return super()._get_all_with_continuation_token(
+        return list(cls.iter_all(ado_client))
+
+    @classmethod
+    def iter_pages(cls, ado_client: "AdoClient") -> Iterator[list["AdoUser"]]:
+        return super()._iter_pages_with_continuation_token(
             ado_client,  # Preview required
             f"https://vssps.dev.azure.com/{ado_client.ado_org_name}/_apis/graph/users?api-version=7.1-preview.1",
         )  # pyright: ignore[reportReturnType]
@@ -73,22 +78,22 @@ class AdoUser(StateManagedResource):
 
     @classmethod
     def get_by_email(cls, ado_client: "AdoClient", member_email: str) -> "AdoUser":
-        user = cls._get_by_abstract_filter(ado_client, lambda user: user.email == member_email)
+        user = cls._get_by_attribute(ado_client, "email", member_email)
         if user is None:
             raise ValueError(f"Member with email {member_email} not found")
         return user
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", name: str) -> "AdoUser | None":
-        return cls._get_by_abstract_filter(ado_client, lambda user: user.display_name == name)
+        return cls._get_by_attribute(ado_client, "display_name", name)
 
     @classmethod
     def get_by_descriptor_id(cls, ado_client: "AdoClient", descriptor_id: str) -> "AdoUser | None":
-        return cls._get_by_abstract_filter(ado_client, lambda user: user.descriptor_id == descriptor_id)
+        return cls._get_by_attribute(ado_client, "descriptor_id", descriptor_id)
 
     @classmethod
     def get_by_origin_id(cls, ado_client: "AdoClient", origin_id: str) -> "AdoUser | None":
-        return cls._get_by_abstract_filter(ado_client, lambda user: user.origin_id == origin_id)
+        return cls._get_by_attribute(ado_client, "origin_id", origin_id)
 
     @classmethod
     def search_by_query(cls, ado_client: "AdoClient", query: str) -> dict[str, str]:
@@ -151,7 +156,7 @@ class AdoUser(StateManagedResource):
 # ======================================================================================================= #
 
 
-@dataclass
+@slotted_dataclass
 class Member(StateManagedResource):
     """A stripped down member class which is often returned by the API, for example in build requests or PRs."""
 
@@ -164,9 +169,9 @@ class Member(StateManagedResource):
         # displayName, uniqueName/mailAddress, id/originId
         # This gets returned slightly differently from different APIs
         return cls(
-            data["displayName"],
-            data.get("uniqueName") or data.get("email") or data.get("mailAddress", "UNKNOWN"),  # type: ignore[arg-type]
-            data.get("id") or data["originId"],
+            intern_string(data["displayName"]),
+            intern_string(data.get("uniqueName") or data.get("email") or data.get("mailAddress", "UNKNOWN")),  # type: ignore[arg-type]
+            intern_string(data.get("id") or data["originId"]),
         )  # fmt: skip
 
 
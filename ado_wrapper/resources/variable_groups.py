@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import quote
 
 from ado_wrapper.resources.users import Member
 from ado_wrapper.state_managed_abc import StateManagedResource
@@ -172,7 +173,11 @@ class VariableGroup(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", name: str) -> "VariableGroup | None":
-        return cls._get_by_abstract_filter(ado_client, lambda variable_group: variable_group.name == name)
+        return cls._get_by_server_side_filter(
+            ado_client,
+            f"/{ado_client.ado_project_name}/_apis/distributedtask/variablegroups?groupName={quote(name, safe='')}&api-version=7.1",
+            "name", name,
+        )  # fmt: skip
 
     @classmethod
     def get_variable_group_contents(cls, ado_client: "AdoClient", variable_group_name: str) -> dict[str, Any]:
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, Generator
+from urllib.parse import quote
 
 from ado_wrapper.state_managed_abc import StateManagedResource
 
@@ -56,7 +57,11 @@ class Wiki(StateManagedResource):
 
     @classmethod
     def get_by_name(cls, ado_client: "AdoClient", name: str) -> "Wiki | None":
-        return cls._get_by_abstract_filter(ado_client, lambda wiki: wiki.wiki_name == name)
+        return cls._get_by_server_side_filter(
+            ado_client,
+            f"https://dev.azure.com/{ado_client.ado_org_name}/{ado_client.ado_project_name}/_apis/wiki/wikis/{quote(name, safe='')}?api-version=7.1",
+            "wiki_name", name, fetch_multiple=False,
+        )  # fmt: skip
 
 
 @dataclass
@@ -1,12 +1,13 @@
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from ado_wrapper.errors import UnknownError
+from ado_wrapper.lazy_resources import LazyFieldDecoders
 from ado_wrapper.state_managed_abc import StateManagedResource
 from ado_wrapper.resources.users import Member
-from ado_wrapper.utils import build_hierarchy_payload, extract_json_from_html
+from ado_wrapper.utils import build_hierarchy_payload, extract_json_from_html, intern_string, slotted_dataclass
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
@@ -19,9 +20,20 @@ DEFAULT_REQUESTED_FIELDS = [
     "System.Tags",  # "Microsoft.VSTS.Common.Priority", "System.WorkItemType","Microsoft.VSTS.Scheduling.StoryPoints",
     # "Microsoft.VSTS.Common.ClosedDate", "Microsoft.VSTS.Common.StackRank", # "Microsoft.VSTS.Common.AcceptanceCriteria",
 ]
+# Which ADO field each attribute comes from, used to only request certain fields
+ATTRIBUTE_TO_REQUESTED_FIELD = {
+    "work_item_id": "System.Id", "title": "System.Title", "description": "System.Description", "area": "System.AreaPath",
+    "iteration_path": "System.IterationPath", "state": "System.State", "reason": "System.Reason", "assigned_to": "System.AssignedTo",
+    "created_by": "System.CreatedBy", "created_datetime": "System.CreatedDate", "changed_by": "System.ChangedBy",
+    "changed_datetime": "System.ChangedDate", "board_column": "System.BoardColumn", "tags": "System.Tags",
+}
 
 
-@dataclass
+def get_optional_member(data: dict[str, Any], field_name: str) -> Member | None:
+    return Member.from_request_payload(data["fields"][field_name]) if data["fields"].get(field_name) else None
+
+
+@slotted_dataclass
 class WorkItem(StateManagedResource):
     """https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/work-items?view=azure-devops-rest-7.1"""
     work_item_id: str = field(metadata={"is_id_field": True})
@@ -39,19 +51,36 @@ class WorkItem(StateManagedResource):
     board_column: str = field(repr=False)
     tags: list[str] = field(default_factory=list, repr=False)
 
+    lazy_field_decoders: ClassVar[LazyFieldDecoders] = {
+        "work_item_id": lambda data: data["id"],
+        "title": lambda data: data["fields"]["System.Title"],
+        "description": lambda data: data["fields"].get("System.Description", ""),
+        "area": lambda data: intern_string(data["fields"]["System.AreaPath"]),
+        "iteration_path": lambda data: intern_string(data["fields"]["System.IterationPath"]),
+        "state": lambda data: intern_string(data["fields"]["System.State"]),
+        "reason": lambda data: intern_string(data["fields"]["System.Reason"]),
+        "board_column": lambda data: intern_string(data["fields"].get("System.BoardColumn", "")),
+        "assigned_to": lambda data: get_optional_member(data, "System.AssignedTo"),
+        "created_by": lambda data: get_optional_member(data, "System.CreatedBy"),
+        "created_datetime": lambda data: datetime.fromisoformat(data["fields"]["System.CreatedDate"]),
+        "changed_by": lambda data: get_optional_member(data, "System.ChangedBy"),
+        "changed_datetime": lambda data: datetime.fromisoformat(data["fields"]["System.ChangedDate"]),
+        "tags": lambda data: [intern_string(tag) for tag in data["fields"].get("System.Tags", "").split(";") if tag],
+    }
+
     @classmethod
     def from_request_payload(cls, data: dict[str, Any]) -> "WorkItem":
         return cls(
             data["id"], data["fields"]["System.Title"], data["fields"].get("System.Description", ""),
-            data["fields"]["System.AreaPath"], data["fields"]["System.IterationPath"],
-            data["fields"]["System.State"], data["fields"]["System.Reason"],
+            intern_string(data["fields"]["System.AreaPath"]), intern_string(data["fields"]["System.IterationPath"]),
+            intern_string(data["fields"]["System.State"]), intern_string(data["fields"]["System.Reason"]),
             Member.from_request_payload(data["fields"].get("System.AssignedTo")) if data["fields"].get("System.AssignedTo") else None,
             Member.from_request_payload(data["fields"].get("System.CreatedBy")) if data["fields"].get("System.CreatedBy") else None,
             datetime.fromisoformat(data["fields"]["System.CreatedDate"]),
             Member.from_request_payload(data["fields"].get("System.ChangedBy")) if data["fields"].get("System.ChangedBy") else None,
             datetime.fromisoformat(data["fields"]["System.ChangedDate"]),
-            data["fields"].get("System.BoardColumn", ""),
-            data["fields"].get("System.Tags", "").split(";") if data["fields"].get("System.Tags") else [],
+            intern_string(data["fields"].get("System.BoardColumn", "")),
+            [intern_string(tag) for tag in data["fields"]["System.Tags"].split(";")] if data["fields"].get("System.Tags") else [],
         )
 
     @classmethod
@@ -62,6 +91,17 @@ class WorkItem(StateManagedResource):
             f"/{ado_client.ado_project_name}/_apis/wit/workitems/{work_item_id}?api-version=7.1"
         )
 
+    @classmethod
+    def _get_by_ids_batch(cls, ado_client: "AdoClient", work_item_ids: list[str]) -> list["WorkItem"]:
+        """Used by get_by_ids(), the "omit" error policy returns null for any ids which don't exist, rather than failing."""
+        request = ado_client.session.post(
+            f"https://dev.azure.com/{ado_client.ado_org_name}/{ado_client.ado_project_name}/_apis/wit/workitemsbatch?api-version=7.1",
+            json={"ids": [int(x) for x in work_item_ids], "errorPolicy": "omit"},
+        )
+        if request.status_code != 200:
+            raise UnknownError(f"Error fetching work items in bulk: {request.status_code}, {request.text}")
+        return [cls.from_request_payload(x) for x in request.json()["value"] if x is not None]
+
     def link(self, ado_client: "AdoClient") -> str:
         board_name = self.area.removeprefix(ado_client.ado_project_name + '\\')
         return f"https://dev.azure.com/{ado_client.ado_org_name}/{ado_client.ado_project_name}/_boards/board/t/{board_name}/Stories/?workitem={self.work_item_id}"
@@ -125,16 +165,23 @@ class WorkItem(StateManagedResource):
         return original + incoming_ids + outgoing_ids  # type: ignore[no-any-return]
 
     @classmethod
-    def get_all_by_board(cls, ado_client: "AdoClient", board_name: str) -> list["WorkItem"]:
+    def get_all_by_board(cls, ado_client: "AdoClient", board_name: str, fields: list[str] | None = None) -> list["WorkItem"]:
+        """If `fields` is passed in (e.g. `["work_item_id", "state"]`), only those fields are requested (without relations),
+        and the rest are None."""
+        cls._validate_fields(fields)
+        if fields is None:
+            payload = {"expand": "relations", "errorPolicy": 2, "fields": DEFAULT_REQUESTED_FIELDS}
+        else:
+            payload = {"errorPolicy": 2, "fields": [ATTRIBUTE_TO_REQUESTED_FIELD[field_name] for field_name in fields]}
         all_work_items = []
         all_ids = cls.get_all_work_item_ids(ado_client, board_name)
         ids_chunked = [all_ids[i:i + 50] for i in range(0, len(all_ids), 50)]
         for chunk in ids_chunked:
             request = ado_client.session.post(
                 f"https://dev.azure.com/{ado_client.ado_org_name}/{ado_client.ado_project_name}/_apis/wit/workitemsbatch?api-version=7.1",
-                json={"ids": chunk, "expand": "relations", "errorPolicy": 2, "fields": DEFAULT_REQUESTED_FIELDS},
+                json={"ids": chunk, **payload},
             )
-            work_items = [cls.from_request_payload(x) for x in request.json()["value"]]
+            work_items = cls._from_request_payloads(ado_client, request.json()["value"], fields)
             all_work_items.extend(work_items)
         return all_work_items
 
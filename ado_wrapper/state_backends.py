@@ -0,0 +1,290 @@
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Generator, Hashable, TypedDict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    import msvcrt
+
+from ado_wrapper.utils import ResourceType, get_resource_variables
+
+STATE_FILE_VERSION = "1.8"
+SQLITE_FILE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+
+class StateFileType(TypedDict):
+    state_file_version: str
+    resources: dict[ResourceType, dict[str, Any]]
+
+
+EMPTY_STATE: StateFileType = {
+    "state_file_version": STATE_FILE_VERSION,
+    "resources": {resource: {} for resource in get_resource_variables()},  # type: ignore[misc]
+}
+
+# A change to one resource in state, keyed by (resource_type, resource_id), the entry is None if it was removed
+StateChangesType = dict[tuple[ResourceType, str], dict[str, Any] | None]
+# What some backends return after writing, the whole state as written and its version (see StateBackend.get_version())
+WrittenStateType = tuple[StateFileType, Hashable] | None
+
+
+@contextmanager
+def file_lock(lock_file_name: str, timeout_seconds: float = 30.0) -> Generator[None, None, None]:
+    """An advisory lock shared between processes (and threads), used around every read-modify-write of the state file."""
+    with open(lock_file_name, "a+b") as lock_file:
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            try:
+                if os.name == "nt":
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)  # pyright: ignore[reportPossiblyUnbound]
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)  # pyright: ignore[reportPossiblyUnbound]
+                break
+            except OSError as exc:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Could not lock {lock_file_name} within {timeout_seconds} seconds") from exc
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)  # pyright: ignore[reportPossiblyUnbound]
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)  # pyright: ignore[reportPossiblyUnbound]
+
+
+def entry_matches(entry: dict[str, Any], project: str | None, organisation: str | None, run_id: str | None) -> bool:
+    metadata = entry["metadata"]
+    return (
+        (project is None or metadata.get("project") == project)
+        and (organisation is None or metadata.get("organisation") == organisation)
+        and (run_id is None or metadata.get("run_id") == run_id)
+    )
+
+
+def apply_changes_to_state(state: StateFileType, changes: StateChangesType) -> None:
+    for (resource_type, resource_id), entry in changes.items():
+        if entry is None:
+            state["resources"].get(resource_type, {}).pop(resource_id, None)
+        else:
+            state["resources"].setdefault(resource_type, {})[resource_id] = entry
+
+
+class StateBackend:
+    """Where the StateManager stores state, subclass this (and pass it into `StateManager(backend=...)`) to store it elsewhere.
+    Each entry in state is `{"data": {...}, "metadata": {...}}`, with an optional "lifecycle-policy".
+    Backends which can filter without loading everything should set `indexed` and override query()."""
+
+    indexed = False
+
+    def load(self) -> StateFileType:
+        """Returns the whole state."""
+        raise NotImplementedError
+
+    def replace_all(self, state: StateFileType) -> WrittenStateType:
+        """Overwrites the whole state. Can return the state as written and its version, so it doesn't need loading again."""
+        raise NotImplementedError
+
+    def apply_changes(self, changes: StateChangesType) -> WrittenStateType:
+        """Writes only the resources which have been added, updated or removed.
+        Can return the whole state as written and its version, so it doesn't need loading again."""
+        raise NotImplementedError
+
+    def get_version(self) -> Hashable | None:
+        """A cheap token which changes whenever the stored state does (e.g. the file's modified time and size),
+        so the StateManager only reloads state once something else has written to it. None means it's unknown."""
+        return None
+
+    def query(self, resource_type: ResourceType | None = None, project: str | None = None, organisation: str | None = None,
+              run_id: str | None = None) -> dict[ResourceType, dict[str, Any]]:  # fmt: skip
+        """Returns {resource_type: {resource_id: entry}} for every entry which matches all of the filters given."""
+        return {
+            current_type: {
+                resource_id: entry for resource_id, entry in resources.items() if entry_matches(entry, project, organisation, run_id)
+            }
+            for current_type, resources in self.load()["resources"].items()
+            if resource_type is None or current_type == resource_type
+        }  # fmt: skip
+
+    def get_entry(self, resource_type: ResourceType, resource_id: str) -> dict[str, Any] | None:
+        """Returns one entry, or None if it isn't in state."""
+        return self.load()["resources"].get(resource_type, {}).get(resource_id)
+
+    def close(self) -> None:
+        pass
+
+
+class JsonFileStateBackend(StateBackend):
+    """The default backend, the whole state is stored as one JSON document (e.g. `main.state`).
+    Many processes can share one state file, writes are done while holding `<state file>.lock`,
+    and changes are merged into the latest version of the file, rather than overwriting it."""
+
+    def __init__(self, state_file_name: str) -> None:
+        self.state_file_name = state_file_name
+        self.lock_file_name = f"{state_file_name}.lock"
+        with file_lock(self.lock_file_name):
+            if not Path(state_file_name).exists():
+                self.write(copy.deepcopy(EMPTY_STATE))
+
+    def load(self) -> StateFileType:
+        with open(self.state_file_name, encoding="utf-8") as state_file:
+            try:
+                return json.load(state_file)  # type: ignore[no-any-return]
+            except json.JSONDecodeError as exc:
+                raise TypeError("State file is not valid JSON, it might have been corrupted?") from exc
+
+    def write(self, state: StateFileType) -> WrittenStateType:
+        """Writes to a temporary file, then renames it over the state file, so the state file is never half written."""
+        temporary_file_name = f"{self.state_file_name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_file_name, "w", encoding="utf-8") as state_file:
+            json.dump(state, state_file, indent=4)
+        os.replace(temporary_file_name, self.state_file_name)
+        return state, self.get_version()  # Still holding the lock, so this is the version we wrote
+
+    def replace_all(self, state: StateFileType) -> WrittenStateType:
+        with file_lock(self.lock_file_name):
+            return self.write(state)
+
+    def apply_changes(self, changes: StateChangesType) -> WrittenStateType:
+        with file_lock(self.lock_file_name):  # Another process may have written since we last read
+            state = self.load()
+            apply_changes_to_state(state, changes)
+            return self.write(state)
+
+    def get_version(self) -> Hashable | None:
+        try:
+            stat = os.stat(self.state_file_name)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino  # The file is replaced on every write, so the inode changes too
+
+
+class SqliteStateBackend(StateBackend):
+    """Stores each resource as a row, indexed by resource type, id, project, organisation and run_id,
+    so changes are single row upserts, and filtering doesn't need to load the whole state.
+    Used automatically when the state file name ends in .db, .sqlite or .sqlite3."""
+
+    indexed = True
+
+    def __init__(self, state_file_name: str) -> None:
+        self.state_file_name = state_file_name
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(state_file_name, check_same_thread=False, isolation_level=None)
+        with self.lock:
+            # WAL lets other processes read while one is writing, and busy_timeout makes writers wait for each other
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA busy_timeout=30000")
+            self.connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS state_info (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS resources (
+                    resource_type TEXT NOT NULL, resource_id TEXT NOT NULL, data TEXT NOT NULL, metadata TEXT NOT NULL,
+                    lifecycle_policy TEXT, project TEXT, organisation TEXT, run_id TEXT,
+                    PRIMARY KEY (resource_type, resource_id)
+                );
+                CREATE INDEX IF NOT EXISTS resources_project ON resources (project);
+                CREATE INDEX IF NOT EXISTS resources_organisation ON resources (organisation);
+                CREATE INDEX IF NOT EXISTS resources_run_id ON resources (run_id);
+                """
+            )
+            self.connection.execute(
+                "INSERT OR IGNORE INTO state_info (key, value) VALUES ('state_file_version', ?)", (STATE_FILE_VERSION,)
+            )
+
+    @staticmethod
+    def row_to_entry(data: str, metadata: str, lifecycle_policy: str | None) -> dict[str, Any]:
+        entry = {"data": json.loads(data), "metadata": json.loads(metadata)}
+        if lifecycle_policy is not None:
+            entry["lifecycle-policy"] = lifecycle_policy
+        return entry
+
+    def write_changes(self, changes: StateChangesType) -> None:
+        """Must be called inside of a transaction."""
+        for (resource_type, resource_id), entry in changes.items():
+            if entry is None:
+                self.connection.execute("DELETE FROM resources WHERE resource_type = ? AND resource_id = ?", (resource_type, resource_id))
+                continue
+            metadata = entry["metadata"]
+            self.connection.execute(
+                "INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (resource_type, resource_id, json.dumps(entry["data"]), json.dumps(metadata), entry.get("lifecycle-policy"),
+                 metadata.get("project"), metadata.get("organisation"), metadata.get("run_id")),  # fmt: skip
+            )
+
+    def load(self) -> StateFileType:
+        state: StateFileType = copy.deepcopy(EMPTY_STATE)
+        with self.lock:
+            rows = self.connection.execute("SELECT resource_type, resource_id, data, metadata, lifecycle_policy FROM resources").fetchall()
+        for resource_type, resource_id, data, metadata, lifecycle_policy in rows:
+            state["resources"].setdefault(resource_type, {})[resource_id] = self.row_to_entry(data, metadata, lifecycle_policy)
+        return state
+
+    def replace_all(self, state: StateFileType) -> None:
+        changes: StateChangesType = {
+            (resource_type, resource_id): entry
+            for resource_type, resources in state["resources"].items() for resource_id, entry in resources.items()
+        }  # fmt: skip
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                self.connection.execute("DELETE FROM resources")
+                self.write_changes(changes)
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def apply_changes(self, changes: StateChangesType) -> None:
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                self.write_changes(changes)
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def query(self, resource_type: ResourceType | None = None, project: str | None = None, organisation: str | None = None,
+              run_id: str | None = None) -> dict[ResourceType, dict[str, Any]]:  # fmt: skip
+        filters = {"resource_type": resource_type, "project": project, "organisation": organisation, "run_id": run_id}
+        used_filters = {column: value for column, value in filters.items() if value is not None}
+        where_clause = " AND ".join(f"{column} = ?" for column in used_filters) or "1 = 1"  # Column names are from the dict above
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT resource_type, resource_id, data, metadata, lifecycle_policy FROM resources WHERE {where_clause}",  # nosec B608
+                tuple(used_filters.values()),
+            ).fetchall()
+        results: dict[ResourceType, dict[str, Any]] = {resource_type: {}} if resource_type is not None else {}
+        for row_resource_type, resource_id, data, metadata, lifecycle_policy in rows:
+            results.setdefault(row_resource_type, {})[resource_id] = self.row_to_entry(data, metadata, lifecycle_policy)
+        return results
+
+    def get_entry(self, resource_type: ResourceType, resource_id: str) -> dict[str, Any] | None:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data, metadata, lifecycle_policy FROM resources WHERE resource_type = ? AND resource_id = ?",
+                (resource_type, resource_id),
+            ).fetchone()
+        return self.row_to_entry(*row) if row is not None else None
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+def get_state_backend(state_file_name: str | None) -> StateBackend | None:
+    """Picks the backend based on the state file's extension, None means state is only stored in memory."""
+    if state_file_name is None:
+        return None
+    if state_file_name.endswith(SQLITE_FILE_EXTENSIONS):
+        return SqliteStateBackend(state_file_name)
+    return JsonFileStateBackend(state_file_name)
@@ -1,66 +1,123 @@
+import itertools
 import json
-from dataclasses import dataclass, fields
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Literal, Type, TypeVar, overload
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generator, Iterator, Literal, Type, TypeVar, overload
 
+from ado_wrapper.collection_cache import CachedCollection
 from ado_wrapper.errors import (
-    DeletionFailed, ResourceAlreadyExists, ResourceNotFound, UnknownError, UpdateFailed, InvalidPermissionsError
+    ConfigurationError, DeletionFailed, ResourceAlreadyExists, ResourceNotFound, UnknownError, UpdateFailed, InvalidPermissionsError
+)  # fmt: skip
+from ado_wrapper.lazy_resources import LazyFieldDecoders, LazyResource, materialise
+from ado_wrapper.utils import (
+    extract_id, get_internal_field_names, get_resource_fields_info, get_resource_variables, iter_from_pages  # , get_editable_fields
 )  # fmt: skip
-from ado_wrapper.utils import extract_id, get_internal_field_names, get_resource_variables  # , get_editable_fields
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
 
 T = TypeVar("T", bound="StateManagedResource")
 
+BATCH_FETCH_CHUNK_SIZE = 100  # Kept small enough that the ids still fit in a url
+
+
+# How each type of value gets converted to JSON, resolved the first time that type is seen, rather than for every value
+JSON_CONVERTERS: dict[type, Callable[[str, Any], tuple[str, Any]]] = {}
+# What each key in JSON turns into, (attribute name, decoder), also resolved the first time each key is seen
+KEY_DECODERS: dict[str, tuple[str, Callable[[Any], Any] | None]] = {}
+
 
-def recursively_convert_to_json(attribute_name: str, attribute_value: Any) -> tuple[str, Any]:  # pylint: disable=too-many-return-statements
-    if isinstance(attribute_value, dict):
-        return attribute_name, {key: recursively_convert_to_json("", value)[1] for key, value in attribute_value.items()}
-    if isinstance(attribute_value, list):
-        if attribute_value:
-            list_type = attribute_value[0].__class__.__name__
-            if list_type in get_resource_variables():  # Custom variables, do special things to be able to convert.
-                return f"{attribute_name}::list[{list_type}]", [recursively_convert_to_json(attribute_name, value)[1] for value in attribute_value]  # fmt: skip
-            return attribute_name, [recursively_convert_to_json(attribute_name, value)[1] for value in attribute_value]
+def convert_dict_to_json(attribute_name: str, attribute_value: dict[Any, Any]) -> tuple[str, Any]:
+    return attribute_name, {key: get_json_converter(type(value))("", value)[1] for key, value in attribute_value.items()}
+
+
+def convert_list_to_json(attribute_name: str, attribute_value: list[Any]) -> tuple[str, Any]:
+    if not attribute_value:
         return attribute_name, []
-    if isinstance(attribute_value, datetime):
-        return f"{attribute_name}::datetime", attribute_value.isoformat()
-    if type(attribute_value) in get_resource_variables().values():
-        class_name = str(type(attribute_value)).rsplit(".", maxsplit=1)[-1].removesuffix("'>")
-        return attribute_name + "::" + class_name, attribute_value.to_json()
-    return attribute_name, str(attribute_value)
+    converted = [get_json_converter(type(value))(attribute_name, value)[1] for value in attribute_value]
+    list_type = attribute_value[0].__class__.__name__
+    if list_type in get_resource_variables():  # Custom variables, do special things to be able to convert.
+        return f"{attribute_name}::list[{list_type}]", converted
+    return attribute_name, converted
+
+
+def build_json_converter(value_type: type) -> Callable[[str, Any], tuple[str, Any]]:
+    if issubclass(value_type, dict):
+        return convert_dict_to_json
+    if issubclass(value_type, list):
+        return convert_list_to_json
+    if issubclass(value_type, datetime):
+        return lambda attribute_name, attribute_value: (f"{attribute_name}::datetime", attribute_value.isoformat())
+    if issubclass(value_type, LazyResource):
+        return lambda attribute_name, attribute_value: recursively_convert_to_json(attribute_name, materialise(attribute_value))
+    if value_type in get_resource_variables().values():
+        suffix = f"::{value_type.__name__}"
+        return lambda attribute_name, attribute_value: (attribute_name + suffix, attribute_value.to_json())
+    return lambda attribute_name, attribute_value: (attribute_name, str(attribute_value))
+
+
+def get_json_converter(value_type: type) -> Callable[[str, Any], tuple[str, Any]]:
+    converter = JSON_CONVERTERS.get(value_type)
+    if converter is None:
+        converter = JSON_CONVERTERS[value_type] = build_json_converter(value_type)
+    return converter
+
+
+def recursively_convert_to_json(attribute_name: str, attribute_value: Any) -> tuple[str, Any]:
+    return get_json_converter(type(attribute_value))(attribute_name, attribute_value)
+
+
+def build_key_decoder(key: str) -> tuple[str, Callable[[Any], Any] | None]:
+    if key.endswith("::datetime"):
+        return key.split("::")[0], datetime.fromisoformat
+    data_type = key.split("::")[-1]
+    if len(key.split("::")) != 2:  # Not a custom type
+        return key, None
+    instance_name = key.removesuffix("::" + data_type)
+    if data_type.startswith("list["):
+        list_class = get_resource_variables()[data_type.removeprefix("list[").removesuffix("]")]
+        return instance_name, lambda value: [list_class.from_json(x) for x in value]
+    return instance_name, get_resource_variables()[data_type].from_json
 
 
 def convert_from_json(dictionary: dict[str, Any]) -> Any:
-    data_copy = dict(dictionary.items())  # Deep copy
+    data_copy = {}
     for key, value in dictionary.items():  # For each attribute
-        if key.endswith("::datetime"):
-            del data_copy[key]
-            data_copy[key.split("::")[0]] = datetime.fromisoformat(value)
-            continue
-        data_type = key.split("::")[-1]
-        custom_type = len(key.split("::")) == 2
-        is_list_of = data_type.startswith("list[")
-        if custom_type:
-            instance_name = key.removesuffix("::" + data_type)
-            if is_list_of:
-                data_type = data_type.removeprefix("list[").removesuffix("]")
-                class_ = get_resource_variables()[data_type]
-                del data_copy[key]
-                data_copy[instance_name] = [class_.from_json(x) for x in value]
-                continue
-            class_ = get_resource_variables()[data_type]
-            del data_copy[key]
-            data_copy[instance_name] = class_.from_json(value)
+        key_decoder = KEY_DECODERS.get(key)
+        if key_decoder is None:
+            key_decoder = KEY_DECODERS[key] = build_key_decoder(key)
+        instance_name, decoder = key_decoder
+        data_copy[instance_name] = value if decoder is None else decoder(value)
     return data_copy
 
 
+@cache
+def get_serializer(cls: "Type[StateManagedResource]") -> "Callable[[StateManagedResource], dict[str, Any]]":
+    """Builds (once per class) the function which converts an instance into JSON for state."""
+    field_names = get_resource_fields_info(cls).field_names
+
+    def serialize(resource: "StateManagedResource") -> dict[str, Any]:
+        data = {}
+        for field_name in field_names:
+            attribute_value = getattr(resource, field_name)
+            key, value = get_json_converter(type(attribute_value))(field_name, attribute_value)
+            data[key] = value
+        return data
+
+    return serialize
+
+
 # ==========================================================================================
 
 
 @dataclass
 class StateManagedResource:
+    __slots__ = ()  # So subclasses can be slotted, see slotted_dataclass
+    lazy_field_decoders: ClassVar[LazyFieldDecoders] = {}  # Fields which a LazyResource can decode on their own
+
     @classmethod
     def from_request_payload(cls: Type[T], data: dict[str, Any]) -> T:
         raise NotImplementedError
@@ -70,10 +127,39 @@ class StateManagedResource:
         return cls(**convert_from_json(data))
 
     def to_json(self) -> dict[str, Any]:
-        attribute_names = [field_obj.name for field_obj in fields(self)]
-        attribute_values = [getattr(self, field_obj.name) for field_obj in fields(self)]
-        combined = zip(attribute_names, attribute_values)
-        return dict(recursively_convert_to_json(attribute_name, attribute_value) for attribute_name, attribute_value in combined)
+        return get_serializer(self.__class__)(self)
+
+    @classmethod
+    def _from_request_payloads(
+        cls: Type[T], ado_client: "AdoClient", payloads: list[dict[str, Any]], fields: list[str] | None = None
+    ) -> list[T]:  # fmt: skip
+        """Used when listing, inside of `ado_client.lazy_resources()` this returns LazyResources, which only decode fields when used.
+        If `fields` is passed in, this returns partial resources instead, see `_from_partial_request_payload()`."""
+        if fields is not None:
+            return [cls._from_partial_request_payload(payload, fields) for payload in payloads]
+        if ado_client.use_lazy_resources:
+            return [LazyResource(cls, payload) for payload in payloads]  # type: ignore[misc]
+        return [cls.from_request_payload(payload) for payload in payloads]
+
+    @classmethod
+    def _validate_fields(cls: Type[T], fields: list[str] | None) -> None:
+        """Checks every field passed in as `fields=` to a listing can be decoded on its own, i.e. has a `lazy_field_decoders` entry."""
+        if fields is None:
+            return
+        unknown_fields = [field_name for field_name in fields if field_name not in cls.lazy_field_decoders]
+        if unknown_fields:
+            raise ConfigurationError(
+                f"{cls.__name__} can't fetch only {unknown_fields}, the fields which can be are: {list(cls.lazy_field_decoders)}"
+            )
+
+    @classmethod
+    def _from_partial_request_payload(cls: Type[T], data: dict[str, Any], fields: list[str]) -> T:
+        """Creates a resource with only `fields` decoded (using `lazy_field_decoders`), every other field is set to None.
+        Partial resources are only for reading, they shouldn't be updated or written to state."""
+        resource = object.__new__(cls)
+        for field_name in get_resource_fields_info(cls).field_names:
+            object.__setattr__(resource, field_name, cls.lazy_field_decoders[field_name](data) if field_name in fields else None)
+        return resource
 
     # ==============================================================================================================================
 
@@ -84,11 +170,13 @@ class StateManagedResource:
 
     @classmethod
     @overload
-    def _get_by_url(cls: Type[T], ado_client: "AdoClient", url: str, fetch_multiple: bool) -> list[T]:
+    def _get_by_url(cls: Type[T], ado_client: "AdoClient", url: str, fetch_multiple: bool, fields: list[str] | None = None) -> list[T]:
         ...
 
     @classmethod
-    def _get_by_url(cls: Type[T], ado_client: "AdoClient", url: str, fetch_multiple: bool = False) -> T | list[T]:
+    def _get_by_url(
+        cls: Type[T], ado_client: "AdoClient", url: str, fetch_multiple: bool = False, fields: list[str] | None = None
+    ) -> T | list[T]:  # fmt: skip
         if not url.startswith("https://"):
             url = f"https://dev.azure.com/{ado_client.ado_org_name}{url}"
         request = ado_client.session.get(url)
@@ -101,11 +189,50 @@ class StateManagedResource:
         if request.text == "":
             raise UnknownError(f"Error fetching {cls.__name__}, unknown error.")
         if fetch_multiple:
-            return [cls.from_request_payload(resource) for resource in request.json()["value"]]
+            return cls._from_request_payloads(ado_client, request.json()["value"], fields)
         if "value" in request.json():
             return cls.from_request_payload(request.json()["value"][0])
         return cls.from_request_payload(request.json())
 
+    @classmethod
+    def get_by_ids(
+        cls: Type[T], ado_client: "AdoClient", resource_ids: list[str], max_workers: int = 8
+    ) -> tuple[list[T | None], dict[str, Exception]]:  # fmt: skip
+        """Fetches many resources at once. Resources with a batch endpoint define `_get_by_ids_batch`, which gets called
+        per chunk of ids, otherwise we fan out `get_by_id` calls over `max_workers` threads.\n
+        Returns the resources in the same order as the ids (with None for any which failed), and a mapping of id -> error."""
+        resource_ids = [str(resource_id) for resource_id in resource_ids]
+        fetched: dict[str, T] = {}
+        errors: dict[str, Exception] = {}
+
+        def fetch_chunk(chunk: list[str]) -> None:
+            try:
+                resources = cls._get_by_ids_batch(ado_client, chunk)  # type: ignore[attr-defined]  # pylint: disable=no-member
+            except Exception as exc:  # Rather than failing every other chunk, mark this chunk's ids as failed
+                errors.update({resource_id: exc for resource_id in chunk})
+                return
+            fetched.update({extract_id(resource): resource for resource in resources})
+
+        def fetch_one(resource_id: str) -> None:
+            try:
+                fetched[resource_id] = cls.get_by_id(ado_client, resource_id)  # type: ignore[attr-defined]  # pylint: disable=no-member
+            except Exception as exc:
+                errors[resource_id] = exc
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, initializer=setattr,  # lazy_resources() is per thread, so pass it on to the pool's threads
+            initargs=(ado_client, "use_lazy_resources", ado_client.use_lazy_resources),
+        ) as executor:
+            if hasattr(cls, "_get_by_ids_batch"):
+                chunks = [resource_ids[i:i + BATCH_FETCH_CHUNK_SIZE] for i in range(0, len(resource_ids), BATCH_FETCH_CHUNK_SIZE)]
+                list(executor.map(fetch_chunk, chunks))
+            else:
+                list(executor.map(fetch_one, dict.fromkeys(resource_ids)))  # dict.fromkeys() removes duplicates, keeping the order
+        for resource_id in resource_ids:
+            if resource_id not in fetched and resource_id not in errors:
+                errors[resource_id] = ResourceNotFound(f"No {cls.__name__} found with id {resource_id}!")
+        return [fetched.get(resource_id) for resource_id in resource_ids], errors
+
     # ==============================================================================================================================
 
     @classmethod
@@ -129,6 +256,7 @@ class StateManagedResource:
             except json.JSONDecodeError:
                 pass
             raise ValueError(f"Error creating {cls.__name__}: {request.status_code} - {request.text}")
+        ado_client.collection_cache.invalidate(cls)
         resource = cls.from_request_payload(request.json())
         if refetch:
             resource = cls.get_by_id(ado_client, extract_id(resource))  # type: ignore[attr-defined] # pylint: disable=no-member
@@ -141,6 +269,7 @@ class StateManagedResource:
         if not url.startswith("https://"):
             url = f"https://dev.azure.com/{ado_client.ado_org_name}{url}"
         request = ado_client.session.delete(url)
+        ado_client.collection_cache.invalidate(cls)  # Even failed deletions sometimes delete
         if request.status_code not in [200, 204]:
             if request.status_code == 404:
                 if not ado_client.suppress_warnings:
@@ -168,6 +297,7 @@ class StateManagedResource:
             raise UpdateFailed(
                 f"Failed to update {self.__class__.__name__} with id {extract_id(self)} and attribute {attribute_name} to {attribute_value}. \nReason:\n{request.text}"
             )
+        ado_client.collection_cache.invalidate(self.__class__)
         setattr(self, attribute_name, attribute_value)
         ado_client.state_manager.update_resource_in_state(self.__class__.__name__, extract_id(self), self.to_json())  # type: ignore[arg-type]
 
@@ -177,49 +307,135 @@ class StateManagedResource:
     # ==============================================================================================================================
 
     @classmethod
-    def _get_all_paginated(
-        cls: Type[T], ado_client: "AdoClient", url: str, limit: int | None = None,
-        page_size: int = 1000, skip_parameter_name: str = "$skip",  # fmt: skip
-    ) -> list[T]:
-        """Gets all resources for a url, paginated"""
-        fetched_resources: list[T] = []
-        skip_amount = 0
-        while True:
-            resources = cls._get_by_url(ado_client, url + f"&{skip_parameter_name}={skip_amount}", fetch_multiple=True)
-            if len(resources) < page_size:  # If we fetch none, or less than the whole page, we're done.
-                fetched_resources.extend(resources)
-                return fetched_resources
-            for resource in resources:
-                if limit is not None and len(fetched_resources) >= limit:
-                    return fetched_resources
-                fetched_resources.append(resource)
-            skip_amount += page_size
+    def iter_pages(cls: Type[T], ado_client: "AdoClient") -> Iterator[list[T]]:
+        """Yields each page of resources as it arrives. Resources which can't be streamed yield all of `get_all()` as one page."""
+        yield cls.get_all(ado_client)  # type: ignore[attr-defined]  # pylint: disable=no-value-for-parameter, no-member
 
     @classmethod
-    def _get_all_with_continuation_token(cls: Type[T], ado_client: "AdoClient", url: str) -> list[T]:
-        """Gets all resources for a url, paginated using continuation_tokens"""
+    def iter_all(
+        cls: Type[T], ado_client: "AdoClient", limit: int | None = None, predicate: Callable[[T], bool] | None = None
+    ) -> Iterator[T]:  # fmt: skip
+        """Yields resources (which match the predicate, if passed in) as each page arrives, no more pages are requested
+        once `limit` resources have been yielded, or once you stop iterating."""
+        return iter_from_pages(cls.iter_pages(ado_client), limit, predicate)
+
+    @classmethod
+    def _iter_pages_paginated(
+        cls: Type[T], ado_client: "AdoClient", url: str, page_size: int = 1000, skip_parameter_name: str = "$skip",
+        prefetch_pages: int = 4, limit: int | None = None, fields: list[str] | None = None,
+    ) -> Iterator[list[T]]:  # fmt: skip
+        """Yields each page of resources for a url, paginated using `$skip` (or `skip_parameter_name`), in order.
+        As the offsets are known up front, once the first page comes back full, up to `prefetch_pages` pages are requested at once,
+        any still in flight when a short (last) page arrives are cancelled. Pages past `limit` resources are never requested.\n
+        The first page is fetched in this thread, and a thread pool (owned by this call) is only started once it comes back full,
+        so listings which fit in one page (or `prefetch_pages=1`) never start any threads."""
+        skip_amounts = iter(range(0, limit, page_size)) if limit is not None else itertools.count(0, page_size)
+
+        def get_page(skip_amount: int) -> list[T]:
+            page_url = url + f"&{skip_parameter_name}={skip_amount}"
+            return cls._get_by_url(ado_client, page_url, fetch_multiple=True, fields=fields)  # type: ignore[arg-type, return-value]
+
+        def prefetched_pages() -> Generator[list[T], None, None]:
+            executor = ThreadPoolExecutor(
+                max_workers=prefetch_pages, thread_name_prefix="ado_wrapper", initializer=setattr,  # Pass on lazy_resources()
+                initargs=(ado_client, "use_lazy_resources", ado_client.use_lazy_resources),
+            )
+            in_flight: deque[Future[list[T]]] = deque()
+            try:
+                while True:
+                    while len(in_flight) < prefetch_pages and (skip_amount := next(skip_amounts, None)) is not None:
+                        in_flight.append(executor.submit(get_page, skip_amount))
+                    if not in_flight:
+                        return
+                    yield in_flight.popleft().result()
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        later_pages = prefetched_pages() if prefetch_pages > 1 else map(get_page, skip_amounts)
+        try:
+            # The first page is requested on its own, later pages are only started once it comes back full
+            for resources in itertools.chain(map(get_page, itertools.islice(skip_amounts, 1)), later_pages):
+                if resources:
+                    yield resources
+                if len(resources) < page_size:  # If we fetch none, or less than the whole page, we're done.
+                    return
+        finally:
+            if isinstance(later_pages, Generator):
+                later_pages.close()  # Cancels any pages still in flight
+
+    @classmethod
+    def _iter_pages_with_continuation_token(
+        cls: Type[T], ado_client: "AdoClient", url: str, fields: list[str] | None = None
+    ) -> Iterator[list[T]]:  # fmt: skip
+        """Yields each page of resources for a url, paginated using continuation_tokens"""
         if not url.startswith("https://"):
             url = f"https://dev.azure.com/{ado_client.ado_org_name}{url}"
-        fetched_resources: list[T] = []
         continuation_token = None
         while True:
             request = ado_client.session.get(url + (f"&continuationToken={continuation_token}" if continuation_token is not None else ""))
             if request.status_code >= 300:
                 raise ValueError(f"Error getting all {cls.__name__} paginated: {request.status_code}, error={request.text}")
             continuation_token = request.headers.get("X-MS-ContinuationToken")
-            resources = [cls.from_request_payload(resource) for resource in request.json()["value"]]
-            fetched_resources.extend(resources)
+            yield cls._from_request_payloads(ado_client, request.json()["value"], fields)
             if continuation_token is None:
-                return fetched_resources
+                return
+
+    @classmethod
+    def _get_all_paginated(
+        cls: Type[T], ado_client: "AdoClient", url: str, limit: int | None = None,
+        page_size: int = 1000, skip_parameter_name: str = "$skip", prefetch_pages: int = 4,  # fmt: skip
+    ) -> list[T]:
+        """Gets all resources for a url, paginated, requesting up to `prefetch_pages` pages at once."""
+        pages = cls._iter_pages_paginated(ado_client, url, page_size, skip_parameter_name, prefetch_pages, limit)
+        return list(iter_from_pages(pages, limit))
+
+    @classmethod
+    def _get_all_with_continuation_token(cls: Type[T], ado_client: "AdoClient", url: str) -> list[T]:
+        """Gets all resources for a url, paginated using continuation_tokens"""
+        return list(iter_from_pages(cls._iter_pages_with_continuation_token(ado_client, url)))
+
+    @classmethod
+    def _get_cached_collection(cls: Type[T], ado_client: "AdoClient") -> CachedCollection:
+        """The whole `get_all()` collection, from the client's collection cache."""
+        def fetch() -> list[T]:
+            return cls.get_all(ado_client)  # type: ignore[attr-defined, no-any-return]  # pylint: disable=no-value-for-parameter, no-member
+
+        return ado_client.collection_cache.get_collection((cls, ado_client.ado_org_name, ado_client.ado_project_name), fetch)
 
     @classmethod
     def _get_by_abstract_filter(cls: Type[T], ado_client: "AdoClient", func: Callable[[T], bool]) -> T | None:
-        """Used internally for getting resources by a filter function. The function should return True if the resource is the one you want."""
-        resources = cls.get_all(ado_client)  # type: ignore[attr-defined]  # pylint: disable=no-value-for-parameter, no-member
-        for resource in resources:
-            if func(resource):
-                return resource  # type: ignore[no-any-return]
-        return None
+        """Used internally for getting resources by a filter function. The function should return True if the resource is the one you want.
+        Uses the cached collection if there is one, but never fetches the whole collection just to cache it."""
+        collection = ado_client.collection_cache.peek((cls, ado_client.ado_org_name, ado_client.ado_project_name))
+        if collection is None:
+            return next(cls.iter_all(ado_client, limit=1, predicate=func), None)  # Stops fetching pages once it's found
+        return next((resource for resource in collection.resources if func(resource)), None)
+
+    @classmethod
+    def _get_by_attribute(cls: Type[T], ado_client: "AdoClient", attribute_name: str, attribute_value: Any) -> T | None:
+        """The same as `_get_by_abstract_filter(lambda x: x.<attribute_name> == attribute_value)`, but once the collection is cached,
+        this is a dictionary lookup, rather than checking every resource."""
+        if not ado_client.collection_cache.enabled:
+            return cls._get_by_abstract_filter(ado_client, lambda resource: getattr(resource, attribute_name) == attribute_value)
+        collection = cls._get_cached_collection(ado_client)
+        return ado_client.collection_cache.get_index(collection, attribute_name).get(attribute_value)  # type: ignore[no-any-return]
+
+    @classmethod
+    def _get_by_server_side_filter(cls: Type[T], ado_client: "AdoClient", url: str, attribute_name: str, attribute_value: Any,
+                                   fetch_multiple: bool = True, use_cached_collection: bool = True) -> T | None:  # fmt: skip
+        """For `get_by_name()` style lookups where ADO can filter (or look the resource up by name) for us, so only matches get sent.
+        ADO's filters are case insensitive (and some match prefixes), so this still checks for an exact match.
+        If the whole collection is already cached, that gets used instead, as it doesn't need a request. Collections are cached per
+        project, so resources scoped below the project (e.g. per repo) should pass `use_cached_collection=False`."""
+        cache_key = (cls, ado_client.ado_org_name, ado_client.ado_project_name)
+        collection = ado_client.collection_cache.peek(cache_key) if use_cached_collection else None
+        if collection is not None:
+            return ado_client.collection_cache.get_index(collection, attribute_name).get(attribute_value)  # type: ignore[no-any-return]
+        try:
+            resources = cls._get_by_url(ado_client, url, fetch_multiple=True) if fetch_multiple else [cls._get_by_url(ado_client, url)]
+        except ResourceNotFound:
+            return None
+        return next((resource for resource in resources if getattr(resource, attribute_name) == attribute_value), None)
 
     # ==============================================================================================================================
 
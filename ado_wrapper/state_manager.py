@@ -1,135 +1,411 @@
+import atexit
+import copy
+import hashlib
 import json
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, TypedDict
+from typing import TYPE_CHECKING, Any, Generator, Hashable, Literal
 from uuid import uuid4
 
 from ado_wrapper.utils import ResourceType, get_resource_variables, extract_id
 from ado_wrapper.errors import DeletionFailed
+from ado_wrapper.state_backends import (  # noqa: F401 (StateFileType & EMPTY_STATE used to live here)
+    EMPTY_STATE, STATE_FILE_VERSION, StateBackend, StateChangesType, StateFileType, WrittenStateType, apply_changes_to_state,
+    entry_matches, get_state_backend,
+)  # fmt: skip
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
     from ado_wrapper.state_managed_abc import StateManagedResource
 
-STATE_FILE_VERSION = "1.8"
 
+DeletionOutcome = Literal["deleted", "failed", "not_deletable"]
 
-class StateFileType(TypedDict):
-    state_file_version: str
-    resources: dict[ResourceType, dict[str, Any]]
+# Resources are deleted one tier at a time, types which aren't listed are deleted with the branches/PRs
+DELETION_TIERS: list[tuple[ResourceType, ...]] = [
+    ("Run", "Build", "Release"),
+    ("BuildDefinition", "HierarchyCreatedBuildDefinition", "ReleaseDefinition"),
+    ("Branch", "PullRequest", "PullRequestCommentThread", "AnnotatedTag"),
+    ("Repo",),
+    ("Project",),
+]
 
 
-EMPTY_STATE: StateFileType = {
-    "state_file_version": STATE_FILE_VERSION,
-    "resources": {resource: {} for resource in get_resource_variables()},  # type: ignore[misc]
-}
+# Every StateManager, so they can all be flushed by one exit hook, rather than each registering (and being kept alive by) their own
+STATE_MANAGERS: "weakref.WeakSet[StateManager]" = weakref.WeakSet()
+
+
+def flush_all_state_managers() -> None:
+    for state_manager in list(STATE_MANAGERS):
+        state_manager.flush()
+
+
+atexit.register(flush_all_state_managers)
+
+
+def get_content_hash(data: dict[str, Any]) -> str:
+    """Used to cheaply check whether a resource has changed since it was put into state."""
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode(), usedforsecurity=False).hexdigest()
+
+
+def get_deletion_tier(resource_type: ResourceType) -> int:
+    for index, tier in enumerate(DELETION_TIERS):
+        if resource_type in tier:
+            return index
+    return 2
+
+
+@dataclass
+class DeletionReport:
+    deleted: list[tuple[ResourceType, str]] = field(default_factory=list)
+    failed: dict[tuple[ResourceType, str], str] = field(default_factory=dict)
+    not_deletable: list[tuple[ResourceType, str]] = field(default_factory=list)
+    skipped_other_project: int = 0
+
+    def __str__(self) -> str:
+        lines = [
+            f"[ADO_WRAPPER] Deleted {len(self.deleted)} resources, {len(self.failed)} failed, {len(self.not_deletable)} can't be deleted"
+            + (f", skipped {self.skipped_other_project} from other projects" if self.skipped_other_project else "")
+        ]
+        lines += [f"____Failed to delete {resource_type} ({resource_id}): {error}"
+                  for (resource_type, resource_id), error in self.failed.items()]  # fmt: skip
+        lines += [f"____Cannot delete {resource_type} ({resource_id}), please delete this manually or using code"
+                  for resource_type, resource_id in self.not_deletable]  # fmt: skip
+        return "\n".join(lines)
+
+
+@dataclass
+class RefreshReport:
+    changed: list[tuple[ResourceType, str]] = field(default_factory=list)
+    unchanged: list[tuple[ResourceType, str]] = field(default_factory=list)
+    failed: dict[tuple[ResourceType, str], str] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        lines = [
+            f"[ADO_WRAPPER] Refreshed {len(self.changed) + len(self.unchanged)} resources, {len(self.changed)} changed,"
+            + f" {len(self.failed)} couldn't be fetched (and were left as they are in state)"
+        ]
+        failed_by_type: dict[ResourceType, list[str]] = {}
+        for (resource_type, resource_id), error in self.failed.items():
+            failed_by_type.setdefault(resource_type, []).append(f"{resource_id}: {error}")
+        lines += [f"____Couldn't fetch {len(errors)} {resource_type}(s), e.g. {errors[0]}"
+                  for resource_type, errors in failed_by_type.items()]  # fmt: skip
+        return "\n".join(lines)
 
 
 class StateManager:
-    def __init__(self, ado_client: "AdoClient", state_file_name: str | None = "main.state") -> None:
+    def __init__(self, ado_client: "AdoClient", state_file_name: str | None = "main.state",
+                 flush_every_n_mutations: int | None = None, flush_interval_seconds: float | None = 1.0,
+                 backend: StateBackend | None = None) -> None:  # fmt: skip
+        """Changes to state are kept in memory, and only written to the backend when flushed, which happens on exit,
+        every `flush_every_n_mutations` changes and/or `flush_interval_seconds` after the first unwritten change
+        (on a background timer, so it doesn't wait for another change).
+        Use `with state_manager.transaction():` to batch many changes into one write.\n
+        The backend is picked from the state file name (SQLite for .db/.sqlite/.sqlite3, JSON otherwise),
+        or can be passed in directly, see StateBackend."""
         self.ado_client = ado_client
         self.state_file_name = state_file_name
         self.run_id = str(uuid4())
+        self.flush_every_n_mutations = flush_every_n_mutations
+        self.flush_interval_seconds = flush_interval_seconds
+        self.backend = backend if backend is not None else get_state_backend(state_file_name)
+
+        self.lock = threading.RLock()
+        self.pending_changes: StateChangesType = {}
+        self.pending_full_rewrite = False
+        self.mutations_since_flush = 0
+        self.last_flush_time = time.monotonic()
+        self.thread_local = threading.local()  # Each thread has its own transaction depth (and deferred removals)
+        self.open_transactions = 0  # Across every thread, the flush timer waits for these to finish
+        self.flush_timer: threading.Timer | None = None
+
+        # The whole state is only loaded when it's needed, memory only state (no backend) starts empty
+        self.cached_state: StateFileType | None = copy.deepcopy(EMPTY_STATE) if self.backend is None else None
+        self.cached_state_version: Hashable | None = None  # The backend's version when the state was loaded/written
+        STATE_MANAGERS.add(self)
+
+    @property
+    def transaction_depth(self) -> int:
+        return getattr(self.thread_local, "transaction_depth", 0)  # type: ignore[no-any-return]
+
+    @transaction_depth.setter
+    def transaction_depth(self, value: int) -> None:
+        self.thread_local.transaction_depth = value
+
+    @contextmanager
+    def defer_removals(self) -> Generator[list[tuple[ResourceType, str]], None, None]:
+        """Inside of this block (on this thread), resources removed from state are added to the yielded list instead,
+        so the caller can remove them later, e.g. from another thread inside one transaction."""
+        old_deferred_removals = getattr(self.thread_local, "deferred_removals", None)
+        deferred_removals: list[tuple[ResourceType, str]] = []
+        self.thread_local.deferred_removals = deferred_removals
+        try:
+            yield deferred_removals
+        finally:
+            self.thread_local.deferred_removals = old_deferred_removals
 
-        # If they have a state file name input, but the file doesn't exist:
-        if self.state_file_name is not None and not Path(self.state_file_name).exists():
-            self.wipe_state()  # Will automatically create the file
+    @property
+    def dirty(self) -> bool:
+        return self.pending_full_rewrite or bool(self.pending_changes)
 
-        self.state: StateFileType = self.load_state() if self.state_file_name is not None else EMPTY_STATE
+    def drop_cached_state_if_stale(self) -> None:
+        """If something else (e.g. another process) has written to the backend since the state was loaded, reload it next time.
+        Must be called with the lock held."""
+        if self.backend is not None and self.cached_state is not None and not self.pending_full_rewrite:
+            if self.backend.get_version() != self.cached_state_version:
+                self.cached_state = None
 
     def load_state(self) -> StateFileType:
-        if self.state_file_name is None:
-            return self.state
-        with open(self.state_file_name, encoding="utf-8") as state_file:
-            try:
-                return json.load(state_file)  # type: ignore[no-any-return]
-            except json.JSONDecodeError as exc:
-                raise TypeError("State file is not valid JSON, it might have been corrupted?") from exc
+        """Returns the in memory state (not a copy), if you edit it, pass it back into write_state_file()."""
+        with self.lock:
+            self.drop_cached_state_if_stale()
+            if self.cached_state is None:
+                self.cached_state_version = self.backend.get_version()  # type: ignore[union-attr]  # Before loading, never misses a write
+                self.cached_state = self.backend.load()  # type: ignore[union-attr]
+                apply_changes_to_state(self.cached_state, self.pending_changes)
+            return self.cached_state
+
+    def get_resources(self, resource_type: ResourceType | None = None, project: str | None = None, organisation: str | None = None,
+                      run_id: str | None = None) -> dict[ResourceType, dict[str, Any]]:  # fmt: skip
+        """Returns {resource_type: {resource_id: entry}} for every entry in state which matches all of the filters given,
+        using the backend's indexes (where it has them) rather than loading the whole state."""
+        with self.lock:
+            self.drop_cached_state_if_stale()
+            if self.cached_state is None and not self.backend.indexed:  # type: ignore[union-attr]
+                self.load_state()  # No point querying the backend, it'd just load everything each time
+            if self.cached_state is not None:
+                return {
+                    current_type: {
+                        resource_id: entry for resource_id, entry in resources.items()
+                        if entry_matches(entry, project, organisation, run_id)
+                    }
+                    for current_type, resources in self.cached_state["resources"].items()
+                    if resource_type is None or current_type == resource_type
+                }  # fmt: skip
+            results = self.backend.query(resource_type, project, organisation, run_id)  # type: ignore[union-attr]
+            for (current_type, resource_id), entry in self.pending_changes.items():  # Overlay the changes which haven't been written yet
+                if entry is None:
+                    results.get(current_type, {}).pop(resource_id, None)
+                elif (resource_type is None or current_type == resource_type) and entry_matches(entry, project, organisation, run_id):
+                    results.setdefault(current_type, {})[resource_id] = entry
+            return results
+
+    def get_entry(self, resource_type: ResourceType, resource_id: str) -> dict[str, Any] | None:
+        """Returns one entry in state (not a copy), or None, checking the changes which haven't been written yet,
+        then the in memory state, and only then asking the backend for that one entry."""
+        with self.lock:
+            if (resource_type, resource_id) in self.pending_changes:
+                return self.pending_changes[(resource_type, resource_id)]
+            self.drop_cached_state_if_stale()
+            if self.cached_state is None and not self.backend.indexed:  # type: ignore[union-attr]
+                self.load_state()  # The whole state gets loaded anyway, so keep it
+            if self.cached_state is not None:
+                return self.cached_state["resources"].get(resource_type, {}).get(resource_id)
+            return self.backend.get_entry(resource_type, resource_id)  # type: ignore[union-attr]
 
     def write_state_file(self, state_data: StateFileType) -> None:
-        if self.state_file_name is None:
-            self.state = state_data
+        """Replaces the whole state and writes it straight away (or at the end of the current transaction)."""
+        with self.lock:
+            self.cached_state = state_data
+            self.pending_changes.clear()
+            self.pending_full_rewrite = True
+            if self.transaction_depth == 0:
+                self.flush()
+
+    def flush(self) -> None:
+        """Writes any changes to the backend, either just the resources which changed, or everything after write_state_file()."""
+        with self.lock:
+            written_state: WrittenStateType = None
+            if self.backend is not None and self.pending_full_rewrite:
+                written_state = self.backend.replace_all(self.cached_state)  # type: ignore[arg-type]
+            elif self.backend is not None and self.pending_changes:
+                written_state = self.backend.apply_changes(self.pending_changes)
+            if self.backend is not None and self.dirty:
+                # Keep the state as written (which includes other processes' changes), otherwise reload it next time it's needed
+                self.cached_state, self.cached_state_version = written_state if written_state is not None else (None, None)
+            self.pending_changes = {}
+            self.pending_full_rewrite = False
+            self.mutations_since_flush = 0
+            self.last_flush_time = time.monotonic()
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+
+    def record_change(self, resource_type: ResourceType, resource_id: str, entry: dict[str, Any] | None) -> None:
+        """Records a change to one resource (None meaning it was removed), flushing if we've hit the mutation count
+        or time limit (and aren't in a transaction). Must be called with the lock held."""
+        if self.cached_state is not None:
+            apply_changes_to_state(self.cached_state, {(resource_type, resource_id): entry})
+        if not self.pending_full_rewrite:
+            self.pending_changes[(resource_type, resource_id)] = entry
+        self.mutations_since_flush += 1
+        if self.transaction_depth > 0:
             return
-        with open(self.state_file_name, "w", encoding="utf-8") as state_file:
-            json.dump(state_data, state_file, indent=4)
+        if (self.flush_every_n_mutations is not None and self.mutations_since_flush >= self.flush_every_n_mutations) or (
+            self.flush_interval_seconds is not None and time.monotonic() - self.last_flush_time >= self.flush_interval_seconds
+        ):
+            self.flush()
+        elif self.flush_interval_seconds is not None and self.backend is not None and self.flush_timer is None:
+            # Otherwise nothing would be written until the next change (or exit)
+            seconds_until_due = self.flush_interval_seconds - (time.monotonic() - self.last_flush_time)
+            self.flush_timer = threading.Timer(seconds_until_due, self.flush_if_no_open_transactions)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+
+    def flush_if_no_open_transactions(self) -> None:
+        """Called by the flush timer, open transactions flush when they finish."""
+        with self.lock:
+            self.flush_timer = None
+            if self.open_transactions == 0:
+                self.flush()
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """Batches every change to state made inside of it into one write at the end, e.g.\n
+        `with ado_client.state_manager.transaction(): [Repo.create(ado_client, f"repo-{i}") for i in range(100)]`\n
+        The state is still written if an exception is raised, as any resources created before it still exist.
+        Transactions are per thread, changes made by other threads are written as normal (along with any pending changes)."""
+        with self.lock:
+            self.transaction_depth += 1
+            if self.transaction_depth == 1:
+                self.open_transactions += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.transaction_depth -= 1
+                if self.transaction_depth == 0:
+                    self.open_transactions -= 1
+                    self.flush()
 
     # =======================================================================================================
 
     def add_resource_to_state(self, resource: "StateManagedResource") -> None:
         resource_type: ResourceType = resource.__class__.__name__  # type: ignore
         resource_id = extract_id(resource)
-        all_states = self.load_state()
-        if resource_type not in all_states["resources"]:
-            all_states["resources"][resource_type] = {}
-        if resource_id in all_states["resources"][resource_type]:
-            self.remove_resource_from_state(resource_type, resource_id)
         metadata = {
             "created_datetime": datetime.now().isoformat(),
             "run_id": self.run_id,
             "organisation": self.ado_client.ado_org_name,
             "project": self.ado_client.ado_project_name,
         }
-        all_data = {resource_id: {"data": resource.to_json(), "metadata": metadata}}  # , "lifecycle-policy": {}
-        all_states["resources"][resource_type] |= all_data
-        return self.write_state_file(all_states)
+        data = resource.to_json()
+        metadata["content_hash"] = get_content_hash(data)
+        entry = {"data": data, "metadata": metadata}  # , "lifecycle-policy": {}
+        with self.lock:
+            self.record_change(resource_type, resource_id, entry)
 
     def remove_resource_from_state(self, resource_type: ResourceType, resource_id: str) -> None:
-        all_states = self.load_state()
-        if resource_type not in all_states["resources"]:
-            return self.write_state_file(all_states)
-        all_states["resources"][resource_type] = {k: v for k, v in all_states["resources"][resource_type].items() if k != resource_id}
-        return self.write_state_file(all_states)
+        deferred_removals = getattr(self.thread_local, "deferred_removals", None)
+        if deferred_removals is not None:
+            deferred_removals.append((resource_type, resource_id))
+            return
+        with self.lock:
+            if self.get_entry(resource_type, resource_id) is not None:
+                self.record_change(resource_type, resource_id, None)
+
+    def get_existing_entry(self, resource_type: ResourceType, resource_id: str) -> dict[str, Any]:
+        entry = self.get_entry(resource_type, resource_id)
+        if entry is None:
+            raise KeyError(f"{resource_type} {resource_id} is not in state!")
+        return entry
 
     def update_resource_in_state(self, resource_type: ResourceType, resource_id: str, updated_data: dict[str, Any]) -> None:
-        all_states = self.load_state()
-        all_states["resources"][resource_type][resource_id]["data"] = updated_data
-        all_states["resources"][resource_type][resource_id]["metadata"]["updated_datetime"] = datetime.now().isoformat()
-        return self.write_state_file(all_states)
+        with self.lock:
+            entry = copy.deepcopy(self.get_existing_entry(resource_type, resource_id))
+            entry["data"] = updated_data
+            entry["metadata"]["updated_datetime"] = datetime.now().isoformat()
+            entry["metadata"]["content_hash"] = get_content_hash(updated_data)
+            self.record_change(resource_type, resource_id, entry)
 
     def update_lifecycle_policy(self, resource_type: ResourceType, resource_id: str,
                                 policy: Literal["prevent_destroy", "ignore_changes"]) -> None:  # fmt: skip
-        all_states = self.load_state()
-        all_states["resources"][resource_type][resource_id]["lifecycle-policy"] = policy
-        return self.write_state_file(all_states)
+        with self.lock:
+            entry = copy.deepcopy(self.get_existing_entry(resource_type, resource_id))
+            entry["lifecycle-policy"] = policy
+            self.record_change(resource_type, resource_id, entry)
+
     # =======================================================================================================
 
-    def delete_resource(self, resource_type: ResourceType, resource_id: str) -> None:
-        all_resource_classes = get_resource_variables()
-        class_reference = all_resource_classes[resource_type]
+    def attempt_deletion(self, resource_type: ResourceType, resource_id: str) -> tuple[DeletionOutcome, str | None]:
+        """Deletes the resource from ADO (and state), returning the outcome and error message, rather than printing them."""
+        class_reference = get_resource_variables()[resource_type]
         try:
             class_reference.delete_by_id(self.ado_client, resource_id)  # type: ignore[attr-defined]
         except DeletionFailed as exc:
-            if not self.ado_client.suppress_warnings:
-                print(f"[ADO_WRAPPER] Deleting that resource failed!\nError: {exc}")
+            return "failed", str(exc)
         except (NotImplementedError, TypeError):
-            if not self.ado_client.suppress_warnings:
-                print(
-                    f"[ADO_WRAPPER] Cannot delete {resource_type} {resource_id} from state or real space, please delete this manually or using code."  # nosec B608,
-                )
+            return "not_deletable", None
+        self.remove_resource_from_state(resource_type, resource_id)
+        return "deleted", None
+
+    def delete_resource(self, resource_type: ResourceType, resource_id: str) -> None:
+        outcome, error = self.attempt_deletion(resource_type, resource_id)
+        if self.ado_client.suppress_warnings:
+            return
+        if outcome == "failed":
+            print(f"[ADO_WRAPPER] Deleting that resource failed!\nError: {error}")
+        elif outcome == "not_deletable":
+            print(
+                f"[ADO_WRAPPER] Cannot delete {resource_type} {resource_id} from state or real space, please delete this manually or using code."  # nosec B608,
+            )
         else:
-            if not self.ado_client.suppress_warnings:
-                print(f"[ADO_WRAPPER] Deleted {resource_type} {resource_id} from ADO")
-            self.remove_resource_from_state(resource_type, resource_id)
-
-    def delete_all_resources(self, resource_type_filter: ResourceType | None = None) -> None:
-        all_resources = (
-            self.load_state()["resources"]
-            if resource_type_filter is None
-            else {resource_type_filter: self.load_state()["resources"][resource_type_filter]}
+            print(f"[ADO_WRAPPER] Deleted {resource_type} {resource_id} from ADO")
+
+    def delete_all_resources(self, resource_type_filter: ResourceType | None = None, run_id: str | None = None,
+                             max_workers: int = 8) -> DeletionReport:  # fmt: skip
+        """Deletes every resource in state (for this project) from ADO, optionally only of one type, or only those created by one run_id
+        (e.g. `ado_client.state_manager.run_id`). Resources are deleted in tiers, so dependants go before what they depend on
+        (runs/builds, then definitions, then branches/PRs (and everything else), then repos, then projects),
+        with each tier deleted concurrently. Prints (and returns) a report once finished."""
+        all_resources = self.get_resources(resource_type_filter, project=self.ado_client.ado_project_name, run_id=run_id)
+        report = DeletionReport()
+        report.skipped_other_project = sum(len(x) for x in self.get_resources(resource_type_filter, run_id=run_id).values()) - sum(
+            len(x) for x in all_resources.values()
         )
+        tiers: list[list[tuple[ResourceType, str]]] = [[] for _ in DELETION_TIERS]
         for resource_type, resources in all_resources.items():
-            for resource_id, resource_attributes in resources.items():
-                # If it's from a different project, skip it ================
-                if resource_attributes["metadata"]["project"] != self.ado_client.ado_project_name:
-                    if not self.ado_client.suppress_warnings:
-                        print(f"[ADO_WRAPPER] The chosen resource is from a different project, skipping delete {resource_type}, ({resource_id})")  # fmt: skip
+            tiers[get_deletion_tier(resource_type)].extend((resource_type, resource_id) for resource_id in resources)
+
+        def attempt_deletion_without_removing(
+            resource_type: ResourceType, resource_id: str
+        ) -> tuple[DeletionOutcome, str | None, list[tuple[ResourceType, str]]]:  # fmt: skip
+            with self.defer_removals() as deferred_removals:
+                outcome, error = self.attempt_deletion(resource_type, resource_id)
+            return outcome, error, deferred_removals
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for tier in tiers:
+                if not tier:
                     continue
-                # ==========================================================
-                try:
-                    self.delete_resource(resource_type, resource_id)  # pyright: ignore[reportArgumentType]
-                except DeletionFailed as e:
-                    if not self.ado_client.suppress_warnings:
-                        print(f"[ADO_WRAPPER] Error deleting {resource_type} {resource_id}: {e}")
+                # The pool's threads only collect what to remove from state, it's removed here, so it's written once per tier
+                futures = {
+                    executor.submit(attempt_deletion_without_removing, resource_type, resource_id): (resource_type, resource_id)
+                    for resource_type, resource_id in tier
+                }
+                with self.transaction():
+                    for future, resource in futures.items():
+                        try:
+                            outcome, error, deferred_removals = future.result()
+                        except Exception as exc:  # pylint: disable=broad-exception-caught  # One failure shouldn't stop the rest
+                            outcome, error, deferred_removals = "failed", f"{exc.__class__.__name__}: {exc}", []
+                        for removed_resource in deferred_removals:
+                            self.remove_resource_from_state(*removed_resource)
+                        if outcome == "deleted":
+                            report.deleted.append(resource)
+                        elif outcome == "not_deletable":
+                            report.not_deletable.append(resource)
+                        else:
+                            report.failed[resource] = error  # type: ignore[assignment]
+
+        if not self.ado_client.suppress_warnings:
+            print(report)
+        return report
 
     def import_into_state(self, resource_type: ResourceType, resource_id: str) -> None:
         class_reference = get_resource_variables()[resource_type]
@@ -138,30 +414,90 @@ class StateManager:
         self.add_resource_to_state(resource)
 
     def wipe_state(self) -> None:
-        self.write_state_file(EMPTY_STATE)
+        self.write_state_file(copy.deepcopy(EMPTY_STATE))
 
-    def generate_in_memory_state(self) -> StateFileType:
-        """This method goes through every resource in state and updates it to the latest version in real world space"""
+    def generate_in_memory_state(self, max_workers: int = 8, report: RefreshReport | None = None) -> StateFileType:
+        """This method goes through every resource in state and updates it to the latest version in real world space.
+        Resources are fetched per type, using batch endpoints where they exist (see get_by_ids()), otherwise concurrently.
+        Resources which can't be fetched are left as they are, prints a report once finished, pass in a RefreshReport to get it."""
         ALL_RESOURCES = get_resource_variables()
-        all_states = self.load_state()
-        for resource_type in all_states["resources"]:
-            if resource_type == "Run":  # TODO: Make this not required
-                continue
-            for resource_id in all_states["resources"][resource_type]:
-                # rint(f"{resource_type}, {resource_id}")
-                # The child will have this VVV
-                instance = ALL_RESOURCES[resource_type].get_by_id(self.ado_client, resource_id)  # type: ignore[attr-defined]
-                if instance.to_json() != all_states["resources"][resource_type][resource_id]["data"]:
-                    all_states["resources"][resource_type][resource_id]["data"] = instance.to_json()
+        all_states = copy.deepcopy(self.load_state())
+        report = report if report is not None else RefreshReport()
+
+        def fetch_resource_type(resource_type: ResourceType) -> tuple[list[Any], dict[str, Exception]]:
+            """Returns the fetched resources (None for any which failed) in the same order as state, and a mapping of id -> error."""
+            entries = all_states["resources"][resource_type]
+            if resource_type != "Run":
+                return ALL_RESOURCES[resource_type].get_by_ids(self.ado_client, list(entries), max_workers)  # type: ignore[no-any-return]
+            # Runs can only be fetched with their build definition's id
+            instances: list[Any] = []
+            errors: dict[str, Exception] = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {run_id: executor.submit(ALL_RESOURCES["Run"].get_by_id, self.ado_client,  # type: ignore[attr-defined]
+                                                   entry["data"]["build_definition_id"], run_id)
+                           for run_id, entry in entries.items()}  # fmt: skip
+            for run_id, future in futures.items():
+                if future.exception() is not None:
+                    errors[run_id] = future.exception()  # type: ignore[assignment]
+                instances.append(future.result() if future.exception() is None else None)
+            return instances, errors
+
+        def refresh_resource_type(resource_type: ResourceType) -> tuple[list[Any], dict[str, Exception]]:
+            try:
+                return fetch_resource_type(resource_type)
+            except Exception as exc:  # pylint: disable=broad-exception-caught  # E.g. a get_by_id() which needs more than an id
+                return [None] * len(all_states["resources"][resource_type]), dict.fromkeys(all_states["resources"][resource_type], exc)
+
+        resource_types_in_state = [resource_type for resource_type, entries in all_states["resources"].items() if entries]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(refresh_resource_type, resource_types_in_state))
+        for resource_type, (instances, errors) in zip(resource_types_in_state, results):
+            entries = all_states["resources"][resource_type]
+            for resource_id, instance in zip(list(entries), instances):
+                if instance is None:
+                    error = errors.get(resource_id)
+                    error_message = f"{error.__class__.__name__}: {error}" if error is not None else "Not found"
+                    report.failed[(resource_type, resource_id)] = error_message
+                    continue
+                new_data = instance.to_json()
+                new_content_hash = get_content_hash(new_data)
+                old_content_hash = entries[resource_id]["metadata"].get("content_hash") or get_content_hash(entries[resource_id]["data"])
+                if new_content_hash == old_content_hash:
+                    report.unchanged.append((resource_type, resource_id))
+                    continue
+                entries[resource_id]["data"] = new_data
+                entries[resource_id]["metadata"]["content_hash"] = new_content_hash
+                report.changed.append((resource_type, resource_id))
+
+        if not self.ado_client.suppress_warnings:
+            print(report)
         return all_states
 
+    def import_resources_into_state(self, resources: "list[StateManagedResource]") -> None:
+        """Adds already fetched resources into state, in one write."""
+        with self.transaction():
+            for resource in resources:
+                self.add_resource_to_state(resource)
+
     def load_all_resources_with_prefix_into_state(self, prefix: str, print_resource_finds: bool = True) -> None:
-        from ado_wrapper.resources import (  # pylint: disable=possibly-unused-variable  # noqa: F401
+        from ado_wrapper.resources import (
             AgentPool, BuildDefinition, Environment, Project, ReleaseDefinition, Repo, SecureFile, ServiceEndpoint, VariableGroup
         )  # fmt: skip
-        for resource_type in [value for key, value in locals().items() if key not in ("self", "prefix", "print_resource_finds")]:
-            for resource in resource_type.get_all(self.ado_client):
-                if resource.name.startswith(prefix):
-                    if not self.ado_client.suppress_warnings and print_resource_finds:
-                        print(f"Loading in {resource=}")
-                    self.ado_client.state_manager.import_into_state(resource_type.__name__, extract_id(resource))
+        resource_types = [
+            AgentPool, BuildDefinition, Environment, Project, ReleaseDefinition, Repo, SecureFile, ServiceEndpoint, VariableGroup
+        ]  # fmt: skip
+
+        def get_resources_with_prefix(resource_type: "type[StateManagedResource]") -> "list[StateManagedResource]":
+            """The objects from get_all() are imported as they are, rather than fetching each one again."""
+            resources = [resource for resource in resource_type.get_all(self.ado_client)  # type: ignore[attr-defined]
+                         if resource.name.startswith(prefix)]  # fmt: skip
+            if resource_type is BuildDefinition:  # get_all() only returns references, so fetch the full ones in batches
+                resources = [x for x in BuildDefinition.get_by_ids(self.ado_client, [extract_id(x) for x in resources])[0] if x is not None]
+            return resources
+
+        with ThreadPoolExecutor(max_workers=len(resource_types)) as executor:
+            found_resources = [resource for resources in executor.map(get_resources_with_prefix, resource_types) for resource in resources]
+        if not self.ado_client.suppress_warnings and print_resource_finds:
+            for resource in found_resources:
+                print(f"Loading in {resource=}")
+        self.import_resources_into_state(found_resources)
@@ -1,10 +1,14 @@
 import calendar
 import re
-from dataclasses import fields
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Literal, TypeVar, ParamSpec, overload, Any, Type, Generic
+from functools import cache
+from typing import (
+    IO, TYPE_CHECKING, Literal, TypeVar, ParamSpec, overload, Any, Type, Generic, Callable, Iterable, Iterator, Mapping, dataclass_transform
+)  # fmt: skip
 
-from ado_wrapper.errors import ConfigurationError
+from ado_wrapper.errors import ConfigurationError, UnknownError
 
 if TYPE_CHECKING:
     from ado_wrapper.client import AdoClient
@@ -95,36 +99,99 @@ def is_bst(dt: datetime) -> bool:
 # ============================================================================================== #
 
 
+@dataclass_transform(field_specifiers=(field,))
+def slotted_dataclass(cls: type[T]) -> type[T]:
+    """`@dataclass(slots=True)`, used for resources which get fetched in bulk, so each instance doesn't need a `__dict__`.
+    dataclass creates a new class for this, so `super()` in its methods is repointed at the new class (Python 3.14 does this itself)."""
+    slotted_cls = dataclass(slots=True)(cls)
+    for value in slotted_cls.__dict__.values():
+        function = value.__func__ if isinstance(value, (classmethod, staticmethod)) else value
+        code = getattr(function, "__code__", None)
+        if code is not None and "__class__" in code.co_freevars:
+            function.__closure__[code.co_freevars.index("__class__")].cell_contents = slotted_cls
+    return slotted_cls
+
+
+def intern_string(value: T) -> T:
+    """Strings which repeat a lot (ids, names, statuses) are shared, rather than each instance holding its own copy."""
+    return sys.intern(value) if isinstance(value, str) else value  # type: ignore[return-value]
+
+
+def intern_strings(value: T) -> T:
+    """Interns every string in a (nested) payload from the API, keys and values."""
+    if isinstance(value, dict):
+        return {intern_string(key): intern_strings(item) for key, item in value.items()}  # type: ignore[return-value]
+    if isinstance(value, list):
+        return [intern_strings(item) for item in value]  # type: ignore[return-value]
+    return intern_string(value)
+
+
+# ============================================================================================== #
+
+
+@dataclass(frozen=True)
+class ResourceFieldsInfo:
+    """Everything about a resource's fields which is used by the state manager, CLI and docs, see get_resource_fields_info()."""
+
+    field_names: tuple[str, ...]
+    metadata: dict[str, dict[str, Any]]  # Field name -> the field's metadata
+    id_field_name: str | None  # The field marked with "is_id_field"
+    editable_fields: tuple[str, ...]  # Fields marked with "editable"
+    internal_names: dict[str, str]  # Field name -> "internal_name" (the name ADO uses), or the field name if not set
+    editable_internal_names: dict[str, str]  # Same as internal_names, but only editable fields
+    editable_field_names: dict[str, str]  # The reverse of editable_internal_names
+
+
+@cache
+def get_resource_fields_info(cls: type["StateManagedResource"]) -> ResourceFieldsInfo:
+    """Returns the id field, editable fields and internal names of a resource class, which are only worked out once per class.
+    The result is shared, so don't modify it."""
+    metadata = {field_obj.name: dict(field_obj.metadata) for field_obj in fields(cls)}
+    internal_names = {field_name: field_metadata.get("internal_name", field_name) for field_name, field_metadata in metadata.items()}
+    editable_fields = tuple(field_name for field_name, field_metadata in metadata.items() if field_metadata.get("editable", False))
+    editable_internal_names = {field_name: internal_names[field_name] for field_name in editable_fields}
+    id_field_names = [field_name for field_name, field_metadata in metadata.items() if field_metadata.get("is_id_field", False)]
+    return ResourceFieldsInfo(
+        field_names=tuple(metadata),
+        metadata=metadata,
+        id_field_name=id_field_names[0] if id_field_names else None,
+        editable_fields=editable_fields,
+        internal_names=internal_names,
+        editable_internal_names=editable_internal_names,
+        editable_field_names={internal_name: field_name for field_name, internal_name in editable_internal_names.items()},
+    )
+
+
 def get_fields_metadata(cls: type["StateManagedResource"]) -> dict[str, dict[str, str]]:
-    return {field_obj.name: dict(field_obj.metadata) for field_obj in fields(cls)}
+    return {field_name: dict(field_metadata) for field_name, field_metadata in get_resource_fields_info(cls).metadata.items()}
 
 
 def get_id_field_name(cls: type["StateManagedResource"]) -> str:
     """Returns the name of the field that is marked as the id field. If no id field is found, a ValueError is raised."""
-    for field_name, metadata in get_fields_metadata(cls).items():
-        if metadata.get("is_id_field", False):
-            return field_name
-    raise ValueError(f"No id field found for {cls.__name__}!")
+    id_field_name = get_resource_fields_info(cls).id_field_name
+    if id_field_name is None:
+        raise ValueError(f"No id field found for {cls.__name__}!")
+    return id_field_name
 
 
 def extract_id(obj: "StateManagedResource") -> str:
     """Extracts the id from a StateManagedResource object. The id field is defined by the "is_id_field" metadata."""
-    id_field_name = get_id_field_name(obj.__class__)
-    return str(getattr(obj, id_field_name))
+    return str(getattr(obj, get_id_field_name(obj.__class__)))
 
 
 def get_editable_fields(cls: type["StateManagedResource"]) -> list[str]:
     """Returns a list of attribute that are marked as editable."""
-    return [field_obj.name for field_obj in cls.__dataclass_fields__.values() if field_obj.metadata.get("editable", False)]
+    return list(get_resource_fields_info(cls).editable_fields)
 
 
 def get_internal_field_names(
     cls: type["StateManagedResource"], field_names: list[str] | None = None, reverse: bool = False
 ) -> dict[str, str]:  # fmt: skip
     """Returns a mapping of field names to their internal names. If no internal name is set, the field name is used."""
+    fields_info = get_resource_fields_info(cls)
     if field_names is None:
-        field_names = get_editable_fields(cls)
-    value = {field_name: cls.__dataclass_fields__[field_name].metadata.get("internal_name", field_name) for field_name in field_names}
+        return dict(fields_info.editable_field_names if reverse else fields_info.editable_internal_names)
+    value = {field_name: fields_info.internal_names[field_name] for field_name in field_names}
     if reverse:
         return {v: k for k, v in value.items()}
     return value
@@ -138,6 +205,22 @@ def requires_initialisation(ado_client: "AdoClient") -> None:
         )
 
 
+def iter_from_pages(pages: Iterable[list[T]], limit: int | None = None, predicate: Callable[[T], bool] | None = None) -> Iterator[T]:
+    """Yields each item (which matches the predicate) from each page as it arrives, pages are normally generators which make a request
+    per page, so once `limit` items have been yielded, or the caller stops iterating, no more requests are made."""
+    if limit is not None and limit <= 0:
+        return
+    yielded = 0
+    for page in pages:
+        for item in page:
+            if predicate is not None and not predicate(item):
+                continue
+            yield item
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
+
+
 def recursively_find_or_none(data: dict[str, Any], indexes: list[str]) -> Any:
     # TODO: Deprecate this in runs.py
     current = data
@@ -292,9 +375,112 @@ def binary_data_to_file_dictionary(binary_data: bytes, file_types: list[str] | N
     return files
 
 
+def is_wanted_zip_path(path: str, file_types: list[str] | None, glob_patterns: list[str] | None) -> bool:
+    import fnmatch
+
+    if path.endswith("/"):  # Ignore directories
+        return False
+    if file_types is not None and not (f"{path.split('.')[-1]}" in file_types or f".{path.split('.')[-1]}" in file_types):
+        return False
+    return glob_patterns is None or any(fnmatch.fnmatch(path, pattern) for pattern in glob_patterns)
+
+
+def download_to_temporary_file(ado_client: "AdoClient", url: str, chunk_size: int = 1024 * 1024) -> str:
+    """Streams a (potentially huge) download to a temporary file in chunks, and returns the file's path."""
+    import os
+    import tempfile
+
+    with ado_client.session.get(url, stream=True) as request:
+        if request.status_code != 200:
+            raise UnknownError(f"Error downloading {url}: {request.status_code}, {request.text}")
+        file_descriptor, temporary_path = tempfile.mkstemp(prefix="ado_wrapper-", suffix=".zip")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                for chunk in request.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
+        except BaseException:  # Don't leave half a (potentially huge) download behind
+            os.remove(temporary_path)
+            raise
+    return temporary_path
+
+
+class ZipFileMapping(Mapping[str, str]):
+    """A read only dictionary of path -> file content, backed by a zip file on disk.
+    Files are only read and decoded when accessed, and decoded files are kept until they use max_memory_bytes,
+    after which the least recently used ones get dropped. Files bigger than max_memory_bytes should be read with .open().
+    Use as a context manager (or call .close()) to delete the zip file when done."""
+
+    def __init__(self, zip_path: str, file_types: list[str] | None = None, glob_patterns: list[str] | None = None,
+                 max_memory_bytes: int | None = None, delete_on_close: bool = True) -> None:  # fmt: skip
+        import os
+        import threading
+        import zipfile
+        from collections import OrderedDict
+
+        self.zip_path = zip_path
+        self.max_memory_bytes = max_memory_bytes
+        self.delete_on_close = delete_on_close
+        try:
+            self.zip_ref = zipfile.ZipFile(zip_path)  # pylint: disable=consider-using-with
+        except BaseException:  # E.g. BadZipFile, close() will never be called, so delete it now
+            if delete_on_close:
+                os.remove(zip_path)
+            raise
+        self.paths = [x.filename for x in self.zip_ref.infolist() if is_wanted_zip_path(x.filename, file_types, glob_patterns)]
+        self.path_set = set(self.paths)  # For membership checks, the list keeps the zip's order
+        self.decoded_files: OrderedDict[str, str] = OrderedDict()
+        self.decoded_bytes = 0
+        self.lock = threading.Lock()  # ZipFile isn't safe to read from multiple threads
+
+    def __getitem__(self, path: str) -> str:
+        if path not in self.path_set:
+            raise KeyError(path)
+        with self.lock:
+            if path in self.decoded_files:
+                self.decoded_files.move_to_end(path)
+                return self.decoded_files[path]
+            file_size = self.zip_ref.getinfo(path).file_size
+            if self.max_memory_bytes is not None and file_size > self.max_memory_bytes:
+                raise ValueError(f"{path} is {file_size} bytes, which is more than max_memory_bytes, use .open() to stream it instead.")
+            content = self.zip_ref.read(path).decode("utf-8", errors="ignore")
+            self.decoded_files[path] = content
+            self.decoded_bytes += file_size
+            while self.max_memory_bytes is not None and self.decoded_bytes > self.max_memory_bytes:
+                evicted_path, _ = self.decoded_files.popitem(last=False)
+                self.decoded_bytes -= self.zip_ref.getinfo(evicted_path).file_size
+            return content
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def open(self, path: str) -> IO[bytes]:
+        """Returns a binary stream of the (not decoded) file, for files too large to hold in memory."""
+        if path not in self.path_set:
+            raise KeyError(path)
+        return self.zip_ref.open(path)
+
+    def close(self) -> None:
+        import os
+
+        self.zip_ref.close()
+        self.decoded_files.clear()
+        if self.delete_on_close and os.path.exists(self.zip_path):
+            os.remove(self.zip_path)
+
+    def __enter__(self) -> "ZipFileMapping":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
 # ============================================================================================== #
 
 
+@cache
 def get_resource_variables() -> dict[str, type["StateManagedResource"]]:  # We do this whole func to avoid circular imports
     """This returns a mapping of resource name (str) to the class type of the resource. This is used to dynamically create instances of resources."""
     from ado_wrapper.resources import (  # pylint: disable=possibly-unused-variable  # noqa: F401
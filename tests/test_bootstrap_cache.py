@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+
+import pytest
+
+if __name__ == "__main__":
+    __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
+
+from ado_wrapper.bootstrap_cache import BootstrapCache
+from ado_wrapper.client import AdoClient
+
+
+class TestBootstrapCache:
+    def test_get_and_set(self, tmp_path: Path) -> None:
+        cache = BootstrapCache(str(tmp_path / "bootstrap.json"))
+        key = BootstrapCache.get_key("org", "project", "my-pat")
+        assert cache.get(key, "ado_project_id") is None
+        cache.set(key, "ado_project_id", "123")
+        assert cache.get(key, "ado_project_id") == "123"
+        assert cache.get(BootstrapCache.get_key("org", "project", "other-pat"), "ado_project_id") is None
+        assert "my-pat" not in (tmp_path / "bootstrap.json").read_text(encoding="utf-8")
+
+    def test_expiry(self, tmp_path: Path) -> None:
+        cache = BootstrapCache(str(tmp_path / "bootstrap.json"), ttl_seconds=0)
+        cache.set("key", "ado_project_id", "123")
+        assert cache.get("key", "ado_project_id") is None
+        assert not json.loads((tmp_path / "bootstrap.json").read_text(encoding="utf-8"))  # Expired values are dropped when writing
+
+    def test_assume_project_keeps_pat_author(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ado_client = AdoClient("email", "pat", "org", "project", state_file_name=None)
+        fetches: list[str] = []
+        monkeypatch.setattr(ado_client, "_fetch_ado_project_id", lambda: fetches.append("ado_project_id") or ado_client.ado_project_name)
+        monkeypatch.setattr(ado_client, "_fetch_pat_author", lambda: fetches.append("pat_author") or "user")
+        assert (ado_client.ado_project_id, ado_client.pat_author) == ("project", "user")
+        ado_client.assume_project("other-project")
+        assert (ado_client.ado_project_id, ado_client.pat_author) == ("other-project", "user")
+        assert fetches == ["ado_project_id", "pat_author", "ado_project_id"]  # The PAT's user isn't per project, so isn't fetched again
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-s", "-vvvv"])
@@ -3,6 +3,7 @@ import pytest
 if __name__ == "__main__":
     __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
 
+from ado_wrapper.lazy_resources import LazyResource
 from ado_wrapper.resources.build_definitions import BuildDefinition
 from ado_wrapper.resources.builds import Build
 from ado_wrapper.resources.commits import Commit
@@ -56,6 +57,14 @@ class TestBuild:
             build_definition.delete(self.ado_client)
             build.delete(self.ado_client)
 
+    @pytest.mark.get_all
+    def test_get_all_lazy(self) -> None:
+        with self.ado_client.lazy_resources():
+            builds = Build.get_all(self.ado_client, limit=10)
+        assert not self.ado_client.use_lazy_resources
+        assert all(type(build) is LazyResource for build in builds)  # pylint: disable=unidiomatic-typecheck
+        assert [build.build_id for build in builds] == [build.build_id for build in Build.get_all(self.ado_client, limit=10)]
+
     @pytest.mark.get_by_id
     def test_get_by_id(self) -> None:
         with TemporaryResource(self.ado_client, Repo, name=REPO_PREFIX + "get-builds-by-id") as repo:
@@ -66,6 +66,19 @@ class TestBuildDefinition:
             assert fetched_build_definition.build_definition_id == build_definition.build_definition_id
             build_definition.delete(self.ado_client)
 
+    @pytest.mark.get_by_id
+    def test_get_by_ids(self) -> None:
+        with TemporaryResource(self.ado_client, Repo, name=REPO_PREFIX + "get-build-defs-by-ids") as repo:
+            Commit.create(self.ado_client, repo.repo_id, "main", "test-branch", {"build.yaml": MOST_BASIC_BUILD_YAML_FILE}, "add", "Update")
+            build_definition = BuildDefinition.create(
+                self.ado_client, "ado_wrapper-test-build-for-get-by-ids", repo.repo_id, "build.yaml",
+                f"Please contact {email} if you see this build definition!", branch_name="test-branch"  # fmt: skip
+            )
+            build_definitions, errors = BuildDefinition.get_by_ids(self.ado_client, [build_definition.build_definition_id, "999999999"])
+            assert build_definitions[0].build_definition_id == build_definition.build_definition_id  # type: ignore[union-attr]
+            assert build_definitions[1] is None and "999999999" in errors
+            build_definition.delete(self.ado_client)
+
     @pytest.mark.get_by_id
     def test_get_all_by_repo_id(self) -> None:
         with TemporaryResource(self.ado_client, Repo, name=REPO_PREFIX + "get-all-build-defs-by-repo-id") as repo:
@@ -1,12 +1,17 @@
 import pytest
+import requests
 
 if __name__ == "__main__":
     __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
 
+from ado_wrapper.resources.commits import Commit
 from ado_wrapper.resources.projects import Project
+from ado_wrapper.resources.repo import Repo
 from ado_wrapper.errors import NoElevatedPrivilegesError
+from ado_wrapper.logging_session import ResponseCache, RetryPolicy, get_route_template
 
-from tests.setup_client import setup_client, ado_project_name, secondary_project_name
+from ado_wrapper.client import AdoClient
+from tests.setup_client import setup_client, ado_org_name, ado_project_name, email, pat_token, secondary_project_name
 
 
 class TestStateManager:
@@ -30,12 +35,78 @@ class TestStateManager:
         with pytest.raises(NoElevatedPrivilegesError):
             Project.create(self.ado_client, "abc", "abc", "Agile")
 
+    def test_pool_settings(self) -> None:
+        for host in ["dev.azure.com", "vssps.dev.azure.com", "vsrm.dev.azure.com"]:
+            adapter = self.ado_client.session.get_adapter(f"https://{host}/{self.ado_client.ado_org_name}")
+            assert adapter._pool_maxsize == self.ado_client.session.pool_settings.pool_maxsize  # type: ignore[attr-defined]
+
+    def test_retry_policy(self) -> None:
+        retry_policy = RetryPolicy(max_retries=2)
+        assert retry_policy.should_retry("GET", 503, 0)
+        assert retry_policy.should_retry("GET", None, 1)
+        assert retry_policy.should_retry("POST", 429, 0)
+        assert not retry_policy.should_retry("POST", 503, 0)
+        assert not retry_policy.should_retry("GET", 404, 0)
+        assert not retry_policy.should_retry("GET", 503, 2)
+        assert retry_policy.get_backoff_seconds(1, 5.0) == 5.0
+        assert 0 <= retry_policy.get_backoff_seconds(3, None) <= retry_policy.backoff_factor_seconds * 2**3
+
+    def test_response_cache(self) -> None:
+        ado_client = AdoClient(email, pat_token, ado_org_name, ado_project_name, state_file_name=None, cache_responses=True)
+        assert ado_client.response_cache is not None
+        repo = Repo.create(self.ado_client, "ado_wrapper-test-repo-for-response-cache")
+        try:
+            Commit.create(self.ado_client, repo.repo_id, "main", "test-branch", {"read-this.txt": "Delete me!"}, "add", "Test commit")
+            hits_before = ado_client.response_cache.hits
+            # Git items are served with an ETag (their object id), so the second read must be a 304 served from the cache
+            first = repo.get_file(ado_client, "read-this.txt", "test-branch")
+            second = repo.get_file(ado_client, "read-this.txt", "test-branch")
+            assert first == second == "Delete me!"
+            assert ado_client.response_cache.entries
+            assert ado_client.response_cache.hits == hits_before + 1
+        finally:
+            repo.delete(self.ado_client)
+
+    def test_response_cache_offline(self) -> None:
+        response_cache = ResponseCache(max_entries=1)
+        url = "https://dev.azure.com/org/_apis/projects"
+        assert response_cache.get_key(url, {"$top": 1}) != response_cache.get_key(url, {"$top": 2})
+        response = requests.Response()
+        response.status_code, response._content, response.headers["ETag"] = 200, b"[1]", '"abc"'  # pylint: disable=protected-access
+        key = response_cache.get_key(url)
+        response_cache.handle_response(key, None, response)
+        entry = response_cache.get_entry(key)
+        assert response_cache.get_conditional_headers(entry) == {"If-None-Match": '"abc"'}
+        response_cache.clear()  # E.g. evicted by another thread while our conditional request was in flight
+        not_modified = requests.Response()
+        not_modified.status_code = 304
+        cached_response = response_cache.handle_response(key, entry, not_modified)
+        assert cached_response.status_code == 200 and cached_response.json() == [1]
+        assert response_cache.hits == 1
+
+    def test_request_scope(self) -> None:
+        url = f"https://dev.azure.com/{ado_org_name}/_apis/projects?api-version=7.1"
+        with self.ado_client.request_scope():
+            first_response, second_response = self.ado_client.session.get(url), self.ado_client.session.get(url)
+            assert first_response is second_response
+        assert self.ado_client.session.get(url) is not first_response
+
+    def test_get_route_template(self) -> None:
+        assert get_route_template(f"https://dev.azure.com/{ado_org_name}/{ado_project_name}/_apis/build/builds/123/timeline?api-version=7.1") == "/_apis/build/builds/{id}/timeline"  # fmt: skip
+        assert get_route_template(f"https://dev.azure.com/{ado_org_name}/_apis/git/repositories/16db8bc8-4956-4748-b845-d1f41ded2640") == "/_apis/git/repositories/{id}"  # fmt: skip
+
     def test_assume_role(self) -> None:
         assert self.ado_client.ado_project_name == ado_project_name
         self.ado_client.assume_project(secondary_project_name)
         assert self.ado_client.ado_project_name == secondary_project_name
         self.ado_client.assume_project(ado_project_name)
 
+    def test_lazy_bootstrap(self) -> None:
+        ado_client = AdoClient(email, pat_token, ado_org_name, ado_project_name, state_file_name=None)
+        assert not ado_client._bootstrap_values  # pylint: disable=protected-access
+        assert ado_client.ado_project_id == Project.get_by_name(ado_client, ado_project_name).project_id  # type: ignore[union-attr]
+        assert ado_client.pat_author.email == email
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-s", "-vvvv"])
@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+if __name__ == "__main__":
+    __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
+
+from ado_wrapper.client import AdoClient
+from ado_wrapper.collection_cache import CollectionCache
+from ado_wrapper.resources.branches import Branch
+from ado_wrapper.resources.repo import Repo
+from ado_wrapper.resources.users import AdoUser, Member
+
+
+@dataclass
+class Named:
+    name: str
+    number: int
+
+
+class TestCollectionCache:
+    def test_get_collection(self) -> None:
+        cache = CollectionCache(ttl_seconds=60)
+        fetches: list[int] = []
+
+        def fetch() -> list[Named]:
+            fetches.append(1)
+            return [Named("a", 1), Named("b", 2), Named("a", 3)]
+
+        collection = cache.get_collection((Repo, "org", "project"), fetch)
+        assert cache.get_collection((Repo, "org", "project"), fetch) is collection
+        assert cache.get_index(collection, "name")["a"].number == 1  # The first match wins
+        assert cache.get_index(collection, "name") is cache.get_index(collection, "name")
+        assert len(fetches) == 1
+        cache.get_collection((Repo, "org", "other-project"), fetch)
+        assert len(fetches) == 2
+
+    def test_invalidate(self) -> None:
+        cache = CollectionCache(ttl_seconds=60)
+        cache.get_collection((Repo, "org", "project"), list)
+        cache.get_collection((AdoUser, "org", "project"), list)
+        cache.invalidate(Repo)
+        assert list(cache.collections) == [(AdoUser, "org", "project")]
+        cache.invalidate()
+        assert not cache.collections
+
+    def test_peek(self) -> None:
+        cache = CollectionCache(ttl_seconds=60)
+        assert cache.peek((Repo, "org", "project")) is None  # Never fetches
+        collection = cache.get_collection((Repo, "org", "project"), list)
+        assert cache.peek((Repo, "org", "project")) is collection
+
+    def test_expiry(self) -> None:
+        cache = CollectionCache(ttl_seconds=0)
+        assert not cache.enabled
+        first_collection = cache.get_collection((Repo, "org", "project"), list)
+        assert cache.get_collection((Repo, "org", "project"), list) is not first_collection
+
+    def test_server_side_filter_scope(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ado_client = AdoClient(
+            "email", "pat", "org", "project", state_file_name=None, suppress_warnings=True, bypass_initialisation=True,
+            collection_cache_ttl_seconds=60,
+        )  # fmt: skip
+        creator = Member("name", "email", "123")
+        requested_urls: list[str] = []
+
+        def get_by_url(ado_client: AdoClient, url: str, fetch_multiple: bool = False) -> Any:
+            requested_urls.append(url)
+            return [Branch("refs/heads/main", "main", "repo-2", creator)]
+
+        monkeypatch.setattr(Branch, "_get_by_url", staticmethod(get_by_url))
+        other_repos_branches = [Branch("refs/heads/main", "main", "repo-1", creator)]
+        ado_client.collection_cache.get_collection((Branch, "org", "project"), lambda: other_repos_branches)
+        assert Branch.get_by_name(ado_client, "repo-2", "main").repo_id == "repo-2"  # type: ignore[union-attr]
+        assert len(requested_urls) == 1  # Another repo's branches being cached doesn't count
+
+        monkeypatch.setattr(Repo, "_get_by_url", staticmethod(get_by_url))
+        ado_client.collection_cache.get_collection((Repo, "org", "project"), lambda: [Repo("1", "repo-1", "main", False)])
+        assert Repo.get_by_name(ado_client, "repo-1").repo_id == "1"  # type: ignore[union-attr]
+        assert len(requested_urls) == 1  # Project scoped resources still use the cached collection
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-s", "-vvvv"])
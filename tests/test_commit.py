@@ -62,12 +62,20 @@ class TestCommit:
             assert len(all_commits) == 2 + 1  # 1 For the initial README commit
             assert all(isinstance(commit, Commit) for commit in all_commits)
 
+    def test_iter_all_by_repo(self) -> None:
+        with TemporaryResource(self.ado_client, Repo, name=REPO_PREFIX + "iter-all-commits") as repo:
+            Commit.create(self.ado_client, repo.repo_id, "main", "main", {"test.txt": "This is one thing"}, "add", "Test commit 1")
+            commits = list(Commit.iter_all_by_repo(self.ado_client, repo.repo_id, page_size=1))  # One request per commit
+            assert len(commits) == 1 + 1  # 1 For the initial README commit
+            assert [commit.message for commit in Commit.iter_all_by_repo(self.ado_client, repo.repo_id, limit=1)] == ["Test commit 1"]
+            assert next(Commit.iter_all_by_repo(self.ado_client, repo.repo_id, predicate=lambda commit: commit.message != "Test commit 1"))
+
     def test_get_all_with_branch(self) -> None:
         with TemporaryResource(self.ado_client, Repo, name=REPO_PREFIX + "get-all-commits-with-branch") as repo:
             Commit.create(self.ado_client, repo.repo_id, "main", "new-branch", {"test.txt": "This is one thing"}, "add", "Test commit 1")  # fmt: skip
             Commit.create(self.ado_client, repo.repo_id, "new-branch", "new-branch", {"test2.txt": "This is something else"}, "add", "Test commit 2")  # fmt: skip
             Commit.create(self.ado_client, repo.repo_id, "main", "other-branch", {"test3.txt": "Even more something else"}, "add", "Test commit 3")  # fmt: skip
-            all_commits = Commit.get_all_by_repo(self.ado_client, repo.repo_id, "new-branch")
+            all_commits = Commit.get_all_by_repo(self.ado_client, repo.repo_id, branch_name="new-branch")
             assert len(all_commits) == 3 + 1  # 1 For the initial README commit
             assert all(isinstance(commit, Commit) for commit in all_commits)
 
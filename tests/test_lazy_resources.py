@@ -0,0 +1,80 @@
+import copy
+import threading
+from typing import Any
+
+import pytest
+
+if __name__ == "__main__":
+    __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
+
+from ado_wrapper.client import AdoClient
+from ado_wrapper.errors import ConfigurationError
+from ado_wrapper.lazy_resources import LazyResource, materialise
+from ado_wrapper.resources.builds import Build
+from ado_wrapper.resources.commits import Commit
+from ado_wrapper.resources.work_item import WorkItem
+from ado_wrapper.state_managed_abc import StateManagedResource
+
+BUILD_PAYLOAD: dict[str, Any] = {
+    "id": 123, "buildNumber": "2024.1", "status": "completed", "requestedBy": {"displayName": "test", "uniqueName": "test", "id": "123"},
+    "repository": {"id": "123", "name": "test-repo"}, "templateParameters": {"env": "dev"}, "sourceBranch": "refs/heads/main",
+    "startTime": "2021-10-01T00:00:00Z", "finishTime": "2021-10-01T00:10:00Z", "queueTime": "2021-10-01T00:00:00Z",
+    "reason": "manual", "priority": "normal", "queue": {"pool": {"id": 123}},
+}  # fmt: skip
+COMMIT_PAYLOAD: dict[str, Any] = {
+    "commitId": "abc", "author": {"name": "test", "email": "test", "date": "2021-10-01T00:00:00Z"}, "comment": "Test commit",
+    "url": "https://dev.azure.com/org/project/_apis/git/repositories/123/commits/abc",
+}  # fmt: skip
+WORK_ITEM_PAYLOAD: dict[str, Any] = {"id": 123, "fields": {
+    "System.Title": "Test", "System.AreaPath": "project\\board", "System.IterationPath": "project\\sprint 1", "System.State": "New",
+    "System.Reason": "New", "System.CreatedBy": {"displayName": "test", "uniqueName": "test", "id": "123"},
+    "System.CreatedDate": "2021-10-01T00:00:00+00:00", "System.ChangedDate": "2021-10-01T00:10:00+00:00", "System.Tags": "a; b",
+}}  # fmt: skip
+
+
+class TestLazyResources:
+    @pytest.mark.parametrize("resource_class, payload", [(Build, BUILD_PAYLOAD), (Commit, COMMIT_PAYLOAD), (WorkItem, WORK_ITEM_PAYLOAD)])
+    def test_lazy_field_decoders(self, resource_class: type[StateManagedResource], payload: dict[str, Any]) -> None:
+        resource = resource_class.from_request_payload(copy.deepcopy(payload))
+        for field_name in resource_class.lazy_field_decoders:  # Must match what from_request_payload gives
+            assert getattr(LazyResource(resource_class, copy.deepcopy(payload)), field_name) == getattr(resource, field_name)
+        lazy_resource = LazyResource(resource_class, copy.deepcopy(payload))
+        assert isinstance(lazy_resource, resource_class)
+        assert lazy_resource == resource
+        assert lazy_resource.to_json() == resource.to_json()
+        assert type(materialise(lazy_resource)) is resource_class
+
+    def test_materialise_keeps_decoded_fields(self) -> None:
+        lazy_build = LazyResource(Build, copy.deepcopy(BUILD_PAYLOAD))
+        requested_by = lazy_build.requested_by
+        assert lazy_build._resource is None  # pylint: disable=protected-access
+        lazy_build.status = "cancelling"  # Setting attributes decodes the whole resource
+        assert materialise(lazy_build).requested_by is requested_by
+        assert materialise(lazy_build).status == "cancelling"
+
+    def test_partial_resources(self) -> None:
+        partial_build = Build._from_partial_request_payload(BUILD_PAYLOAD, ["build_id", "status"])  # pylint: disable=protected-access
+        assert (partial_build.build_id, partial_build.status) == ("123", "completed")
+        assert partial_build.requested_by is None and partial_build.definition is None
+        Build._validate_fields(["build_id", "start_time"])  # pylint: disable=protected-access
+        with pytest.raises(ConfigurationError):
+            Build._validate_fields(["definition"])  # pylint: disable=protected-access
+
+    def test_unhashable(self) -> None:
+        with pytest.raises(TypeError):  # The same as the resources themselves
+            hash(LazyResource(Build, copy.deepcopy(BUILD_PAYLOAD)))
+
+    def test_lazy_resources_is_per_thread(self) -> None:
+        ado_client = AdoClient("email", "pat", "org", "project", state_file_name=None, bypass_initialisation=True)
+        other_thread_values: list[bool] = []
+        with ado_client.lazy_resources():
+            assert ado_client.use_lazy_resources
+            other_thread = threading.Thread(target=lambda: other_thread_values.append(ado_client.use_lazy_resources))
+            other_thread.start()
+            other_thread.join()
+        assert other_thread_values == [False]
+        assert not ado_client.use_lazy_resources
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-s", "-vvvv"])
@@ -0,0 +1,78 @@
+import atexit
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+if __name__ == "__main__":
+    __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
+
+from ado_wrapper.logging_session import LoggingSession, RequestLogWriter, RetryPolicy
+
+
+class StubAdapter(BaseAdapter):
+    """Replies to every request with the next status code, without sending anything."""
+
+    def __init__(self, status_codes: list[int]) -> None:
+        super().__init__()
+        self.status_codes = status_codes
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        response = requests.Response()
+        response.status_code = self.status_codes.pop(0)
+        response._content = b"{}"  # pylint: disable=protected-access
+        response.url, response.request = request.url, request  # type: ignore[assignment]
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class TestLoggingSession:
+    def test_retried_attempts_are_recorded(self) -> None:
+        session = LoggingSession(None, "", retry_policy=RetryPolicy(backoff_factor_seconds=0))
+        session.mount("https://dev.azure.com/", StubAdapter([503, 503, 200]))
+        assert session.get("https://dev.azure.com/org/_apis/projects/123").status_code == 200
+        snapshot = session.metrics.snapshot()["GET /_apis/projects/{id}"]
+        assert snapshot["count"] == 3
+        assert snapshot["status_classes"] == {"5xx": 2, "2xx": 1}  # The 503s aren't hidden behind the final 200
+        assert snapshot["retries"] == 2
+
+    def test_log_writer(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        exit_hooks: list[Callable[[], None]] = []
+        monkeypatch.setattr(atexit, "register", exit_hooks.append)
+        monkeypatch.setattr(atexit, "unregister", exit_hooks.remove)
+        for old_log_name in ["2024-01-01T00:00:00.000001", "2024-01-02T00:00:00.000001"]:  # Two earlier runs, one has a rotation
+            (tmp_path / f"{old_log_name}.jsonl").touch()
+        (tmp_path / "2024-01-02T00:00:00.000001.0001.jsonl.gz").touch()
+
+        writer = RequestLogWriter(str(tmp_path), "2024-01-03T00:00:00.000001", latest_log_counter=2, max_bytes=10)
+        assert not writer.is_alive() and not exit_hooks  # Nothing is started until something is logged
+        for i in range(3):
+            writer.write({"method": "GET", "number": i})
+            deadline = time.monotonic() + 5
+            while writer.rotation_count <= i and time.monotonic() < deadline:  # Every record is over max_bytes, so gets rotated
+                time.sleep(0.01)
+        writer.write({"method": "GET", "number": 3})
+        assert exit_hooks == [writer.close]
+        writer.close()
+        assert not writer.is_alive() and not exit_hooks
+
+        for i in range(3):
+            with gzip.open(tmp_path / f"2024-01-03T00:00:00.000001.{i + 1:04d}.jsonl.gz", "rt", encoding="utf-8") as rotated_log:
+                assert [json.loads(line) for line in rotated_log] == [{"method": "GET", "number": i}]
+        assert json.loads((tmp_path / "2024-01-03T00:00:00.000001.jsonl").read_text(encoding="utf-8")) == {"method": "GET", "number": 3}
+        assert sorted(path.name for path in tmp_path.iterdir()) == [  # The oldest run is removed, this run's rotations don't count
+            "2024-01-02T00:00:00.000001.0001.jsonl.gz", "2024-01-02T00:00:00.000001.jsonl",
+            "2024-01-03T00:00:00.000001.0001.jsonl.gz", "2024-01-03T00:00:00.000001.0002.jsonl.gz",
+            "2024-01-03T00:00:00.000001.0003.jsonl.gz", "2024-01-03T00:00:00.000001.jsonl",
+        ]  # fmt: skip
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-s", "-vvvv"])
@@ -0,0 +1,39 @@
+import pytest
+
+if __name__ == "__main__":
+    __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
+
+from ado_wrapper.metrics import RequestMetrics, get_percentile
+from ado_wrapper.resources.repo import Repo
+from tests.setup_client import setup_client
+
+
+class TestMetrics:
+    def setup_method(self) -> None:
+        self.ado_client = setup_client()
+
+    def test_get_percentile(self) -> None:
+        values = [float(x) for x in range(1, 101)]
+        assert get_percentile(values, 50) == 50.0
+        assert get_percentile(values, 95) == 95.0
+        assert get_percentile(values, 99) == 99.0
+        assert get_percentile([], 50) == 0.0
+
+    def test_record(self) -> None:
+        metrics = RequestMetrics()
+        metrics.record("get", "/_apis/build/builds/{id}", 200, 1500.0, 100, 0)
+        metrics.record("GET", "/_apis/build/builds/{id}", 503, 20.0, 0, 2)
+        snapshot = metrics.snapshot()["GET /_apis/build/builds/{id}"]
+        assert snapshot["count"] == 2
+        assert snapshot["total_duration_ms"] == 1520.0  # Durations over a second aren't truncated
+        assert snapshot["retries"] == 2
+        assert snapshot["status_classes"] == {"2xx": 1, "5xx": 1}
+        assert 'ado_wrapper_request_duration_milliseconds_bucket{method="GET",route="/_apis/build/builds/{id}",le="+Inf"} 2' in metrics.to_prometheus()
+
+    def test_client_metrics(self) -> None:
+        Repo.get_all(self.ado_client)
+        assert self.ado_client.metrics.snapshot()["GET /_apis/git/repositories"]["count"] >= 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-s", "-vvvv"])
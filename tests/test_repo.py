@@ -58,6 +58,14 @@ class TestRepo:
         assert repo.repo_id == repo_created.repo_id
         repo_created.delete(self.ado_client)
 
+    @pytest.mark.get_by_id
+    def test_get_by_ids(self) -> None:
+        with TemporaryResource(self.ado_client, Repo, name=REPO_PREFIX + "get-repos-by-ids") as repo:
+            repos, errors = Repo.get_by_ids(self.ado_client, [repo.repo_id, "00000000-0000-0000-0000-000000000000", repo.repo_id])
+            assert repos[0] == repos[2] == repo
+            assert repos[1] is None
+            assert list(errors.keys()) == ["00000000-0000-0000-0000-000000000000"]
+
     @pytest.mark.get_all
     def test_get_all(self) -> None:
         repos = Repo.get_all(self.ado_client)
@@ -89,6 +97,18 @@ class TestRepo:
         assert isinstance(contents, dict)
         repo.delete(self.ado_client)
 
+    def test_get_contents_streamed(self) -> None:
+        repo = Repo.create(self.ado_client, "ado_wrapper-test-repo-for-get-repo-contents-streamed")
+        Commit.create(
+            self.ado_client, repo.repo_id, "main", "test-branch", {"test.txt": "Delete me!", "src/main.py": "print(1)"}, "add", "Test commit"
+        )
+        with repo.get_contents_streamed(self.ado_client, branch_name="test-branch", glob_patterns=["src/*"]) as contents:
+            assert list(contents.keys()) == ["src/main.py"]
+            assert contents["src/main.py"] == "print(1)"
+            with contents.open("src/main.py") as file:
+                assert file.read() == b"print(1)"
+        repo.delete(self.ado_client)
+
     def test_get_pull_requests(self) -> None:
         repo = Repo.create(self.ado_client, "ado_wrapper-test-repo-for-get-pull-requests")
         Commit.create(
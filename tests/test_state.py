@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -7,6 +8,8 @@ if __name__ == "__main__":
 
 from ado_wrapper.client import AdoClient
 from ado_wrapper.resources.repo import Repo
+from ado_wrapper.state_backends import SqliteStateBackend
+from ado_wrapper.state_manager import StateManager
 from tests.setup_client import ado_org_name, ado_project_name, email, pat_token
 
 
@@ -31,8 +34,53 @@ class TestState:
         state_manager.update_resource_in_state("Repo", fake_repo.repo_id, fake_repo.to_json() | {"name": "new-name"})
         assert state_manager.load_state()["resources"]["Repo"]["123"]["data"] == fake_repo.to_json() | {"name": "new-name"}
 
+    def test_transaction(self) -> None:
+        state_manager = self.ado_client.state_manager
+        state_manager.wipe_state()
+
+        with state_manager.transaction():
+            for i in range(50):
+                state_manager.add_resource_to_state(Repo(str(i), f"test-repo-{i}", "master", False))
+            assert state_manager.dirty
+            assert len(state_manager.backend.load()["resources"]["Repo"]) == 0  # Not written until the end
+        assert not state_manager.dirty
+        assert len(state_manager.backend.load()["resources"]["Repo"]) == 50
+        state_manager.wipe_state()
+
+    def test_sqlite_backend(self) -> None:
+        ado_client = AdoClient(email, pat_token, ado_org_name, ado_project_name, state_file_name="tests/test_actual_state.db")
+        state_manager = ado_client.state_manager
+        assert isinstance(state_manager.backend, SqliteStateBackend)
+
+        fake_repo = Repo("123", "test-repo", "master", False)
+        state_manager.add_resource_to_state(fake_repo)
+        state_manager.flush()
+        assert state_manager.backend.query("Repo", project=ado_project_name)["Repo"]["123"]["data"] == fake_repo.to_json()
+        assert state_manager.backend.query("Repo", run_id="not-a-run-id") == {"Repo": {}}
+        assert state_manager.backend.get_entry("Repo", "123")["data"] == fake_repo.to_json()  # type: ignore[index]
+        assert state_manager.get_entry("Repo", "123") == state_manager.backend.get_entry("Repo", "123")
+        state_manager.remove_resource_from_state("Repo", fake_repo.repo_id)
+        state_manager.flush()
+        assert state_manager.backend.load()["resources"]["Repo"] == {}
+        state_manager.backend.close()
+
+    def test_concurrent_state_managers(self) -> None:
+        self.ado_client.state_manager.wipe_state()
+
+        def add_resources(worker_id: int) -> None:  # Each worker has it's own StateManager, like separate processes would
+            state_manager = StateManager(self.ado_client, "tests/test_actual_state.state", flush_every_n_mutations=1)
+            for i in range(20):
+                state_manager.add_resource_to_state(Repo(f"{worker_id}-{i}", f"test-repo-{worker_id}-{i}", "master", False))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(add_resources, range(4)))
+        assert len(self.ado_client.state_manager.backend.load()["resources"]["Repo"]) == 80  # No lost writes
+        self.ado_client.state_manager.wipe_state()
+
     def test_zz_cleanup(self) -> None:
         os.remove("tests/test_actual_state.state")
+        os.remove("tests/test_actual_state.state.lock")
+        os.remove("tests/test_actual_state.db")
 
 
 if __name__ == "__main__":
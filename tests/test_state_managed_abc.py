@@ -1,14 +1,20 @@
+import threading
+import time
 from datetime import datetime
+from typing import Any, Iterator
 
 import pytest
 
 if __name__ == "__main__":
     __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
 
-from ado_wrapper.state_managed_abc import convert_from_json, recursively_convert_to_json
+from ado_wrapper.client import AdoClient
+from ado_wrapper.state_managed_abc import convert_from_json, get_serializer, recursively_convert_to_json
+from ado_wrapper.resources.builds import Build
 from ado_wrapper.resources.pull_requests import PullRequest
 from ado_wrapper.resources.users import Member, Reviewer
 from ado_wrapper.resources.repo import Repo
+from ado_wrapper.utils import extract_id, get_resource_fields_info, iter_from_pages
 
 
 class TestStateManagedABCs:
@@ -52,6 +58,85 @@ class TestStateManagedABCs:
             "list": ["1", "2", "3"],
         }
 
+    def test_serializer_is_cached(self) -> None:
+        now = datetime.now()
+        repo = Repo("123", "name", default_branch="main")
+        assert get_serializer(Repo) is get_serializer(Repo)
+        assert repo.to_json() == {"repo_id": "123", "name": "name", "default_branch": "main", "is_disabled": "False"}
+        member_json = Member("name", "email", "123").to_json()
+        assert recursively_convert_to_json("created", now) == ("created::datetime", now.isoformat())
+        assert recursively_convert_to_json("members", [Member("name", "email", "123")]) == ("members::list[Member]", [member_json])
+        assert convert_from_json({"created::datetime": now.isoformat(), "members::list[Member]": [member_json]}) == {
+            "created": now, "members": [Member("name", "email", "123")]
+        }  # fmt: skip
+
+    def test_get_resource_fields_info(self) -> None:
+        fields_info = get_resource_fields_info(Repo)
+        assert fields_info is get_resource_fields_info(Repo)
+        assert fields_info.id_field_name == "repo_id"
+        assert fields_info.editable_fields == ("name", "default_branch", "is_disabled")
+        assert fields_info.editable_internal_names["default_branch"] == "defaultBranch"
+        assert fields_info.editable_field_names["defaultBranch"] == "default_branch"
+        assert extract_id(Repo("123", "name")) == "123"
+
+    def test_slotted_resources(self) -> None:
+        payloads = [{"displayName": "".join(["na", "me"]), "uniqueName": "email", "id": "123"} for _ in range(2)]
+        first_member, second_member = [Member.from_request_payload(payload) for payload in payloads]
+        assert not hasattr(first_member, "__dict__")
+        assert first_member.name is second_member.name  # Interned
+        assert Member.from_json(first_member.to_json()) == first_member
+        # super() inside of a slotted class must still refer to the slotted class
+        assert Build.get_by_id.__func__.__code__.co_freevars == ("__class__",)
+        assert Build.get_by_id.__func__.__closure__[0].cell_contents is Build  # type: ignore[index]
+
+    def test_iter_from_pages(self) -> None:
+        fetched_pages = []
+
+        def pages() -> Iterator[list[int]]:
+            for page_number in range(5):
+                fetched_pages.append(page_number)
+                yield list(range(page_number * 10, page_number * 10 + 10))
+
+        assert list(iter_from_pages(pages(), limit=15)) == list(range(15))
+        assert fetched_pages == [0, 1]  # Stops requesting pages once the limit is reached
+        assert list(iter_from_pages([[1, 2], [3, 4]], limit=3)) == [1, 2, 3]  # The limit applies to the last page too
+        assert next(iter_from_pages(pages(), predicate=lambda x: x > 12)) == 13
+        assert not list(iter_from_pages(pages(), limit=0))
+
+    def test_iter_pages_paginated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        requested_skip_amounts: list[int] = []
+
+        def get_by_url(ado_client: Any, url: str, fetch_multiple: bool = False, fields: Any = None) -> list[int]:
+            skip_amount = int(url.rsplit("$skip=", maxsplit=1)[1])
+            requested_skip_amounts.append(skip_amount)
+            time.sleep(0.01 * (3 - skip_amount // 10 % 4))  # Later pages come back first
+            return list(range(skip_amount, min(skip_amount + 10, 35)))  # 35 resources, so the 4th page is short
+
+        monkeypatch.setattr(PullRequest, "_get_by_url", staticmethod(get_by_url))
+        ado_client = AdoClient("email", "pat", "org", "project", state_file_name=None, bypass_initialisation=True)
+        url = "https://dev.azure.com/org/project/_apis/git/pullrequests?api-version=7.1"
+        threads_before = threading.active_count()
+
+        pages = list(PullRequest._iter_pages_paginated(ado_client, url, page_size=10, prefetch_pages=4))
+        assert pages == [list(range(0, 10)), list(range(10, 20)), list(range(20, 30)), list(range(30, 35))]  # In order
+        assert requested_skip_amounts[0] == 0 and max(requested_skip_amounts) <= 40  # Never more than prefetch_pages ahead
+
+        requested_skip_amounts.clear()
+        assert len(list(PullRequest._iter_pages_paginated(ado_client, url, page_size=10, prefetch_pages=1))) == 4
+        assert requested_skip_amounts == [0, 10, 20, 30]  # Stops on the short page
+
+        requested_skip_amounts.clear()
+        pages = list(PullRequest._iter_pages_paginated(ado_client, url, page_size=10, prefetch_pages=4, limit=25))
+        assert sorted(requested_skip_amounts) == [0, 10, 20]  # No offsets past the limit
+        assert list(iter_from_pages(pages, limit=25)) == list(range(25))
+
+        requested_skip_amounts.clear()
+        monkeypatch.setattr(PullRequest, "_get_by_url", staticmethod(lambda *args, **kwargs: get_by_url(*args, **kwargs)[:5]))
+        assert list(PullRequest._iter_pages_paginated(ado_client, url, page_size=10)) == [list(range(5))]
+        assert requested_skip_amounts == [0]  # A short first page doesn't start any other requests
+        time.sleep(0.1)
+        assert threading.active_count() <= threads_before  # The thread pool gets shut down
+
     @pytest.mark.wip
     def test_convert_to_and_from_json(self) -> None:
         pull_request = PullRequest(
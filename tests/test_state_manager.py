@@ -45,6 +45,14 @@ class TestStateManager:
             state_manager.import_into_state("Repo", repo.repo_id)
             assert state_manager.load_state()["resources"]["Repo"][repo.repo_id]["data"] == repo.to_json()
 
+    def test_delete_all_resources_by_run_id(self) -> None:
+        state_manager = self.ado_client.state_manager
+
+        repo = Repo.create(self.ado_client, REPO_PREFIX + "test-delete-all-resources-by-run-id")
+        report = state_manager.delete_all_resources(resource_type_filter="Repo", run_id=state_manager.run_id)
+        assert ("Repo", repo.repo_id) in report.deleted
+        assert repo.repo_id not in state_manager.get_resources("Repo")["Repo"]
+
 
 if __name__ == "__main__":
     # pytest.main([__file__, "-s", "-vvvv"])
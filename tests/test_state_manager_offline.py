@@ -0,0 +1,105 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+if __name__ == "__main__":
+    __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
+
+from ado_wrapper.client import AdoClient
+from ado_wrapper.errors import DeletionFailed, ResourceNotFound
+from ado_wrapper.resources import (
+    AgentPool, BuildDefinition, Environment, Project, ReleaseDefinition, Repo, SecureFile, ServiceEndpoint, VariableGroup
+)  # fmt: skip
+from ado_wrapper.resources.branches import Branch
+from ado_wrapper.resources.users import Member
+from ado_wrapper.state_manager import RefreshReport
+
+
+def get_offline_client(tmp_path: Path) -> AdoClient:
+    """A client which never sends requests, with a state file which is only written when flushed (or a transaction ends)."""
+    return AdoClient(
+        "email", "pat", "org", "project", state_file_name=str(tmp_path / "main.state"), suppress_warnings=True,
+        bypass_initialisation=True, state_flush_interval_seconds=None,
+    )  # fmt: skip
+
+
+class TestStateManagerOffline:
+    def test_delete_all_resources_writes_once_per_tier(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        state_manager = get_offline_client(tmp_path).state_manager
+        state_manager.import_resources_into_state([Repo(str(i), f"repo-{i}", "main", False) for i in range(10)])
+        state_manager.flush_every_n_mutations = 1  # Any change made outside of a transaction gets written straight away
+
+        def delete_by_id(ado_client: AdoClient, repo_id: str) -> None:
+            if repo_id == "3":
+                raise DeletionFailed("Can't delete this one")
+            ado_client.state_manager.remove_resource_from_state("Repo", repo_id)  # Like _delete_by_id(), on the pool's thread
+
+        monkeypatch.setattr(Repo, "delete_by_id", staticmethod(delete_by_id))
+        written_changes = []
+        apply_changes = state_manager.backend.apply_changes  # type: ignore[union-attr]
+        monkeypatch.setattr(
+            state_manager.backend, "apply_changes", lambda changes: written_changes.append(dict(changes)) or apply_changes(changes)
+        )
+
+        report = state_manager.delete_all_resources(max_workers=4)
+        assert sorted(resource_id for _, resource_id in report.deleted) == [str(i) for i in range(10) if i != 3]
+        assert list(report.failed) == [("Repo", "3")]
+        assert len(written_changes) == 1 and len(written_changes[0]) == 9  # Every removal is written in the tier's transaction
+        assert list(state_manager.backend.load()["resources"]["Repo"]) == ["3"]  # type: ignore[union-attr]
+
+    def test_generate_in_memory_state(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        state_manager = get_offline_client(tmp_path).state_manager
+        state_manager.import_resources_into_state([
+            Repo("1", "unchanged", "main", False), Repo("2", "old-name", "main", False), Repo("3", "deleted", "main", False),
+            Branch("refs/heads/main", "main", "1", Member("name", "email", "123")),
+        ])  # fmt: skip
+
+        def get_by_ids(
+            ado_client: AdoClient, resource_ids: list[str], max_workers: int = 8
+        ) -> tuple[list[Repo | None], dict[str, Exception]]:  # fmt: skip
+            assert resource_ids == ["1", "2", "3"]  # Every id of the type at once
+            return [Repo("1", "unchanged", "main", False), Repo("2", "new-name", "main", False), None], {"3": ResourceNotFound("Gone")}
+
+        monkeypatch.setattr(Repo, "get_by_ids", staticmethod(get_by_ids))
+        report = RefreshReport()
+        new_state = state_manager.generate_in_memory_state(report=report)
+        assert report.unchanged == [("Repo", "1")]
+        assert report.changed == [("Repo", "2")]
+        assert report.failed[("Repo", "3")] == "ResourceNotFound: Gone"
+        assert report.failed[("Branch", "refs/heads/main")].startswith("TypeError")  # Branch.get_by_id() needs the repo's id too
+        assert new_state["resources"]["Repo"]["2"]["data"]["name"] == "new-name"
+        assert new_state["resources"]["Repo"]["3"]["data"]["name"] == "deleted"  # Left as it was
+        assert "Couldn't fetch 1 Branch(s)" in str(report)
+
+    def test_load_all_resources_with_prefix(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        state_manager = get_offline_client(tmp_path).state_manager
+        build_definitions = [BuildDefinition.from_request_payload({"id": build_definition_id, "name": name, "revision": 1})
+                             for build_definition_id, name in [("5", "ado_wrapper-definition"), ("6", "definition")]]  # fmt: skip
+        all_resources: dict[type, list[Any]] = {
+            Repo: [Repo("1", "ado_wrapper-repo", "main", False), Repo("2", "someone-elses-repo", "main", False)],
+            Project: [Project("3", "ado_wrapper-project", "", "private", "wellFormed"),
+                      Project("4", "project", "", "private", "wellFormed")],  # fmt: skip
+            BuildDefinition: build_definitions,
+        }
+        for resource_type in [
+            AgentPool, BuildDefinition, Environment, Project, ReleaseDefinition, Repo, SecureFile, ServiceEndpoint, VariableGroup
+        ]:  # fmt: skip
+            monkeypatch.setattr(resource_type, "get_all", classmethod(lambda cls, ado_client: all_resources.get(cls, [])))
+        fetched_build_definition_ids: list[str] = []
+
+        def get_by_ids(ado_client: AdoClient, resource_ids: list[str]) -> tuple[list[BuildDefinition | None], dict[str, Exception]]:
+            fetched_build_definition_ids.extend(resource_ids)  # get_all() only returns references, so the full ones get fetched
+            return [build_definition for build_definition in build_definitions if build_definition.build_definition_id in resource_ids], {}
+
+        monkeypatch.setattr(BuildDefinition, "get_by_ids", staticmethod(get_by_ids))
+        state_manager.load_all_resources_with_prefix_into_state("ado_wrapper-", print_resource_finds=False)
+        resources = state_manager.load_state()["resources"]
+        assert list(resources["Repo"]) == ["1"]
+        assert list(resources["Project"]) == ["3"]
+        assert fetched_build_definition_ids == ["5"]  # Only those with the prefix
+        assert list(resources["BuildDefinition"]) == ["5"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-s", "-vvvv"])
@@ -3,8 +3,11 @@ import pytest
 if __name__ == "__main__":
     __import__("sys").path.insert(0, __import__("os").path.abspath(__import__("os").path.dirname(__file__) + "/.."))
 
+from ado_wrapper.client import AdoClient
 from ado_wrapper.resources.users import AdoUser
-from tests.setup_client import existing_user_descriptor, email, existing_user_name, setup_client  # fmt: skip
+from tests.setup_client import (
+    ado_org_name, ado_project_name, existing_user_descriptor, email, existing_user_name, pat_token, setup_client,
+)  # fmt: skip
 
 
 class TestAdoUser:
@@ -52,6 +55,12 @@ class TestAdoUser:
         assert user is not None
         assert user.descriptor_id == existing_user_descriptor
 
+    @pytest.mark.get_all
+    def test_lookups_use_collection_cache(self) -> None:
+        ado_client = AdoClient(email, pat_token, ado_org_name, ado_project_name, state_file_name=None, collection_cache_ttl_seconds=60)
+        assert AdoUser.get_by_email(ado_client, email) is AdoUser.get_by_descriptor_id(ado_client, existing_user_descriptor)
+        assert ado_client.collection_cache.misses == 1  # Only the first lookup fetches every user
+
 
 if __name__ == "__main__":
     # pytest.main([__file__, "-s", "-vvvv"])